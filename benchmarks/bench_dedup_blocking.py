@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: blocked vs exhaustive FuzzyDeduplicator.find_duplicates.
+
+Synthetic single-company corpora of growing size are deduplicated with
+the CandidateIndex (blocking) and, up to --exhaustive-max jobs, with the
+previous all-pairs comparison. For each size the table shows wall time,
+pairs scored and, where the exhaustive run exists, recall of the blocked
+run against it - the scaling curve of both approaches.
+
+Usage:
+    python benchmarks/bench_dedup_blocking.py [--sizes 500,1000,2000,5000,10000,20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deduplicator import FuzzyDeduplicator
+from fake_jobs import generate_jobs
+
+
+def duplicate_pairs(duplicates):
+    """(canonical URL, duplicate URL) pairs of a find_duplicates result."""
+    return {(canonical, job['url'])
+            for canonical, group in duplicates.items() for job in group[1:]}
+
+
+def run(jobs, blocking):
+    dedup = FuzzyDeduplicator(blocking=blocking)
+    start = time.perf_counter()
+    duplicates = dedup.find_duplicates(jobs)
+    return time.perf_counter() - start, duplicates, dedup.stats['pairs_scored']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='500,1000,2000,5000,10000,20000')
+    parser.add_argument('--exhaustive-max', type=int, default=2000,
+                        help='Largest size to also run without blocking')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("DEDUP BLOCKING BENCHMARK: one company, 30% re-posted jobs")
+    print("=" * 80)
+    print(f"{'jobs':>7s} {'all pairs':>12s} | {'exhaustive s':>12s} | "
+          f"{'blocked s':>9s} {'scored':>9s} {'recall':>7s} {'speedup':>8s}")
+
+    for size in (int(s) for s in args.sizes.split(',')):
+        jobs = generate_jobs(size)
+        total_pairs = size * (size - 1) // 2
+
+        blocked_time, blocked, scored = run(jobs, blocking=True)
+
+        if size <= args.exhaustive_max:
+            full_time, full, _ = run(jobs, blocking=False)
+            expected = duplicate_pairs(full)
+            recall = (len(expected & duplicate_pairs(blocked)) / len(expected)
+                      if expected else 1.0)
+            full_col = f"{full_time:12.2f}"
+            tail = f"{recall:7.1%} {full_time / blocked_time:7.0f}x"
+        else:
+            full_col = f"{'-':>12s}"
+            tail = f"{'-':>7s} {'-':>8s}"
+
+        print(f"{size:7d} {total_pairs:12d} | {full_col} | "
+              f"{blocked_time:9.2f} {scored:9d} {tail}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs process-pool duplicate clustering across companies.
+
+A synthetic multi-tenant corpus (Zipf-sized companies, so a few large
+tenants dominate) is clustered once with FuzzyDeduplicator.cluster_duplicates
+on one core and then with ParallelDeduplicator at growing worker counts.
+For each run the table shows wall time, speedup over the serial run, the
+number of tasks scheduled and the jobs sent to them (a task gets its
+block and the jobs its block can pair with); every parallel result is
+checked against the serial one. Worker counts above the machine's CPU count are skipped.
+
+Usage:
+    python benchmarks/bench_dedup_parallel.py [--jobs 200000] [--companies 50] [--skew 1.0] [--workers 1,2,4,8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deduplicator import FuzzyDeduplicator
+from parallel_dedup import ParallelDeduplicator
+from fake_jobs import generate_jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=200000)
+    parser.add_argument('--companies', type=int, default=50)
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='Zipf exponent of company sizes (0 = equal sizes)')
+    parser.add_argument('--workers', default='1,2,4,8')
+    parser.add_argument('--block-size', type=int, default=5000,
+                        help='Largest number of rows of one company per task')
+    args = parser.parse_args()
+
+    jobs = generate_jobs(args.jobs, companies=args.companies, skew=args.skew)
+    sizes = {}
+    for job in jobs:
+        sizes[job['company']] = sizes.get(job['company'], 0) + 1
+    cpus = os.cpu_count() or 1
+
+    print("=" * 80)
+    print(f"PARALLEL DEDUP BENCHMARK: {args.jobs} jobs, {len(sizes)} companies "
+          f"(largest {max(sizes.values())}, smallest {min(sizes.values())}), {cpus} CPUs")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    serial = FuzzyDeduplicator().cluster_duplicates(jobs)
+    serial_time = time.perf_counter() - start
+    print(f"{'run':<14s} {'seconds':>9s} {'speedup':>8s} {'tasks':>6s} "
+          f"{'jobs sent':>10s} {'clusters':>9s}")
+    print(f"{'serial':<14s} {serial_time:9.2f} {1.0:7.2f}x {'-':>6s} {'-':>10s} "
+          f"{len(serial):9d}")
+
+    for workers in (int(w) for w in args.workers.split(',')):
+        if workers > cpus:
+            print(f"{f'{workers} workers':<14s} {'skipped (not enough CPUs)':>26s}")
+            continue
+        runner = ParallelDeduplicator(max_workers=workers, block_size=args.block_size)
+        start = time.perf_counter()
+        result = runner.cluster_duplicates(jobs)
+        elapsed = time.perf_counter() - start
+        runner.close()
+
+        assert result == serial, "parallel clusters differ from the serial run"
+        print(f"{f'{workers} workers':<14s} {elapsed:9.2f} {serial_time / elapsed:7.2f}x "
+              f"{runner.stats['tasks']:6d} {runner.stats['jobs_sent']:10d} {len(result):9d}")
+
+
+if __name__ == "__main__":
+    main()
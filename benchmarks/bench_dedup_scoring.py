@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pairwise vs batched similarity scoring.
+
+Scores the same candidate pairs three ways and reports pairs per second:
+score_features() one pair at a time, BatchScorer.score() with exact scores
+for every pair, and BatchScorer.score(prune=True), which computes title
+ratios only for pairs that can still be duplicates. Two pair sets are
+used: the pairs proposed by the blocking index, and a random sample of
+all pairs within the company (what blocking=False scores). Finally
+find_duplicates is timed with and without the batched scorer.
+
+Usage:
+    python benchmarks/bench_dedup_scoring.py [--jobs 5000] [--sample 200000] [--exhaustive-jobs 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deduplicator import FuzzyDeduplicator
+from dedup_scoring import BatchScorer
+from fake_jobs import generate_jobs
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def bench_pairs(name, dedup, features, pairs):
+    left = [i for i, _ in pairs]
+    right = [j for _, j in pairs]
+
+    scalar_time, scalar = timed(lambda: [dedup.score_features(features[i], features[j])[0]
+                                         for i, j in pairs])
+    # A fresh scorer each time, so no ratio is memoized from an earlier run
+    exact_time, exact = timed(lambda: BatchScorer(dedup, features).score(left, right))
+    pruned_time, pruned = timed(lambda: BatchScorer(dedup, features).score(left, right, prune=True))
+
+    assert exact['is_duplicate'].tolist() == scalar
+    assert pruned['is_duplicate'].tolist() == scalar
+
+    print(f"{name:<18s} {len(pairs):>9d} | "
+          f"{len(pairs) / scalar_time:>12,.0f} {len(pairs) / exact_time:>12,.0f} "
+          f"{len(pairs) / pruned_time:>12,.0f} | {scalar_time / pruned_time:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--sample', type=int, default=200000,
+                        help='Random all-pairs sample size')
+    parser.add_argument('--exhaustive-jobs', type=int, default=1000,
+                        help='Jobs deduplicated with blocking=False')
+    args = parser.parse_args()
+
+    jobs = generate_jobs(args.jobs)
+    dedup = FuzzyDeduplicator()
+    features = dedup.features_for(jobs)
+
+    index = dedup._candidate_index(features)
+    blocked = [(i, j) for i in range(len(features)) for j in index.candidates(i)]
+
+    rng = random.Random(0)
+    sampled = []
+    while len(sampled) < args.sample:
+        i, j = rng.randrange(len(features)), rng.randrange(len(features))
+        if i != j:
+            sampled.append((min(i, j), max(i, j)))
+
+    print("=" * 80)
+    print(f"DEDUP SCORING BENCHMARK: {args.jobs} jobs, one company (pairs per second)")
+    print("=" * 80)
+    print(f"{'pairs':<18s} {'count':>9s} | {'pairwise':>12s} {'batch exact':>12s} "
+          f"{'batch pruned':>12s} | {'speedup':>7s}")
+    bench_pairs('blocked candidates', dedup, features, blocked)
+    bench_pairs('all-pairs sample', dedup, features, sampled)
+
+    print()
+    print(f"{'find_duplicates':<18s} {'blocking':>9s} | {'pairwise s':>12s} {'batched s':>12s}")
+    for blocking in (True, False):
+        if not blocking:
+            jobs = jobs[:args.exhaustive_jobs]
+        times = []
+        for vectorized in (False, True):
+            elapsed, _ = timed(lambda: FuzzyDeduplicator(blocking=blocking, vectorized=vectorized)
+                               .find_duplicates(jobs))
+            times.append(elapsed)
+        label = f"{len(jobs)} jobs"
+        print(f"{label:<18s} {str(blocking):>9s} | {times[0]:12.2f} {times[1]:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk subdomain verification with AsyncDiscoveryEngine.
+
+Candidates are resolved by a stub resolver with a fixed lookup latency;
+only a fraction of them exist (the rest answer NXDOMAIN, as most guessed
+and CT-log names do). Live names resolve to a local aiohttp server that
+answers HEAD with a fixed latency, behind one shared address - the same
+shape as *.avature.net, where every site sits behind the same servers.
+
+The sequential baseline is the previous loop (one HEAD per candidate plus
+a 0.2s politeness sleep), estimated from the same latencies rather than
+run, since it would take hours at this size.
+
+Usage:
+    python benchmarks/bench_discovery.py [--candidates 20000] [--live 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from aiohttp import web
+from aiohttp.abc import AbstractResolver
+
+from async_discovery import AsyncDiscoveryEngine
+
+
+class LatencyResolver(AbstractResolver):
+    """Resolve live hosts to loopback after a delay; NXDOMAIN otherwise."""
+
+    def __init__(self, live_hosts, latency):
+        self.live_hosts = live_hosts
+        self.latency = latency
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        await asyncio.sleep(self.latency)
+        if host not in self.live_hosts:
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        return [{'hostname': host, 'host': '127.0.0.1', 'port': port,
+                 'family': socket.AF_INET, 'proto': 0, 'flags': 0}]
+
+    async def close(self):
+        pass
+
+
+async def run(args, names, live):
+    async def handle(request):
+        await asyncio.sleep(args.http_latency)
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    port = runner.addresses[0][1]
+
+    try:
+        resolver = LatencyResolver({f'{name}.avature.test' for name in live},
+                                   args.dns_latency)
+        engine = AsyncDiscoveryEngine(
+            url_template=f'http://{{name}}.avature.test:{port}/careers',
+            concurrency=args.concurrency, per_host_limit=args.per_host,
+            resolver=resolver
+        )
+        start = time.perf_counter()
+        found = await engine.verify(names)
+        return time.perf_counter() - start, found, engine.stats
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=20000)
+    parser.add_argument('--live', type=float, default=0.05, help='Fraction that resolves')
+    parser.add_argument('--dns-latency', type=float, default=0.02, help='Seconds per lookup')
+    parser.add_argument('--http-latency', type=float, default=0.05, help='Seconds per HEAD')
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--per-host', type=int, default=32, help='Per-server budget')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f'company{i}' for i in range(args.candidates)]
+    live = set(rng.sample(names, int(len(names) * args.live)))
+
+    print("=" * 80)
+    print(f"DISCOVERY BENCHMARK: {len(names)} candidates, {len(live)} live, "
+          f"DNS {args.dns_latency}s, HEAD {args.http_latency}s, "
+          f"per-server budget {args.per_host}")
+    print("=" * 80)
+
+    elapsed, found, stats = asyncio.run(run(args, names, live))
+    assert len(found) == len(live)
+
+    # Old loop: every candidate pays a lookup, a HEAD attempt and the sleep
+    sequential = len(names) * (args.dns_latency + 0.2) + len(live) * args.http_latency
+
+    print(f"{'mode':12s} {'seconds':>10s} {'names/s':>10s}")
+    print(f"{'sequential':12s} {sequential:10.0f} {len(names) / sequential:10.1f}  (estimated)")
+    print(f"{'async':12s} {elapsed:10.1f} {len(names) / elapsed:10.1f}")
+    print(f"\nNXDOMAIN dropped: {stats['nxdomain']}, HTTP probes: {stats['probed']}, "
+          f"found: {stats['found']}")
+    print(f"Speedup: {sequential / elapsed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: lxml XPath listing extractor vs the original BeautifulSoup path.
+
+Each implementation runs in a fresh subprocess over the same corpus and
+reports pages/sec and peak memory (RSS high-water mark above the
+post-load baseline, plus the Python-heap peak from tracemalloc).
+
+Usage:
+    python benchmarks/bench_listing_parser.py [--corpus DIR] [--pages 300]
+"""
+
+import argparse
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bs4 import BeautifulSoup
+from listing_parser import parse_listing_page
+from fake_avature import build_corpus
+
+
+def bs4_listing_rows(body, base_url):
+    """The original per-article BeautifulSoup extraction."""
+    soup = BeautifulSoup(body, 'lxml')
+    rows = []
+    for article in soup.find_all('article'):
+        link = article.find('a', href=re.compile(r'JobDetail|FolderDetail', re.I))
+        if not link:
+            continue
+        job_url = link.get('href')
+        if not job_url.startswith('http'):
+            job_url = urljoin(base_url, job_url)
+        job_id_match = re.search(r'/(\d+)$', job_url)
+        location_elem = article.find(attrs={'class': re.compile(r'location', re.I)})
+        date_elem = article.find('time')
+        rows.append((
+            link.get_text(strip=True),
+            job_url,
+            job_id_match.group(1) if job_id_match else None,
+            location_elem.get_text(strip=True) if location_elem else None,
+            (date_elem.get('datetime') or date_elem.get_text(strip=True)) if date_elem else None,
+        ))
+    return rows
+
+
+IMPLEMENTATIONS = {
+    'bs4': bs4_listing_rows,
+    'lxml': parse_listing_page,
+}
+
+
+def load_corpus(args):
+    """Saved pages from --corpus, else synthetic pages."""
+    if args.corpus:
+        return [('https://bench.avature.net/careers', path.read_bytes())
+                for path in sorted(Path(args.corpus).glob('*.html'))]
+    return build_corpus(args.pages)
+
+
+def max_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_one(name, corpus, traced: bool):
+    """Parse the corpus once; return (pages/sec, rows, heap peak bytes)."""
+    parse = IMPLEMENTATIONS[name]
+    if traced:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    rows = 0
+    for base_url, body in corpus:
+        rows += len(parse(body, base_url))
+    elapsed = time.perf_counter() - start
+
+    heap_peak = 0
+    if traced:
+        heap_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return len(corpus) / elapsed, rows, heap_peak
+
+
+def child(args):
+    """Measure one implementation in this (fresh) process."""
+    corpus = load_corpus(args)
+    baseline = max_rss_kb()
+
+    rate, rows, _ = run_one(args.child, corpus, traced=False)
+    rss_peak = max_rss_kb() - baseline
+    _, _, heap_peak = run_one(args.child, corpus, traced=True)
+
+    print(f"{rate:.1f} {rows} {rss_peak} {heap_peak}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='Directory of saved search pages')
+    parser.add_argument('--pages', type=int, default=300, help='Synthetic pages')
+    parser.add_argument('--child', choices=IMPLEMENTATIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    corpus = load_corpus(args)
+    for base_url, body in corpus[:20]:
+        assert parse_listing_page(body, base_url) == bs4_listing_rows(body, base_url)
+
+    print("=" * 80)
+    print(f"LISTING PARSER BENCHMARK: {len(corpus)} pages")
+    print("=" * 80)
+    print(f"{'impl':6s} {'pages/sec':>10s} {'rows':>8s} {'RSS peak':>12s} {'heap peak':>12s}")
+
+    results = {}
+    for name in IMPLEMENTATIONS:
+        command = [sys.executable, __file__, '--child', name, '--pages', str(args.pages)]
+        if args.corpus:
+            command += ['--corpus', args.corpus]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        rate, rows, rss_kb, heap = output.split()
+        results[name] = float(rate)
+        print(f"{name:6s} {float(rate):10.1f} {rows:>8s} {int(rss_kb):9d} KiB "
+              f"{int(heap) // 1024:9d} KiB")
+
+    print(f"\nSpeedup: {results['lxml'] / results['bs4']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
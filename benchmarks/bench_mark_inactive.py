@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: mark_inactive_jobs at 10k / 100k / 500k active jobs per company.
+
+Compares the legacy `url NOT IN (?, ?, ...)` statement with the temp-table
+anti-join now used by JobDatabase.mark_inactive_jobs. The legacy query
+fails outright once the URL list exceeds SQLite's host-parameter limit.
+
+Usage:
+    python benchmarks/bench_mark_inactive.py [--sizes 10000 100000 500000]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import JobDatabase
+
+
+def legacy_mark_inactive(db: JobDatabase, active_urls, company: str) -> int:
+    """Original NOT IN implementation, kept here for comparison."""
+    cursor = db.conn.cursor()
+    placeholders = ','.join('?' * len(active_urls))
+    cursor.execute(f"""
+        UPDATE jobs
+        SET is_active = 0
+        WHERE company = ? AND url NOT IN ({placeholders}) AND is_active = 1
+    """, [company] + active_urls)
+    affected = cursor.rowcount
+    db.conn.commit()
+    return affected
+
+
+def populate(db: JobDatabase, size: int):
+    """Insert `size` active jobs for one company, return their URLs."""
+    jobs = [
+        {
+            'url': f'https://bench.avature.net/careers/JobDetail/Job-{i}/{i}',
+            'company': 'bench',
+            'title': f'Job {i}',
+            'location': 'Remote',
+            'job_id': str(i),
+        }
+        for i in range(size)
+    ]
+    db.upsert_jobs(jobs)
+    return [job['url'] for job in jobs]
+
+
+def bench(size: int, runner) -> str:
+    """Time one deactivation pass where 1% of jobs disappeared."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = JobDatabase(os.path.join(tmp, 'bench.db'))
+        urls = populate(db, size)
+        active_urls = urls[: size - size // 100]
+
+        start = time.perf_counter()
+        try:
+            deactivated = runner(db, active_urls, 'bench')
+        except sqlite3.OperationalError as e:
+            db.close()
+            return f"failed ({e})"
+        elapsed = time.perf_counter() - start
+        db.close()
+
+    return f"{elapsed * 1000:9.1f} ms ({deactivated} deactivated)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10000, 100000, 500000],
+                        help='Active jobs per company')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("MARK INACTIVE BENCHMARK")
+    print("=" * 80)
+
+    for size in args.sizes:
+        print(f"\n{size:,} active jobs")
+        print(f"  NOT IN list:          {bench(size, legacy_mark_inactive)}")
+        print(f"  temp-table anti-join: {bench(size, JobDatabase.mark_inactive_jobs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-entry re.sub loops vs compiled alternations in TextNormalizer.
+
+Normalizes the titles and locations of a scraped jobs file (default
+data/output/jobs_all.json) with the previous implementation, which called
+re.sub once per table entry, and with the current one, which scans each
+table's single alternation once. Reports normalizations per second for
+normalize_title, normalize_location and extract_key_terms, after checking
+that both produce identical output. The last columns run one pass with
+the LRU result cache on, starting empty, and show its hit rate: the
+repeats within one file.
+
+Usage:
+    python benchmarks/bench_normalizer.py [--input data/output/jobs_all.json] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from normalizer import TextNormalizer, FILLER_WORDS
+
+
+class LoopNormalizer(TextNormalizer):
+    """The previous implementation: one re.sub per table entry."""
+
+    def normalize_title(self, title):
+        if not title:
+            return ""
+        normalized = title.strip().title()
+        for abbrev, full in self.TITLE_ABBREVIATIONS.items():
+            normalized = re.sub(abbrev, full, normalized, flags=re.IGNORECASE)
+        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = re.sub(r'[^\w\s\-/()&]', '', normalized)
+        normalized = normalized.replace('/', ' / ')
+        return re.sub(r'\s+', ' ', normalized).strip()
+
+    def normalize_location(self, location):
+        if not location:
+            return ""
+        normalized = location.strip()
+        if re.search(r'\b(remote|work from home|wfh)\b', normalized, re.IGNORECASE):
+            return "Remote"
+        for abbrev, full in self.LOCATION_SYNONYMS.items():
+            pattern = r'\b' + re.escape(abbrev) + r'\b'
+            normalized = re.sub(pattern, full, normalized, flags=re.IGNORECASE)
+        for abbrev, full in self.STATE_ABBREVIATIONS.items():
+            normalized = re.sub(r',\s*' + abbrev + r'\b', f', {full}', normalized)
+        return re.sub(r'\s+', ' ', normalized).strip()
+
+    def extract_key_terms(self, title):
+        normalized = self.normalize_title(title)
+        for level in self.SENIORITY_LEVELS.keys():
+            normalized = re.sub(r'\b' + re.escape(level) + r'\b', '', normalized,
+                                flags=re.IGNORECASE)
+        return {word for word in normalized.lower().split()
+                if len(word) >= 3 and word not in FILLER_WORDS}
+
+
+def rate(make_function, values, repeat):
+    """Best calls per second over repeat passes, each with a fresh function."""
+    best = float('inf')
+    for _ in range(repeat):
+        function = make_function()
+        start = time.perf_counter()
+        for value in values:
+            function(value)
+        best = min(best, time.perf_counter() - start)
+    return len(values) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', default=os.path.join(os.path.dirname(__file__), '..',
+                                                        'data', 'output', 'jobs_all.json'))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.input, encoding='utf-8') as f:
+        jobs = json.load(f)
+    titles = [job.get('title') or '' for job in jobs]
+    locations = [job.get('location') or '' for job in jobs]
+
+    loop, compiled = LoopNormalizer(cache_size=0), TextNormalizer(cache_size=0)
+    cases = [('normalize_title', titles), ('normalize_location', locations),
+             ('extract_key_terms', titles)]
+
+    print("=" * 80)
+    print(f"NORMALIZER BENCHMARK: {len(jobs)} jobs from {os.path.basename(args.input)} "
+          f"(normalizations per second)")
+    print("=" * 80)
+    print(f"{'method':<20s} {'re.sub loop':>12s} {'compiled':>12s} {'speedup':>8s} | "
+          f"{'cached':>12s} {'hit rate':>8s}")
+    for name, values in cases:
+        before, after = getattr(loop, name), getattr(compiled, name)
+        assert [before(v) for v in values] == [after(v) for v in values], name
+        loop_rate = rate(lambda: before, values, args.repeat)
+        compiled_rate = rate(lambda: after, values, args.repeat)
+
+        cached = TextNormalizer()
+        cached_rate = rate(lambda: getattr(TextNormalizer(), name), values, args.repeat)
+        assert [getattr(cached, name)(v) for v in values] == [after(v) for v in values], name
+        kind = {'normalize_title': 'title', 'normalize_location': 'location'}.get(name, 'key_terms')
+        hit_rate = cached.cache_info()[kind]['hit_rate']
+
+        print(f"{name:<20s} {loop_rate:12,.0f} {compiled_rate:12,.0f} "
+              f"{compiled_rate / loop_rate:7.1f}x | {cached_rate:12,.0f} {hit_rate:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
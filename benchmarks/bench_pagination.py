@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sliding-window pagination vs lock-step page batches.
+
+A local fake Avature server answers search pages with skewed latency
+(most pages are fast, every Nth page is slow). The lock-step baseline
+waits for each whole batch before starting the next one, so every slow
+page stalls its batch; the sliding window starts the next page as soon
+as any request finishes. Both probe for the end of the listing (the
+server hides its result count); the counted run shows the count, so
+the scraper knows the exact page list after page 1.
+
+All runs use the same fixed window so only the scheduling differs.
+
+Usage:
+    python benchmarks/bench_pagination.py [--pages 40] [--window 4]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_scraper import AsyncAvatureScraper
+from fake_avature import FakeAvatureServer
+
+
+async def lockstep_pages(scraper, search_url, base_url, max_pages, window):
+    """The previous approach: gather fixed batches, stop on an all-empty batch."""
+    first = await scraper.scrape_single_page(search_url, base_url, 1)
+    if not first:
+        return []
+    all_jobs = list(first)
+
+    page = 2
+    while page <= max_pages:
+        batch = list(range(page, min(page + window, max_pages + 1)))
+        results = await asyncio.gather(
+            *(scraper.scrape_single_page(search_url, base_url, p) for p in batch),
+            return_exceptions=True
+        )
+        empty = 0
+        for result in results:
+            if isinstance(result, Exception) or not result:
+                empty += 1
+            else:
+                all_jobs.extend(result)
+        if empty == len(batch):
+            break
+        page += len(batch)
+    return all_jobs
+
+
+async def run_one(mode, args):
+    """Crawl the fake tenant once; return (seconds, jobs, requests)."""
+    slow, fast = args.slow, args.fast
+    server = FakeAvatureServer(
+        total_jobs=args.pages * 20,
+        latency=lambda page: slow if page % args.slow_every == 0 else fast,
+        legend=(mode == 'counted')
+    )
+    await server.start()
+    try:
+        async with AsyncAvatureScraper(
+            use_url_detector=False, max_concurrent_pages=args.window,
+            max_host_concurrency=args.window
+        ) as scraper:
+            search_url = f'{server.base_url}/SearchJobs'
+            start = time.perf_counter()
+            if mode == 'lockstep':
+                jobs = await lockstep_pages(scraper, search_url, server.base_url,
+                                            args.max_pages, args.window)
+            else:
+                jobs = await scraper.scrape_search_pages_concurrent(
+                    search_url, server.base_url, args.max_pages
+                )
+            elapsed = time.perf_counter() - start
+    finally:
+        await server.stop()
+    return elapsed, len(jobs), len(server.requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=40, help='Pages with jobs')
+    parser.add_argument('--max-pages', type=int, default=100)
+    parser.add_argument('--window', type=int, default=4, help='In-flight pages')
+    parser.add_argument('--fast', type=float, default=0.02, help='Fast page latency (s)')
+    parser.add_argument('--slow', type=float, default=0.5, help='Slow page latency (s)')
+    parser.add_argument('--slow-every', type=int, default=5, help='Every Nth page is slow')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"PAGINATION BENCHMARK: {args.pages} pages, window {args.window}, "
+          f"latency {args.fast}s / {args.slow}s every {args.slow_every} pages")
+    print("=" * 80)
+    print(f"{'mode':10s} {'seconds':>8s} {'jobs':>6s} {'requests':>9s}")
+
+    # Job lines from the scraper are noise here
+    results = {}
+    for mode in ('lockstep', 'sliding', 'counted'):
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            results[mode] = asyncio.run(run_one(mode, args))
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        elapsed, jobs, requests = results[mode]
+        print(f"{mode:10s} {elapsed:8.2f} {jobs:6d} {requests:9d}")
+
+    assert results['lockstep'][1] == results['sliding'][1] == results['counted'][1]
+    for mode in ('sliding', 'counted'):
+        print(f"Speedup ({mode}): {results['lockstep'][0] / results[mode][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
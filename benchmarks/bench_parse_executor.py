@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing-page parse throughput per ParseExecutor mode.
+
+Parses a corpus of search pages concurrently (as the async scraper does)
+and reports pages/sec for inline parsing and for thread/process pools of
+increasing size.
+
+Usage:
+    python benchmarks/bench_parse_executor.py [--corpus DIR] [--pages 400]
+
+With --corpus, every *.html file in DIR is parsed (base URL taken from the
+file name's first dot-separated part). Otherwise synthetic pages are used.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parse_executor import ParseExecutor
+from fake_avature import build_corpus
+
+
+def load_corpus(directory: str):
+    """Load saved search pages from a directory."""
+    corpus = []
+    for path in sorted(Path(directory).glob('*.html')):
+        site = path.name.split('.')[0]
+        corpus.append((f'https://{site}.avature.net/careers', path.read_bytes()))
+    return corpus
+
+
+async def run(executor: ParseExecutor, corpus) -> float:
+    """Parse the whole corpus concurrently, return pages/sec."""
+    # Warm the pool so worker start-up is not measured
+    await executor.parse(corpus[0][1], corpus[0][0])
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        executor.parse(body, base_url) for base_url, body in corpus
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert all(results), "every page should yield jobs"
+    return len(corpus) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='Directory of saved search pages')
+    parser.add_argument('--pages', type=int, default=400, help='Synthetic pages')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else build_corpus(args.pages)
+    cores = os.cpu_count() or 1
+
+    print("=" * 80)
+    print(f"PARSE EXECUTOR BENCHMARK: {len(corpus)} pages, {cores} cores")
+    print("=" * 80)
+
+    configs = [('inline', None), ('thread', cores)]
+    workers = 1
+    while workers <= cores:
+        configs.append(('process', workers))
+        workers *= 2
+    if configs[-1] != ('process', cores):
+        configs.append(('process', cores))
+
+    baseline = None
+    for mode, max_workers in configs:
+        executor = ParseExecutor(mode=mode, max_workers=max_workers)
+        rate = asyncio.run(run(executor, corpus))
+        executor.close()
+
+        baseline = baseline or rate
+        label = f"{mode}" + (f" x{max_workers}" if max_workers else "")
+        print(f"{label:14s} {rate:8.1f} pages/sec  ({rate / baseline:.2f}x inline)")
+
+
+if __name__ == "__main__":
+    main()
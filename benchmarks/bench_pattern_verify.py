@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pattern detection with the streaming verifier vs the parsing one.
+
+Saved (or synthetic) search pages are served by a local HTTP server in a
+separate process, one site per page. Each site's pattern is detected
+repeatedly with AvatureURLDetector.detect_pattern_with_response(), the
+path the scrapers use, in two variants:
+
+  parsing    the previous verifier: download the body, parse it, evaluate
+             the indicators; the parsed tree is handed back as page 1
+  streaming  the current verifier: stream the body and scan the raw bytes
+             for a job <article> / JobDetail link; a hit skips the parse,
+             so the scraper parses page 1 itself
+
+Detection reads the winning page to the end either way (it is reused as
+page 1), so the bytes read are the same. The report shows bytes, CPU and
+wall time for detection alone and for detection plus the page-1 parse the
+scraper does next, which is the end-to-end cost per site.
+
+Usage:
+    python benchmarks/bench_pattern_verify.py [--corpus DIR] [--pages 20] [--rounds 5]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import requests
+
+from listing_parser import parse_document
+from url_detector import AvatureURLDetector, ProbeResponse, score_listing_page
+from fake_avature import render_search_page
+
+
+class ParsingDetector(AvatureURLDetector):
+    """Detector with the previous verifier: every page is parsed."""
+
+    def _probe(self, url):
+        response = requests.get(url, headers=self.headers, timeout=10)
+        if response.status_code != 200:
+            return 0.0, None
+
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset' in content_type else None
+        root = parse_document(response.text)
+        confidence = score_listing_page(root, response.text)
+        if confidence == 0:
+            return 0.0, None
+        return confidence, ProbeResponse(url, response.content, encoding,
+                                         response.headers, root)
+
+
+def page_one(probe):
+    """What the scraper does with the detector's page: get its tree."""
+    if probe.root is not None:
+        return probe.root
+    return parse_document(probe.body, probe.encoding)
+
+
+def write_sites(args, directory):
+    """Copy --corpus pages or render synthetic ones, one site each; return site names."""
+    pages = []
+    if args.corpus:
+        pages = [path.read_bytes() for path in sorted(Path(args.corpus).glob('*.html'))]
+    else:
+        for i in range(args.pages):
+            body = render_search_page(f'bench{i % 5}', i % 5 + 1, args.jobs_per_page,
+                                      args.jobs_per_page * 10, seed=i)
+            pages.append(body.encode('utf-8'))
+
+    names = []
+    for i, body in enumerate(pages):
+        name = f'site{i}'
+        (Path(directory) / name).mkdir()
+        (Path(directory) / name / 'SearchJobs').write_bytes(body)
+        names.append(name)
+    return names
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='Directory of saved search pages')
+    parser.add_argument('--pages', type=int, default=20, help='Synthetic pages')
+    parser.add_argument('--jobs-per-page', type=int, default=50)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        names = write_sites(args, directory)
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'http.server', str(port), '--bind', '127.0.0.1'],
+            cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            base = f'http://127.0.0.1:{port}'
+            for _ in range(50):
+                try:
+                    requests.get(base, timeout=1)
+                    break
+                except requests.ConnectionError:
+                    time.sleep(0.1)
+
+            sites = [f'{base}/{name}' for name in names]
+            total_bytes = sum((Path(directory) / name / 'SearchJobs').stat().st_size
+                              for name in names)
+            cache_file = os.path.join(directory, 'cache.json')
+            detectors = {
+                'parsing': ParsingDetector(cache_file=cache_file),
+                'streaming': AvatureURLDetector(cache_file=cache_file),
+            }
+
+            print("=" * 80)
+            print(f"PATTERN DETECTION BENCHMARK: {len(sites)} sites "
+                  f"({total_bytes // len(sites) // 1024} KiB avg page), {args.rounds} rounds")
+            print("=" * 80)
+            print(f"{'verifier':10s} {'KiB read':>10s} {'detect CPU ms':>14s} "
+                  f"{'+page 1 CPU ms':>15s} {'+page 1 wall ms':>16s}")
+
+            results = {}
+            for name, detector in detectors.items():
+                read = 0
+                detect_cpu = total_cpu = 0.0
+                wall = time.perf_counter()
+                for _ in range(args.rounds):
+                    for site in sites:
+                        cpu = time.process_time()
+                        pattern, probe = detector.detect_pattern_with_response(
+                            site, force_refresh=True
+                        )
+                        detected = time.process_time()
+                        assert pattern == '/SearchJobs' and probe is not None
+                        page_one(probe)
+                        detect_cpu += detected - cpu
+                        total_cpu += time.process_time() - cpu
+                        read += len(probe.body)
+                wall = time.perf_counter() - wall
+                checked = len(sites) * args.rounds
+                results[name] = (detect_cpu, total_cpu, wall)
+                print(f"{name:10s} {read // 1024:10d} {detect_cpu / checked * 1000:14.2f} "
+                      f"{total_cpu / checked * 1000:15.2f} {wall / checked * 1000:16.2f}")
+
+            parsing, streaming = results['parsing'], results['streaming']
+            print(f"\nDetection CPU: {parsing[0] / streaming[0]:.1f}x less; "
+                  f"with page 1: {parsing[1] / streaming[1]:.2f}x CPU, "
+                  f"{parsing[2] / streaming[2]:.2f}x wall")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-job upsert_job vs batched upsert_jobs.
+
+Measures jobs/second for a first scrape (all new) and a re-scrape
+(all unchanged) of a synthetic site.
+
+Usage:
+    python benchmarks/bench_upsert.py [--jobs 5000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import JobDatabase
+
+
+def make_jobs(count: int):
+    """Generate synthetic jobs for a single company."""
+    return [
+        {
+            'url': f'https://bench.avature.net/careers/JobDetail/Job-{i}/{i}',
+            'company': 'bench',
+            'title': f'Software Engineer {i % 50}',
+            'location': 'New York, NY',
+            'job_id': str(i),
+            'metadata': {'date_posted': '2026-01-01'},
+        }
+        for i in range(count)
+    ]
+
+
+def run_single(db: JobDatabase, jobs) -> float:
+    """Upsert jobs one at a time, return elapsed seconds."""
+    start = time.perf_counter()
+    for job in jobs:
+        db.upsert_job(job)
+    return time.perf_counter() - start
+
+
+def run_bulk(db: JobDatabase, jobs) -> float:
+    """Upsert jobs in one batch, return elapsed seconds."""
+    start = time.perf_counter()
+    db.upsert_jobs(jobs)
+    return time.perf_counter() - start
+
+
+def bench(label: str, runner, jobs):
+    """Run a first scrape and a re-scrape against a fresh database."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = JobDatabase(os.path.join(tmp, 'bench.db'))
+        first = runner(db, jobs)
+        second = runner(db, jobs)
+        db.close()
+
+    print(f"{label:12s} first scrape: {len(jobs) / first:10.0f} jobs/sec   "
+          f"re-scrape: {len(jobs) / second:10.0f} jobs/sec")
+    return first + second
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=5000, help='Jobs per run')
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+
+    print("=" * 80)
+    print(f"UPSERT BENCHMARK: {args.jobs} jobs")
+    print("=" * 80)
+
+    single = bench('upsert_job', run_single, jobs)
+    bulk = bench('upsert_jobs', run_bulk, jobs)
+
+    print("-" * 80)
+    print(f"Speedup: {single / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
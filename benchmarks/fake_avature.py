@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Synthetic Avature listing pages for benchmarks.
+
+Markup follows the structure of real Avature search results: one
+<article> per job with a JobDetail link, a location span and a posting
+date, inside a full page of navigation and filter chrome.
+"""
+
+import random
+
+TITLES = [
+    'Senior Software Engineer', 'Data Scientist', 'Production Operator',
+    'Registered Nurse', 'Product Manager', 'Financial Analyst',
+    'Sr. DevOps Engineer', 'Customer Service Associate', 'Store Manager',
+    'Machine Learning Engineer', 'QA Analyst', 'Warehouse Associate',
+]
+
+LOCATIONS = [
+    'New York, NY', 'London', 'San Francisco, CA', 'Remote',
+    'Invercargill', 'Los Angeles, CA', 'Singapore', 'Chicago, IL',
+]
+
+
+def render_article(site: str, job_number: int, rng: random.Random) -> str:
+    """Render a single job <article>."""
+    title = rng.choice(TITLES)
+    slug = title.replace(' ', '-').replace('.', '')
+    return f"""
+        <article class="article article--result">
+          <div class="article__header">
+            <div class="article__header__text">
+              <h3 class="article__header__text__title article__header__text__title--4">
+                <a class="link" href="https://{site}.avature.net/careers/JobDetail/{slug}/{job_number}">
+                  {title}
+                </a>
+              </h3>
+              <div class="article__header__text__subtitle">
+                <span class="list-item-location">{rng.choice(LOCATIONS)}</span>
+                <span class="list-item-department">Department {job_number % 17}</span>
+                <time datetime="2026-01-{job_number % 28 + 1:02d}">Posted recently</time>
+              </div>
+            </div>
+          </div>
+          <div class="article__content">
+            <p>Join our team. {'Lorem ipsum dolor sit amet. ' * 6}</p>
+          </div>
+        </article>"""
+
+
+def render_search_page(site: str = 'bench', page: int = 1,
+                       jobs_per_page: int = 20, total_jobs: int = 200,
+                       seed: int = 0, legend: bool = True) -> str:
+    """Render a search results page.
+
+    Args:
+        site: Tenant subdomain
+        page: 1-based page number
+        jobs_per_page: Articles per full page
+        total_jobs: Total jobs the tenant lists
+        seed: Seed for title/location choice
+        legend: Render the "1-20 of N results" count above the listing
+
+    Returns:
+        HTML string (no articles once past the last page)
+    """
+    rng = random.Random(seed * 100003 + page)
+    first = (page - 1) * jobs_per_page
+    last = min(first + jobs_per_page, total_jobs)
+    articles = ''.join(
+        render_article(site, job_number, rng) for job_number in range(first, last)
+    )
+    count = (f"{first + 1}-{last} of {total_jobs} results"
+             if last > first else f"0 of {total_jobs} results")
+    nav = ''.join(
+        f'<li><a class="menu__link" href="/careers/Section{i}">Section {i}</a></li>'
+        for i in range(30)
+    )
+    filters = ''.join(
+        f'<label class="filter__option"><input type="checkbox" name="f{i}"> Option {i}</label>'
+        for i in range(40)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>Search Jobs | {site}</title>
+  <script>window.avature = {{"portal": "{site}", "page": {page}}};</script>
+</head>
+<body>
+  <header class="header"><nav><ul class="menu">{nav}</ul></nav></header>
+  <main class="main">
+    <form class="search-form"><div class="filter">{filters}</div></form>
+    {f'<div class="list-controls__text__legend">{count}</div>' if legend else ''}
+    <section class="section section--results">{articles}
+    </section>
+    <div class="pagination">
+      <a class="paginationNextLink" href="/careers/SearchJobs?page={page + 1}">Next</a>
+    </div>
+  </main>
+  <footer class="footer">{'<p>Footer text</p>' * 20}</footer>
+</body>
+</html>"""
+
+
+def build_corpus(pages: int = 200, jobs_per_page: int = 20):
+    """Build a list of (site, page_bytes) pairs for parse benchmarks."""
+    return [
+        (f'https://bench{i % 5}.avature.net/careers',
+         render_search_page(f'bench{i % 5}', i % 10 + 1, jobs_per_page,
+                            jobs_per_page * 10, seed=i).encode('utf-8'))
+        for i in range(pages)
+    ]
+
+
+class FakeAvatureServer:
+    """Local aiohttp server answering /careers/SearchJobs?page=N.
+
+    Pages come from render_search_page; past the last page the server
+    returns a results page with no articles, like a real tenant.
+    """
+
+    def __init__(self, total_jobs: int = 400, jobs_per_page: int = 20,
+                 latency=None, site: str = 'bench', legend: bool = True):
+        """
+        Args:
+            total_jobs: Jobs the tenant lists
+            jobs_per_page: Articles per page
+            latency: Callable page -> seconds to wait before answering
+            site: Tenant subdomain used in job links
+            legend: Show the result count on pages
+        """
+        self.total_jobs = total_jobs
+        self.jobs_per_page = jobs_per_page
+        self.latency = latency or (lambda page: 0.0)
+        self.site = site
+        self.legend = legend
+        self.requests = []
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request):
+        import asyncio
+        from aiohttp import web
+
+        page = int(request.query.get('page', 1))
+        self.requests.append(page)
+        await asyncio.sleep(self.latency(page))
+        body = render_search_page(self.site, page, self.jobs_per_page,
+                                  self.total_jobs, legend=self.legend)
+        return web.Response(text=body, content_type='text/html')
+
+    async def start(self):
+        """Listen on a free local port."""
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get('/careers/SearchJobs', self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, '127.0.0.1', 0).start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f'http://127.0.0.1:{port}/careers'
+
+    async def stop(self):
+        await self.runner.cleanup()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Synthetic job postings for deduplication benchmarks.
+
+Each posting is built from a role, a team and a city. A share of them are
+re-posted with the kind of noise seen across Avature tenants: abbreviated
+seniority ("Sr." / "Senior"), different separators, a dropped letter,
+level suffixes and alternative spellings of the location - so that the
+exhaustive comparison finds a realistic mix of duplicates and near misses.
+"""
+
+import random
+from typing import Dict, List
+
+SENIORITY = ['', 'Senior ', 'Sr. ', 'Junior ', 'Lead ', 'Principal ', 'Staff ']
+
+ROLES = [
+    'Software Engineer', 'Data Scientist', 'Product Manager', 'Data Engineer',
+    'Registered Nurse', 'Financial Analyst', 'DevOps Engineer', 'QA Analyst',
+    'Store Manager', 'Machine Learning Engineer', 'Warehouse Associate',
+    'Customer Service Representative', 'Account Executive', 'UX Designer',
+    'Business Analyst', 'Security Engineer', 'Site Reliability Engineer',
+    'Pharmacist', 'Physical Therapist', 'Recruiter', 'Payroll Specialist',
+    'Electrician', 'Mechanical Engineer', 'Project Manager', 'Dispatcher',
+    'Technical Writer', 'Solutions Architect', 'Marketing Manager',
+    'Operations Manager', 'Research Scientist', 'Medical Assistant',
+    'Sales Associate', 'Frontend Developer', 'Backend Developer',
+    'Database Administrator', 'Network Engineer', 'Legal Counsel',
+]
+
+TEAMS = [
+    'Payments', 'Search', 'Ads', 'Infrastructure', 'Cardiology', 'Oncology',
+    'Emergency Department', 'Fresh Food', 'Distribution', 'Risk', 'Growth',
+    'Identity', 'Mobile', 'Logistics', 'Pediatrics', 'Treasury', 'Audit',
+    'Supply Chain', 'Analytics', 'Platform', 'Billing', 'Compliance',
+    'Night Shift', 'Weekend', 'Central Region', 'North Region', 'Dairy',
+]
+
+CITIES = [
+    ('New York, NY', ['NYC', 'New York', 'New York, New York']),
+    ('San Francisco, CA', ['SF', 'San Francisco', 'San Francisco, California']),
+    ('Los Angeles, CA', ['Los Angeles', 'Los Angeles, California']),
+    ('Seattle, WA', ['Seattle, Washington', 'Seattle']),
+    ('Chicago, IL', ['Chicago', 'Chicago, Illinois']),
+    ('London', ['London, UK', 'London']),
+    ('Invercargill', ['Invercargill', 'Southland']),
+    ('Remote', ['Remote', 'Work from Home', 'Remote - US']),
+    ('Austin, TX', ['Austin', 'Austin, Texas']),
+    ('Boston, MA', ['Boston', 'Boston, Massachusetts']),
+    ('Dublin', ['Dublin', 'Dublin, Ireland']),
+    ('Singapore', ['Singapore']),
+]
+
+
+def _noisy_title(title: str, rng: random.Random) -> str:
+    """Re-post a title with one kind of noise."""
+    kind = rng.random()
+    if kind < 0.3:
+        return title.replace('Senior ', 'Sr. ') if 'Senior ' in title else title.replace('Sr. ', 'Senior ')
+    if kind < 0.5:
+        return title.replace(' - ', ', ') if ' - ' in title else title + ' '
+    if kind < 0.7 and len(title) > 8:
+        i = rng.randrange(1, len(title) - 1)
+        return title[:i] + title[i + 1:]
+    if kind < 0.85:
+        return title + rng.choice([' I', ' II', ' (Contract)'])
+    return title.lower()
+
+
+def generate_jobs(count: int, companies: int = 1, duplicate_rate: float = 0.3,
+                  seed: int = 0, skew: float = 0.0) -> List[Dict]:
+    """Generate postings spread over companies.
+
+    Args:
+        count: Number of jobs
+        companies: Number of companies
+        duplicate_rate: Share of jobs that re-post an earlier one
+        seed: Random seed
+        skew: Zipf exponent of company sizes; 0 splits jobs evenly, 1 gives
+            company c a share proportional to 1 / (c + 1)
+
+    Returns:
+        List of job dictionaries (url, title, location, company, first_seen)
+    """
+    rng = random.Random(seed)
+    jobs = []
+    originals = {c: [] for c in range(companies)}
+    weights = [1 / (c + 1) ** skew for c in range(companies)]
+    assigned = random.Random(seed + 1)
+
+    for n in range(count):
+        company = assigned.choices(range(companies), weights)[0] if skew else n % companies
+        earlier = originals[company]
+
+        if earlier and rng.random() < duplicate_rate:
+            title, city = rng.choice(earlier)
+            title = _noisy_title(title, rng)
+            location = rng.choice(CITIES[city][1])
+        else:
+            title = f"{rng.choice(SENIORITY)}{rng.choice(ROLES)} - {rng.choice(TEAMS)}"
+            if rng.random() < 0.3:
+                title += f" {rng.randint(1, 999)}"
+            city = rng.randrange(len(CITIES))
+            location = CITIES[city][0]
+            earlier.append((title, city))
+
+        jobs.append({
+            'url': f'https://company{company}.avature.net/careers/JobDetail/{n}',
+            'title': title,
+            'location': location,
+            'company': f'company{company}',
+            'first_seen': f'2026-01-{1 + n % 28:02d}T00:00:{n % 60:02d}',
+        })
+
+    return jobs
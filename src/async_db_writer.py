@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Async persistence stage for the async scrapers.
+Scrapers push parsed jobs onto a bounded queue; a single writer drains it
+in batched transactions on a worker thread, off the event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+try:
+    from .database import JobDatabase
+except ImportError:
+    from database import JobDatabase
+
+
+class AsyncJobWriter:
+    """Single-writer queue that persists jobs without blocking the event loop."""
+
+    def __init__(self, db: JobDatabase, max_queue_size: int = 100,
+                 max_batch_items: int = 50):
+        """Initialize writer.
+
+        Args:
+            db: Database whose writer connection receives all job writes
+            max_queue_size: Maximum queued pages before producers wait
+            max_batch_items: Maximum queued items drained into one write batch
+        """
+        self.db = db
+        self.max_queue_size = max_queue_size
+        self.max_batch_items = max_batch_items
+
+        # Created in start() so they bind to the running loop
+        self.queue = None
+        self._task = None
+        self._executor = None
+
+        # Per-site counts accumulated until the site is finished
+        self._site_counts = {}
+        self._site_errors = {}
+
+    async def start(self):
+        """Start the writer task."""
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix='job-writer')
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Flush everything queued so far and stop the writer task."""
+        if self._task is None:
+            return
+
+        await self.queue.put(None)
+        await self._task
+        self._executor.shutdown(wait=True)
+        self._task = None
+
+    async def put_jobs(self, site: str, jobs: List[Dict]):
+        """Queue a page of jobs for a site.
+
+        Waits while the queue is full, so slow writes throttle the fetchers.
+
+        Args:
+            site: Site key (base URL) the jobs belong to
+            jobs: Parsed job dictionaries
+        """
+        if jobs:
+            await self.queue.put(('jobs', site, jobs, None))
+
+    async def touch_jobs(self, site: str, jobs: List[Dict]):
+        """Queue a page of jobs whose listing page is unchanged.
+
+        Only last_seen is refreshed; jobs the database does not know as
+        active are upserted instead.
+
+        Args:
+            site: Site key (base URL) the jobs belong to
+            jobs: Job dictionaries replayed for the page
+        """
+        if jobs:
+            await self.queue.put(('touch', site, jobs, None))
+
+    async def finish_site(self, site: str, company: Optional[str] = None,
+                          active_urls: Optional[List[str]] = None) -> Dict:
+        """Mark a site as complete and wait until its jobs are committed.
+
+        Args:
+            site: Site key used with put_jobs
+            company: Company to deactivate unseen jobs for (skipped if None)
+            active_urls: URLs seen for the company in this run
+
+        Returns:
+            Dictionary with new, updated, unchanged and deactivated counts
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(('finish', site, (company, active_urls or []), future))
+        return await future
+
+    async def _run(self):
+        """Drain the queue in batches until the stop sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch_items:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+
+            if not batch:
+                continue
+
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._write_batch, batch
+                )
+            except Exception as e:
+                results = [(item[3], e) for item in batch if item[0] == 'finish']
+
+            for future, result in results:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _write_batch(self, batch: List[tuple]) -> List[tuple]:
+        """Persist a drained batch (runs on the writer thread).
+
+        Args:
+            batch: Queue items in arrival order
+
+        Returns:
+            List of (future, result_or_exception) for finished sites
+        """
+        pending = {}
+        results = []
+
+        def add_counts(site, counts):
+            totals = self._site_counts.setdefault(
+                site, {'new': 0, 'updated': 0, 'unchanged': 0}
+            )
+            for key, value in counts.items():
+                totals[key] += value
+
+        def flush(site):
+            jobs = pending.pop(site, None)
+            if not jobs:
+                return
+            try:
+                counts = self.db.upsert_jobs(jobs)
+            except Exception as e:
+                self._site_errors[site] = e
+                return
+            add_counts(site, counts)
+
+        def touch(site, jobs):
+            try:
+                touched = self.db.touch_jobs([job['url'] for job in jobs])
+                # Jobs missing or inactive (e.g. database was reset while
+                # the page cache was kept) are upserted; touched ones are
+                # already counted as seen
+                rest = [job for job in jobs if job['url'] not in touched]
+                counts = self.db.upsert_jobs(rest)
+                counts['unchanged'] += len(jobs) - len(rest)
+                add_counts(site, counts)
+            except Exception as e:
+                self._site_errors[site] = e
+
+        for kind, site, payload, future in batch:
+            if kind == 'jobs':
+                pending.setdefault(site, []).extend(payload)
+                continue
+
+            if kind == 'touch':
+                flush(site)
+                touch(site, payload)
+                continue
+
+            # Finish: commit this site's pending jobs first
+            flush(site)
+            counts = self._site_counts.pop(
+                site, {'new': 0, 'updated': 0, 'unchanged': 0}
+            )
+            error = self._site_errors.pop(site, None)
+            if error is not None:
+                results.append((future, error))
+                continue
+
+            company, active_urls = payload
+            try:
+                counts['deactivated'] = (
+                    self.db.mark_inactive_jobs(active_urls, company)
+                    if company else 0
+                )
+            except Exception as e:
+                results.append((future, e))
+                continue
+
+            results.append((future, counts))
+
+        # Commit whatever is left for sites that are still scraping
+        for site in list(pending):
+            flush(site)
+
+        return results
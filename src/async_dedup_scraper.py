@@ -10,6 +10,7 @@ from typing import List, Dict
 
 from async_incremental_scraper import AsyncIncrementalScraper
 from deduplicator import FuzzyDeduplicator
+from dedup_index import ClusterIndex
 
 
 class AsyncDedupScraper(AsyncIncrementalScraper):
@@ -53,10 +54,14 @@ class AsyncDedupScraper(AsyncIncrementalScraper):
             self.deduplicator = FuzzyDeduplicator(
                 title_threshold=dedup_title_threshold,
                 location_threshold=dedup_location_threshold,
-                combined_threshold=dedup_combined_threshold
+                combined_threshold=dedup_combined_threshold,
+                db=self.db
             )
+            # Duplicate clusters persist in the jobs database between runs
+            self.cluster_index = ClusterIndex(self.db, self.deduplicator)
         else:
             self.deduplicator = None
+            self.cluster_index = None
 
     async def scrape_all_sites_with_dedup(self, sites: List[str]) -> Dict:
         """Scrape all sites with deduplication.
@@ -88,11 +93,14 @@ class AsyncDedupScraper(AsyncIncrementalScraper):
         print("DEDUPLICATION ANALYSIS")
         print("="*80)
 
-        # Find duplicates
-        duplicates = self.deduplicator.find_duplicates(all_jobs)
+        # Place only new and changed jobs in the persisted clusters
+        index_stats = self.cluster_index.update(all_jobs)
+        duplicates = self.cluster_index.duplicates(all_jobs)
+        print(f"\nIndexed {index_stats['new']} new and {index_stats['changed']} changed jobs "
+              f"({index_stats['removed']} removed, {index_stats['pairs_scored']} pairs scored)")
 
         # Get deduplication stats
-        dedup_stats = self.deduplicator.get_deduplication_stats(all_jobs)
+        dedup_stats = self.deduplicator.get_deduplication_stats(all_jobs, duplicates)
 
         print(f"\nTotal jobs: {dedup_stats['total_jobs']}")
         print(f"Unique jobs: {dedup_stats['unique_jobs']}")
@@ -100,26 +108,11 @@ class AsyncDedupScraper(AsyncIncrementalScraper):
         print(f"Total duplicates: {dedup_stats['total_duplicates']}")
         print(f"Duplicate rate: {dedup_stats['duplicate_rate']:.1%}")
 
-        # Mark duplicates as inactive in database
+        # Point each duplicate at its canonical; canonicals stay unmarked
+        marked = self.db.mark_duplicates(self.cluster_index.duplicate_map())
         if duplicates:
-            print(f"\nMarking {dedup_stats['total_duplicates']} duplicates as inactive...")
-
-            duplicate_urls = []
-            for dup_group in duplicates.values():
-                # Skip canonical (first), mark others as duplicates
-                for dup_job in dup_group[1:]:
-                    duplicate_urls.append(dup_job['url'])
-
-            # Mark as inactive
-            if duplicate_urls:
-                # We can't use mark_inactive_jobs since we want to keep canonicals active
-                # Instead, manually mark each duplicate
-                for url in duplicate_urls:
-                    # This is a bit of a hack - we'd need to add a method to the DB
-                    # For now, just track in stats
-                    pass
-
-            print(f"✓ Identified {len(duplicate_urls)} duplicate jobs")
+            print(f"\n✓ Identified {dedup_stats['total_duplicates']} duplicate jobs "
+                  f"({marked} markings changed)")
 
         # Add deduplication stats to overall stats
         stats['deduplication'] = {
@@ -129,7 +122,8 @@ class AsyncDedupScraper(AsyncIncrementalScraper):
             'duplicate_groups': dedup_stats['duplicate_groups'],
             'total_duplicates': dedup_stats['total_duplicates'],
             'duplicate_rate': dedup_stats['duplicate_rate'],
-            'company_stats': dedup_stats['company_stats']
+            'company_stats': dedup_stats['company_stats'],
+            'index': index_stats
         }
 
         return stats
@@ -214,7 +208,9 @@ class AsyncDedupScraper(AsyncIncrementalScraper):
             print("No jobs to analyze")
             return
 
-        report = self.deduplicator.generate_duplicate_report(all_jobs)
+        self.cluster_index.update(all_jobs)
+        report = self.deduplicator.generate_duplicate_report(
+            all_jobs, self.cluster_index.duplicates(all_jobs))
 
         with open(output_file, 'w') as f:
             f.write(report)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Async bulk verification of candidate Avature subdomains.
+
+Candidates flow through two bounded stages:
+
+  1. DNS pre-resolution: names that do not resolve (NXDOMAIN) are dropped
+     before any HTTP connection is attempted - most guessed or CT-log
+     subdomains fail here, cheaply.
+  2. HTTP probing: a fixed pool of workers sends HEAD requests, with a
+     per-server politeness budget (one HostLimiter per resolved address),
+     so thousands of *.avature.net names behind the same load balancer
+     never hit it with more than a few requests at once.
+
+The resolver is pluggable (any aiohttp AbstractResolver), which lets tests
+run the whole pipeline against a stub resolver and a local HTTP server.
+"""
+
+import asyncio
+import socket
+import time
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Union
+from urllib.parse import urlparse
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+
+try:
+    from .host_limiter import HostLimiterPool, THROTTLE_STATUSES, parse_retry_after
+except ImportError:
+    from host_limiter import HostLimiterPool, THROTTLE_STATUSES, parse_retry_after
+
+
+DEFAULT_URL_TEMPLATE = 'https://{name}.avature.net/careers'
+
+# getaddrinfo errors meaning "this name does not exist"
+NXDOMAIN_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+# Servers that refuse HEAD get a GET instead
+HEAD_NOT_ALLOWED = (405, 501)
+
+
+def normalize_name(name: str) -> str:
+    """Canonical form of a candidate subdomain ("Acme." -> "acme")."""
+    return name.strip().lower().rstrip('.')
+
+
+async def iterate(names: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    """Iterate a plain or async iterable of names asynchronously."""
+    if hasattr(names, '__aiter__'):
+        async for name in names:
+            yield name
+    else:
+        for name in names:
+            yield name
+
+
+class ProbeResult(NamedTuple):
+    """Outcome of verifying one candidate."""
+    name: str
+    url: str
+    address: Optional[str]   # Resolved IP, None if DNS failed
+    status: Optional[int]    # Final HTTP status, None if never answered
+    error: Optional[str]     # 'NXDOMAIN', DNS/HTTP error text, or None
+
+    @property
+    def found(self) -> bool:
+        return self.status == 200
+
+
+class _PreResolvedResolver(AbstractResolver):
+    """Serve the connector from the DNS stage's answers.
+
+    Hosts seen by the pre-resolution stage are not looked up a second time
+    when the connection is opened; anything else (redirect targets) goes to
+    the wrapped resolver.
+    """
+
+    def __init__(self, resolver: AbstractResolver):
+        self.resolver = resolver
+        self.answers: Dict[str, List] = {}
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        answers = self.answers.get(host)
+        if answers:
+            return [dict(answer, port=port) for answer in answers]
+        return await self.resolver.resolve(host, port, family=family)
+
+    async def close(self):
+        await self.resolver.close()
+
+
+class AsyncDiscoveryEngine:
+    """Verify large batches of candidate subdomains concurrently"""
+
+    def __init__(self, url_template: str = DEFAULT_URL_TEMPLATE,
+                 concurrency: int = 100, dns_concurrency: int = 200,
+                 per_host_limit: int = 8, timeout: float = 10.0, retries: int = 2,
+                 resolver: Optional[AbstractResolver] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        """Initialize engine.
+
+        Args:
+            url_template: Candidate URL, with {name} replaced by the subdomain
+            concurrency: HTTP probes in flight across all servers
+            dns_concurrency: Lookups in flight
+            per_host_limit: Probes in flight per resolved server address;
+                shrinks on 429/503 and honours Retry-After
+            timeout: Seconds per lookup and per HTTP probe
+            retries: Extra attempts for throttled or timed-out probes
+            resolver: aiohttp resolver (default: threaded getaddrinfo)
+            headers: Request headers
+        """
+        self.url_template = url_template
+        self.concurrency = concurrency
+        self.dns_concurrency = dns_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.resolver = resolver
+        self.headers = headers or {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        }
+        self.limiters = HostLimiterPool(initial_limit=per_host_limit,
+                                        max_limit=per_host_limit)
+        self.stats = {'candidates': 0, 'nxdomain': 0, 'dns_errors': 0,
+                      'probed': 0, 'found': 0, 'http_errors': 0, 'throttled': 0}
+
+    async def verify(self, names: Union[Iterable[str], AsyncIterable[str]]) -> List[str]:
+        """Verify candidates and return the URLs that answered 200."""
+        return [result.url async for result in self.results(names) if result.found]
+
+    async def results(self, names: Union[Iterable[str], AsyncIterable[str]]
+                      ) -> AsyncIterator[ProbeResult]:
+        """Verify candidates, yielding one ProbeResult per unique name.
+
+        Results arrive in completion order. Names may come from a plain or
+        an async iterable; the input is consumed lazily, so at most a few
+        hundred candidates are held in memory at a time.
+
+        Args:
+            names: Subdomain labels (e.g. "acme"); duplicates are skipped
+        """
+        resolver = _PreResolvedResolver(self.resolver or aiohttp.ThreadedResolver())
+        connector = aiohttp.TCPConnector(limit=self.concurrency, resolver=resolver,
+                                         ttl_dns_cache=300)
+        session = aiohttp.ClientSession(
+            connector=connector, headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+        # Bounded queues give backpressure from the prober to the input
+        todo = asyncio.Queue(self.dns_concurrency * 2)
+        resolved = asyncio.Queue(self.concurrency * 2)
+        done = asyncio.Queue(self.concurrency * 2)
+
+        async def close_stage(workers, queue, sentinels):
+            await asyncio.gather(*workers, return_exceptions=True)
+            for _ in range(sentinels):
+                await queue.put(None)
+
+        feeder = asyncio.create_task(self._feed(names, todo))
+        dns_workers = [asyncio.create_task(self._dns_worker(resolver, todo, resolved, done))
+                       for _ in range(self.dns_concurrency)]
+        http_workers = [asyncio.create_task(self._http_worker(session, resolver, resolved, done))
+                        for _ in range(self.concurrency)]
+        tasks = [feeder] + dns_workers + http_workers + [
+            asyncio.create_task(close_stage([feeder], todo, len(dns_workers))),
+            asyncio.create_task(close_stage(dns_workers, resolved, len(http_workers))),
+            asyncio.create_task(close_stage(http_workers, done, 1)),
+        ]
+
+        try:
+            while True:
+                result = await done.get()
+                if result is None:
+                    break
+                yield result
+
+            # Input errors (e.g. a broken CT stream) surface after the
+            # candidates read so far have been verified
+            if feeder.exception():
+                raise feeder.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await session.close()
+
+    async def _feed(self, names, todo: asyncio.Queue):
+        """Push unique, normalized names into the DNS stage."""
+        seen = set()
+
+        async def push(name):
+            name = normalize_name(name)
+            if name and name not in seen:
+                seen.add(name)
+                self.stats['candidates'] += 1
+                await todo.put(name)
+
+        async for name in iterate(names):
+            await push(name)
+
+    async def _dns_worker(self, resolver: _PreResolvedResolver,
+                          todo: asyncio.Queue, resolved: asyncio.Queue, done: asyncio.Queue):
+        """Resolve names; only those with an address go on to HTTP."""
+        while True:
+            name = await todo.get()
+            if name is None:
+                return
+
+            url = self.url_template.format(name=name)
+            parsed = urlparse(url)
+            host = parsed.hostname
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+
+            try:
+                answers = await asyncio.wait_for(
+                    resolver.resolver.resolve(host, port, family=socket.AF_INET),
+                    timeout=self.timeout
+                )
+            except asyncio.CancelledError:
+                raise
+            except socket.gaierror as e:
+                nxdomain = e.errno in NXDOMAIN_ERRORS
+                self.stats['nxdomain' if nxdomain else 'dns_errors'] += 1
+                await done.put(ProbeResult(name, url, None, None,
+                                           'NXDOMAIN' if nxdomain else f'DNS: {e}'))
+                continue
+            except (OSError, asyncio.TimeoutError) as e:
+                self.stats['dns_errors'] += 1
+                await done.put(ProbeResult(name, url, None, None, f'DNS: {e or "timeout"}'))
+                continue
+
+            if not answers:
+                self.stats['nxdomain'] += 1
+                await done.put(ProbeResult(name, url, None, None, 'NXDOMAIN'))
+                continue
+
+            resolver.answers[host] = answers
+            await resolved.put((name, url, host, answers[0]['host']))
+
+    async def _http_worker(self, session: aiohttp.ClientSession,
+                           resolver: _PreResolvedResolver,
+                           resolved: asyncio.Queue, done: asyncio.Queue):
+        """Probe resolved candidates within the per-server budget."""
+        while True:
+            item = await resolved.get()
+            if item is None:
+                return
+
+            name, url, host, address = item
+            try:
+                result = await self._probe(session, name, url, address)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['http_errors'] += 1
+                result = ProbeResult(name, url, address, None, str(e)[:100])
+            finally:
+                resolver.answers.pop(host, None)
+            await done.put(result)
+
+    async def _probe(self, session: aiohttp.ClientSession, name: str,
+                     url: str, address: str) -> ProbeResult:
+        """HEAD one candidate (GET if HEAD is refused), retrying throttling.
+
+        Returns:
+            ProbeResult with the final status, or the error text
+        """
+        limiter = self.limiters.for_host(address)
+        self.stats['probed'] += 1
+        status, error = None, None
+
+        for attempt in range(self.retries + 1):
+            async with limiter.slot():
+                start = time.monotonic()
+                try:
+                    async with session.head(url, allow_redirects=True) as response:
+                        status, headers = response.status, response.headers
+                    if status in HEAD_NOT_ALLOWED:
+                        async with session.get(url, allow_redirects=True) as response:
+                            status, headers = response.status, response.headers
+                except asyncio.CancelledError:
+                    raise
+                except asyncio.TimeoutError:
+                    limiter.on_throttle(timeout=True)
+                    status, error = None, 'timeout'
+                    continue
+                except (aiohttp.ClientError, OSError) as e:
+                    limiter.on_error(time.monotonic() - start)
+                    status, error = None, str(e)[:100] or type(e).__name__
+                    break
+
+            if status in THROTTLE_STATUSES:
+                self.stats['throttled'] += 1
+                limiter.on_throttle(parse_retry_after(headers.get('Retry-After')))
+                error = f'HTTP {status}'
+                continue
+
+            limiter.on_success(time.monotonic() - start)
+            error = None
+            break
+
+        if status == 200:
+            self.stats['found'] += 1
+        elif status is None:
+            self.stats['http_errors'] += 1
+        return ProbeResult(name, url, address, status, error)
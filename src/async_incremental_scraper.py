@@ -6,11 +6,15 @@ Best of both worlds: Phase 2 (incremental) + Phase 3 (async).
 
 import asyncio
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import defaultdict
 
-from async_scraper import AsyncAvatureScraper
+from async_scraper import (AsyncAvatureScraper, PAGE_PARSED, PAGE_NOT_MODIFIED,
+                           PAGE_FINGERPRINT, PAGE_FAILED)
+from async_db_writer import AsyncJobWriter
 from database import JobDatabase
+from validator_cache import ValidatorCache
+from listing_parser import page_count
 
 
 class AsyncIncrementalScraper:
@@ -21,7 +25,9 @@ class AsyncIncrementalScraper:
                  smart_stop_pages: int = 5,
                  max_concurrent_sites: int = 5,
                  max_concurrent_pages: int = 3,
-                 rate_limit_delay: float = 0.5):
+                 rate_limit_delay: float = 0.5,
+                 writer_queue_size: int = 100,
+                 validator_cache_path: Optional[str] = "data/validators.db"):
         """Initialize async incremental scraper.
 
         Args:
@@ -31,6 +37,10 @@ class AsyncIncrementalScraper:
             max_concurrent_sites: Maximum sites to scrape concurrently
             max_concurrent_pages: Maximum pages per site concurrently
             rate_limit_delay: Delay between requests in seconds
+            writer_queue_size: Pages buffered for the database writer before
+                fetchers are made to wait
+            validator_cache_path: SQLite file for ETag / Last-Modified / body
+                hash per listing page (None disables conditional fetching)
         """
         self.db = JobDatabase(db_path)
         self.smart_stop_pages = smart_stop_pages
@@ -41,25 +51,42 @@ class AsyncIncrementalScraper:
         self.max_concurrent_pages = max_concurrent_pages
         self.rate_limit_delay = rate_limit_delay
 
-        # Async scraper (created in async context)
+        # Async scraper and database writer (created in async context)
         self.scraper = None
+        self.writer_queue_size = writer_queue_size
+        self.writer = None
+        self.validator_cache_path = validator_cache_path
+        self.validator_cache = None
 
     async def __aenter__(self):
         """Async context manager entry."""
+        # Validators let unchanged listing pages skip parsing and upserts
+        if self.validator_cache_path:
+            self.validator_cache = ValidatorCache(self.validator_cache_path)
+
         # Create async scraper
         self.scraper = AsyncAvatureScraper(
             use_url_detector=self.use_url_detector,
             max_concurrent_sites=self.max_concurrent_sites,
             max_concurrent_pages=self.max_concurrent_pages,
-            rate_limit_delay=self.rate_limit_delay
+            rate_limit_delay=self.rate_limit_delay,
+            validator_cache=self.validator_cache
         )
         await self.scraper.__aenter__()
+
+        # All job writes go through one writer task off the event loop
+        self.writer = AsyncJobWriter(self.db, max_queue_size=self.writer_queue_size)
+        await self.writer.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        if self.writer:
+            await self.writer.close()
         if self.scraper:
             await self.scraper.__aexit__(exc_type, exc_val, exc_tb)
+        if self.validator_cache:
+            self.validator_cache.close()
         self.db.close()
 
     async def scrape_site_incremental(self, base_url: str) -> Dict:
@@ -82,13 +109,16 @@ class AsyncIncrementalScraper:
             'jobs_deactivated': 0,
             'success': False,
             'error': None,
-            'stopped_early': False
+            'stopped_early': False,
+            'failed_pages': [],
+            'pages': {PAGE_PARSED: 0, PAGE_NOT_MODIFIED: 0, PAGE_FINGERPRINT: 0}
         }
 
         try:
             # Detect URL pattern
+            probe = None
             if self.scraper.use_url_detector and self.scraper.url_detector:
-                pattern = self.scraper.detect_pattern(base_url)
+                pattern, probe = await self.scraper.detect_pattern_with_response(base_url)
 
                 if pattern is None:
                     site_stats['error'] = "No compatible URL pattern found"
@@ -101,32 +131,26 @@ class AsyncIncrementalScraper:
 
             # Scrape with smart stopping
             jobs, stopped_early = await self.scrape_with_smart_stop(
-                search_url, base_url
+                search_url, base_url, site_stats['pages'], probe=probe
             )
 
             site_stats['jobs_found'] = len(jobs)
             site_stats['stopped_early'] = stopped_early
+            site_stats['failed_pages'] = self.scraper.failed_pages.get(search_url, [])
             site_stats['success'] = True
 
-            # Process jobs through database
-            active_urls = []
-            for job in jobs:
-                action, changed = self.db.upsert_job(job)
-
-                if action == 'new':
-                    site_stats['jobs_new'] += 1
-                elif action == 'updated':
-                    site_stats['jobs_updated'] += 1
-                else:
-                    site_stats['jobs_unchanged'] += 1
-
-                active_urls.append(job['url'])
+            # Pages were queued for the writer while scraping; wait until
+            # they are committed and unseen jobs are deactivated (unless a
+            # page failed: jobs past it were never seen, not removed)
+            active_urls = [job['url'] for job in jobs]
+            company = (jobs[0]['company']
+                       if jobs and not site_stats['failed_pages'] else None)
+            counts = await self.writer.finish_site(base_url, company, active_urls)
 
-            # Mark unseen jobs as inactive
-            company = jobs[0]['company'] if jobs else None
-            if company:
-                deactivated = self.db.mark_inactive_jobs(active_urls, company)
-                site_stats['jobs_deactivated'] = deactivated
+            site_stats['jobs_new'] = counts['new']
+            site_stats['jobs_updated'] = counts['updated']
+            site_stats['jobs_unchanged'] = counts['unchanged']
+            site_stats['jobs_deactivated'] = counts['deactivated']
 
             # Print summary
             print(f"  ✓ Found {len(jobs)} jobs")
@@ -140,6 +164,9 @@ class AsyncIncrementalScraper:
                 print(f"    • {site_stats['jobs_deactivated']} deactivated")
             if stopped_early:
                 print(f"    • Stopped early (no new jobs in {self.smart_stop_pages} pages)")
+            if site_stats['failed_pages']:
+                print(f"    • Page {site_stats['failed_pages'][0]} failed, "
+                      f"no jobs deactivated")
 
         except Exception as e:
             site_stats['error'] = str(e)
@@ -148,12 +175,23 @@ class AsyncIncrementalScraper:
         return site_stats
 
     async def scrape_with_smart_stop(self, search_url: str,
-                                     base_url: str) -> tuple:
+                                     base_url: str,
+                                     page_sources: Optional[Dict] = None,
+                                     probe=None) -> tuple:
         """Scrape pages with smart stopping.
 
+        A page that fails (error status, timeout, network error) is retried
+        once. If it fails again the scrape stops there and the page is
+        recorded in the scraper's failed_pages, so the caller knows the
+        jobs it returns are not the whole listing.
+
         Args:
             search_url: Search URL
             base_url: Base site URL
+            page_sources: Optional counter of pages per fetch source
+                (parsed / not modified / fingerprint hit), updated in place
+            probe: Optional ProbeResponse from pattern detection, used as
+                page 1 instead of downloading it again
 
         Returns:
             Tuple of (jobs_list, stopped_early_bool)
@@ -173,11 +211,37 @@ class AsyncIncrementalScraper:
         except:
             pass  # First time scraping this company
 
+        # Page 1's result count, when shown, tells us where the listing ends
+        page_info = {}
+        self.scraper.failed_pages.pop(search_url, None)
+
         while page <= max_pages:
-            # Scrape page
-            page_jobs = await self.scraper.scrape_single_page(
-                search_url, base_url, page
-            )
+            # Scrape page (a failed page is retried once, without the probe)
+            for attempt in range(2):
+                if page == 1:
+                    page_jobs, source = await self.scraper.fetch_listing_page(
+                        search_url, base_url, page, page_info=page_info,
+                        probe=probe if attempt == 0 else None
+                    )
+                else:
+                    page_jobs, source = await self.scraper.fetch_listing_page(
+                        search_url, base_url, page
+                    )
+                if source != PAGE_FAILED:
+                    break
+                print(f"  Page {page}: Error" + (" (retrying)" if attempt == 0 else ""))
+
+            if source == PAGE_FAILED:
+                # A failure says nothing about where the listing ends
+                self.scraper.failed_pages[search_url] = [page]
+                break
+
+            if page == 1 and page_info:
+                max_pages = page_count(page_info['total_results'],
+                                       page_info['page_size'], max_pages)
+            unchanged = source != PAGE_PARSED
+            if page_sources is not None:
+                page_sources[source] = page_sources.get(source, 0) + 1
 
             if not page_jobs:
                 print(f"  Page {page}: No jobs (end)")
@@ -189,10 +253,18 @@ class AsyncIncrementalScraper:
             )
 
             print(f"  Page {page}: {len(page_jobs)} jobs "
-                  f"({new_jobs_on_page} potentially new)")
+                  + ("(unchanged)" if unchanged
+                     else f"({new_jobs_on_page} potentially new)"))
 
             all_jobs.extend(page_jobs)
 
+            # Hand the page to the writer (waits if the writer is behind);
+            # an unchanged page only needs last_seen refreshed
+            if unchanged:
+                await self.writer.touch_jobs(base_url, page_jobs)
+            else:
+                await self.writer.put_jobs(base_url, page_jobs)
+
             # Smart stopping logic
             if new_jobs_on_page == 0:
                 pages_without_new += 1
@@ -239,6 +311,7 @@ class AsyncIncrementalScraper:
             'jobs_updated': 0,
             'jobs_unchanged': 0,
             'jobs_deactivated': 0,
+            'pages': {PAGE_PARSED: 0, PAGE_NOT_MODIFIED: 0, PAGE_FINGERPRINT: 0},
             'site_results': []
         }
 
@@ -276,6 +349,8 @@ class AsyncIncrementalScraper:
                     overall_stats['jobs_updated'] += result['jobs_updated']
                     overall_stats['jobs_unchanged'] += result['jobs_unchanged']
                     overall_stats['jobs_deactivated'] += result.get('jobs_deactivated', 0)
+                    for source, count in result.get('pages', {}).items():
+                        overall_stats['pages'][source] += count
                 else:
                     overall_stats['sites_failed'] += 1
 
@@ -358,6 +433,21 @@ class AsyncIncrementalScraper:
             report.append(f"New job rate: {new_pct:.1f}%")
             report.append("")
 
+        # Page cache effectiveness
+        pages = stats.get('pages')
+        if self.validator_cache_path and pages and sum(pages.values()) > 0:
+            total_pages = sum(pages.values())
+            hits = pages[PAGE_NOT_MODIFIED] + pages[PAGE_FINGERPRINT]
+            report.append("## Page Cache")
+            report.append("")
+            report.append(f"Pages fetched:     {total_pages}")
+            report.append(f"  • Parsed (miss): {pages[PAGE_PARSED]}")
+            report.append(f"  • 304 replayed:  {pages[PAGE_NOT_MODIFIED]}")
+            report.append(f"  • Hash replayed: {pages[PAGE_FINGERPRINT]}")
+            report.append(f"Hit ratio: {hits / total_pages * 100:.1f}% "
+                          f"({hits} hits / {pages[PAGE_PARSED]} misses)")
+            report.append("")
+
         # Per-site breakdown
         report.append("## Per-Site Results")
         report.append("")
@@ -368,6 +458,11 @@ class AsyncIncrementalScraper:
                 report.append(f"    {site_result['jobs_found']} jobs "
                             f"({site_result['jobs_new']} new, "
                             f"{site_result['jobs_updated']} updated)")
+                site_pages = site_result.get('pages')
+                if site_pages and site_pages[PAGE_PARSED] < sum(site_pages.values()):
+                    report.append(f"    {site_pages[PAGE_PARSED]} pages parsed, "
+                                  f"{sum(site_pages.values()) - site_pages[PAGE_PARSED]} "
+                                  f"replayed from cache")
                 if site_result.get('stopped_early'):
                     report.append(f"    Stopped early (smart stop)")
             else:
@@ -5,33 +5,67 @@ Uses aiohttp for parallel HTTP requests and asyncio for concurrency.
 """
 
 import asyncio
+import time
 import aiohttp
-import re
-from datetime import datetime
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from typing import List, Dict, Optional, Tuple
+
+try:
+    from .parse_executor import ParseExecutor
+    from .listing_parser import (extract_job_row, job_from_row, page_count,
+                                 extract_rows, extract_page_info)
+    from .validator_cache import ValidatorCache
+    from .host_limiter import HostLimiterPool, THROTTLE_STATUSES, parse_retry_after
+except ImportError:
+    from parse_executor import ParseExecutor
+    from listing_parser import (extract_job_row, job_from_row, page_count,
+                                extract_rows, extract_page_info)
+    from validator_cache import ValidatorCache
+    from host_limiter import HostLimiterPool, THROTTLE_STATUSES, parse_retry_after
 
 # Import URL detector for pattern detection
 try:
-    from url_detector import AvatureURLDetector
+    from async_url_detector import AsyncAvatureURLDetector
     URL_DETECTOR_AVAILABLE = True
 except ImportError:
     URL_DETECTOR_AVAILABLE = False
 
 
+# How fetch_listing_page obtained a page's jobs
+PAGE_PARSED = 'parsed'              # Downloaded and parsed
+PAGE_NOT_MODIFIED = 'not_modified'  # 304, cached rows replayed
+PAGE_FINGERPRINT = 'fingerprint'    # Body hash matched, cached rows replayed
+PAGE_FAILED = 'failed'              # Error status, timeout or network error
+
+
+class PageFetchError(Exception):
+    """A listing page could not be fetched (as opposed to an empty page)."""
+
+
 class AsyncAvatureScraper:
     """Async scraper for concurrent Avature site scraping."""
 
     def __init__(self, use_url_detector=True, max_concurrent_sites=5,
-                 max_concurrent_pages=3, rate_limit_delay=0.5):
+                 max_concurrent_pages=3, rate_limit_delay=0.5,
+                 parse_mode='inline', parse_workers=None,
+                 validator_cache: Optional[ValidatorCache] = None,
+                 max_host_concurrency=16, max_retries=3):
         """Initialize async scraper.
 
         Args:
             use_url_detector: Use URL detector for automatic pattern detection
             max_concurrent_sites: Maximum sites to scrape concurrently
-            max_concurrent_pages: Maximum pages per site to scrape concurrently
-            rate_limit_delay: Delay between requests in seconds
+            max_concurrent_pages: Starting number of in-flight pages per host;
+                the adaptive limiter grows or shrinks it from there
+            rate_limit_delay: Delay between sites in seconds, and the base
+                backoff for throttled requests without Retry-After
+            parse_mode: Where listing pages are parsed: 'inline', 'thread'
+                or 'process'
+            parse_workers: Pool size for thread/process parsing
+            validator_cache: Optional ValidatorCache; listing pages are then
+                fetched conditionally and unchanged pages are not re-parsed
+            max_host_concurrency: Upper bound for a host's in-flight requests
+            max_retries: Retries for a request that was throttled (429/503)
+                or timed out
         """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
@@ -42,22 +76,39 @@ class AsyncAvatureScraper:
         self.max_concurrent_sites = max_concurrent_sites
         self.max_concurrent_pages = max_concurrent_pages
         self.rate_limit_delay = rate_limit_delay
+        self.max_host_concurrency = max(max_host_concurrency, max_concurrent_pages)
+        self.max_retries = max_retries
 
-        # URL detector (synchronous, but fast with cache)
+        # AIMD window per host: grows while healthy, halves on 429/503/timeouts
+        self.limiters = HostLimiterPool(initial_limit=max_concurrent_pages,
+                                        max_limit=self.max_host_concurrency)
+
+        # URL detector: probes run concurrently through fetch(), so they
+        # share the session and the per-host limiter
+        self.validator_cache = validator_cache
         if self.use_url_detector:
-            self.url_detector = AvatureURLDetector()
+            self.url_detector = AsyncAvatureURLDetector(self.fetch,
+                                                        validator_cache=validator_cache)
         else:
             self.url_detector = None
 
+        # HTML parsing runs here so it can be moved off the event loop
+        self.parser = ParseExecutor(mode=parse_mode, max_workers=parse_workers)
+
         # Session will be created in async context
         self.session = None
 
+        # Pages that still failed after a retry, by search URL
+        self.failed_pages: Dict[str, List[int]] = {}
+
     async def __aenter__(self):
         """Async context manager entry."""
         # Create aiohttp session with connection pooling
+        # Per-host concurrency is enforced by the adaptive limiters; the
+        # connector only caps what they may grow to
         connector = aiohttp.TCPConnector(
-            limit=self.max_concurrent_sites * self.max_concurrent_pages,
-            limit_per_host=self.max_concurrent_pages
+            limit=self.max_concurrent_sites * self.max_host_concurrency,
+            limit_per_host=self.max_host_concurrency
         )
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
         self.session = aiohttp.ClientSession(
@@ -71,9 +122,10 @@ class AsyncAvatureScraper:
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+        self.parser.close()
 
-    def detect_pattern(self, base_url: str) -> Optional[str]:
-        """Detect URL pattern (synchronous, uses cache).
+    async def detect_pattern(self, base_url: str) -> Optional[str]:
+        """Detect URL pattern (fresh cache entries need no request).
 
         Args:
             base_url: Base URL of the site
@@ -81,9 +133,21 @@ class AsyncAvatureScraper:
         Returns:
             Pattern string or None
         """
+        return (await self.detect_pattern_with_response(base_url))[0]
+
+    async def detect_pattern_with_response(self, base_url: str) -> Tuple[Optional[str], Optional[object]]:
+        """Detect URL pattern and keep the page fetched to validate it.
+
+        Args:
+            base_url: Base URL of the site
+
+        Returns:
+            Tuple of (pattern or None, ProbeResponse or None); the probe can
+            be passed on as page 1
+        """
         if self.use_url_detector and self.url_detector:
-            return self.url_detector.detect_pattern(base_url)
-        return None
+            return await self.url_detector.detect_pattern_with_response(base_url)
+        return None, None
 
     async def scrape_site(self, base_url: str, max_pages: int = 100) -> List[Dict]:
         """Scrape all jobs from a single site asynchronously.
@@ -98,9 +162,10 @@ class AsyncAvatureScraper:
         print(f"\nScraping: {base_url}")
 
         try:
-            # Detect URL pattern (synchronous but fast with cache)
+            # Detect URL pattern
+            probe = None
             if self.use_url_detector and self.url_detector:
-                pattern = self.detect_pattern(base_url)
+                pattern, probe = await self.detect_pattern_with_response(base_url)
 
                 if pattern is None:
                     print(f"  ✗ No compatible URL pattern found")
@@ -110,9 +175,9 @@ class AsyncAvatureScraper:
             else:
                 search_url = f"{base_url}/SearchJobs"
 
-            # Scrape pages concurrently
+            # Scrape pages concurrently; the detector's page serves as page 1
             jobs = await self.scrape_search_pages_concurrent(
-                search_url, base_url, max_pages
+                search_url, base_url, max_pages, probe=probe
             )
 
             print(f"  Found {len(jobs)} jobs")
@@ -124,115 +189,309 @@ class AsyncAvatureScraper:
 
     async def scrape_search_pages_concurrent(self, search_url: str,
                                             base_url: str,
-                                            max_pages: int) -> List[Dict]:
+                                            max_pages: int,
+                                            probe=None) -> List[Dict]:
         """Scrape multiple pages concurrently.
 
+        If page 1 shows a result count ("1-20 of 145 results"), every
+        remaining page is dispatched at once and the host's adaptive
+        limiter decides how many are in flight; nothing is requested past
+        the last page, and an empty or failed page inside the range does
+        not shorten it.
+
+        Otherwise pages are probed through a sliding window sized by the
+        limiter: whenever one finishes the next page number is started, so
+        a slow page never holds up the rest. An empty page marks the end of
+        the listing, and speculative requests already started for pages
+        past it are cancelled.
+
+        A page that fails (error status, timeout, network error) is not an
+        empty page: it is retried once, and if it fails again it is
+        recorded in failed_pages and skipped.
+
         Args:
             search_url: Base search URL
             base_url: Base site URL
             max_pages: Maximum pages to scrape
+            probe: Optional ProbeResponse for search_url from the URL
+                detector, used as page 1 instead of downloading it again
 
         Returns:
-            List of jobs from all pages
+            List of jobs from all pages, in page order
         """
-        all_jobs = []
-        page = 1
-
         # Scrape first page to determine if there are more
+        page_info = {}
         first_page_jobs = await self.scrape_single_page(
-            search_url, base_url, page
+            search_url, base_url, 1, page_info=page_info, probe=probe
         )
 
         if not first_page_jobs:
             return []
 
-        all_jobs.extend(first_page_jobs)
         print(f"  Page 1: {len(first_page_jobs)} jobs")
+        results = {1: first_page_jobs}
+
+        limiter = self.limiters.for_url(search_url)
+        if page_info:
+            # Exact page list: no probing, the limiter paces the fan-out
+            last_page = page_count(page_info['total_results'],
+                                   page_info['page_size'], max_pages)
+            print(f"  {page_info['total_results']} results, {last_page} pages")
+        else:
+            last_page = max_pages   # Shrinks once the end of the listing is seen
+        next_page = 2
+        empty_pages = set()
+        retries: List[int] = []         # Failed once, to be fetched again
+        retried = set()
+        failed = []
+        in_flight: Dict[asyncio.Task, int] = {}
 
-        # Now scrape remaining pages concurrently in batches
-        page = 2
-        while page <= max_pages:
-            # Create batch of page numbers
-            batch_pages = list(range(page, min(page + self.max_concurrent_pages, max_pages + 1)))
-
-            # Scrape batch concurrently
-            tasks = [
-                self.scrape_single_page(search_url, base_url, p)
-                for p in batch_pages
-            ]
-
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            empty_count = 0
-            for page_num, result in zip(batch_pages, batch_results):
-                if isinstance(result, Exception):
-                    print(f"  Page {page_num}: Error - {result}")
-                    empty_count += 1
-                elif not result:
-                    print(f"  Page {page_num}: No jobs (end)")
-                    empty_count += 1
-                else:
-                    print(f"  Page {page_num}: {len(result)} jobs")
-                    all_jobs.extend(result)
-
-            # If all pages in batch were empty, stop
-            if empty_count == len(batch_pages):
-                break
-
-            page += self.max_concurrent_pages
-
-            # Rate limiting between batches
-            if page <= max_pages:
-                await asyncio.sleep(self.rate_limit_delay)
+        try:
+            while in_flight or retries or next_page <= last_page:
+                # Refill the window up to the host's current limit, retries first
+                window = (last_page if page_info
+                          else max(1, int(limiter.limit)))
+                while len(in_flight) < window and (retries or next_page <= last_page):
+                    if retries:
+                        page_num = retries.pop(0)
+                    else:
+                        page_num = next_page
+                        next_page += 1
+                    task = asyncio.create_task(
+                        self.scrape_single_page(search_url, base_url, page_num)
+                    )
+                    in_flight[task] = page_num
+
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    page_num = in_flight.pop(task)
+                    if task.cancelled():
+                        continue
+                    error = task.exception()
+                    if error is not None:
+                        # A failure says nothing about where the listing ends
+                        if page_num not in retried:
+                            print(f"  Page {page_num}: Error - {error} (retrying)")
+                            retried.add(page_num)
+                            retries.append(page_num)
+                        else:
+                            print(f"  Page {page_num}: Error - {error} (skipped)")
+                            failed.append(page_num)
+                    elif task.result():
+                        results[page_num] = task.result()
+                        print(f"  Page {page_num}: {len(results[page_num])} jobs")
+                    else:
+                        print(f"  Page {page_num}: No jobs (end)")
+                        empty_pages.add(page_num)
+
+                # Without a result count, the listing ends before the first
+                # empty page that no later page contradicts; with one, the
+                # page list is exact and every page is fetched
+                highest = max(results)
+                ends = [p for p in empty_pages if p > highest and not page_info]
+                if ends and min(ends) - 1 < last_page:
+                    last_page = min(ends) - 1
+                    retries = [p for p in retries if p <= last_page]
+                    for task, page_num in in_flight.items():
+                        if page_num > last_page:
+                            task.cancel()
+        finally:
+            # Cancel anything still running (end detected or we were cancelled)
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        failed = sorted(p for p in failed if p <= last_page)
+        if failed:
+            self.failed_pages[search_url] = failed
+            print(f"  Failed pages: {failed}")
 
+        all_jobs = []
+        for page_num in sorted(results):
+            all_jobs.extend(results[page_num])
         return all_jobs
 
     async def scrape_single_page(self, search_url: str, base_url: str,
-                                 page: int) -> List[Dict]:
+                                 page: int, page_info: Optional[Dict] = None,
+                                 probe=None) -> List[Dict]:
         """Scrape a single page of jobs.
 
         Args:
             search_url: Base search URL
             base_url: Base site URL
             page: Page number
+            page_info: Optional dict, filled in place with the page's
+                result count (see fetch_listing_page)
+            probe: Optional ProbeResponse already fetched for the page
 
         Returns:
             List of jobs from this page
+
+        Raises:
+            PageFetchError: If the page could not be fetched
+        """
+        jobs, source = await self.fetch_listing_page(search_url, base_url, page,
+                                                     page_info=page_info, probe=probe)
+        if source == PAGE_FAILED:
+            raise PageFetchError(f"page {page} of {search_url} could not be fetched")
+        return jobs
+
+    async def fetch_listing_page(self, search_url: str, base_url: str,
+                                 page: int, page_info: Optional[Dict] = None,
+                                 probe=None) -> Tuple[List[Dict], str]:
+        """Fetch a single page of jobs, reusing cached rows if it is unchanged.
+
+        With a validator cache the request carries If-None-Match /
+        If-Modified-Since, and the body is fingerprinted. A 304 or a
+        fingerprint seen last time for (site, page URL) replays the rows
+        cached for the page instead of parsing it.
+
+        Args:
+            search_url: Base search URL
+            base_url: Base site URL
+            page: Page number
+            page_info: Optional dict, filled in place with total_results and
+                page_size if the page shows a result count
+            probe: Optional ProbeResponse (from the URL detector) already
+                fetched for the page; it is used, and its parse reused,
+                instead of a new request
+
+        Returns:
+            Tuple of (jobs, source) where source is PAGE_PARSED,
+            PAGE_NOT_MODIFIED, PAGE_FINGERPRINT or PAGE_FAILED (no jobs)
         """
         try:
             # Build page URL
             page_url = self.get_page_url(search_url, page)
 
-            # Fetch page
-            async with self.session.get(page_url) as response:
-                if response.status != 200:
-                    return []
-
-                html = await response.text()
+            cache = self.validator_cache
+            entry = await cache.get_async(page_url, site=base_url) if cache else None
+            if entry and entry['rows'] is None:
+                entry = None  # Validators only, nothing to replay
 
-            # Parse HTML
-            soup = BeautifulSoup(html, 'lxml')
-            articles = soup.find_all('article')
-
-            if not articles:
-                return []
+            # Fetch page, unless the detector already did
+            if probe is not None and probe.url == page_url:
+                status, body, encoding, response_headers = (
+                    200, probe.body, probe.encoding, probe.headers
+                )
+            else:
+                probe = None
+                status, body, encoding, response_headers = await self.fetch(
+                    page_url, headers=ValidatorCache.request_headers(entry)
+                )
+
+            if status == 304 and entry:
+                self._fill_page_info(page_info, entry['page_info'])
+                return self._jobs_from_rows(entry['rows'], base_url), PAGE_NOT_MODIFIED
+
+            if status in (404, 410):
+                return [], PAGE_PARSED      # No such page: past the end
+            if status != 200:
+                print(f"    HTTP {status} on page {page}")
+                return [], PAGE_FAILED
+
+            if cache:
+                body_hash = ValidatorCache.content_hash(body)
+                if entry and entry['content_hash'] == body_hash:
+                    await cache.store_async(page_url, response_headers, body_hash,
+                                            entry['rows'], site=base_url,
+                                            page_info=entry['page_info'])
+                    self._fill_page_info(page_info, entry['page_info'])
+                    return self._jobs_from_rows(entry['rows'], base_url), PAGE_FINGERPRINT
+
+            # Parse HTML (possibly on a worker) into compact rows; the
+            # result count is only read when the caller asks for it
+            info = None
+            if probe is not None and probe.root is not None:
+                # Already parsed by the detector
+                rows, info = extract_rows(probe.root, base_url), extract_page_info(probe.root)
+            elif page_info is not None:
+                rows, info = await self.parser.parse_first_page(body, base_url, encoding)
+            else:
+                rows = await self.parser.parse(body, base_url, encoding)
+            self._fill_page_info(page_info, info)
 
-            # Extract jobs from articles
-            jobs = []
-            for article in articles:
-                job = self.extract_job_from_article(article, base_url)
-                if job:
-                    jobs.append(job)
+            if cache:
+                await cache.store_async(page_url, response_headers, body_hash, rows,
+                                        site=base_url, page_info=info)
 
-            return jobs
+            return self._jobs_from_rows(rows, base_url), PAGE_PARSED
 
         except asyncio.TimeoutError:
             print(f"    Timeout on page {page}")
-            return []
+            return [], PAGE_FAILED
         except Exception as e:
             print(f"    Error on page {page}: {e}")
-            return []
+            return [], PAGE_FAILED
+
+    async def fetch(self, url: str, headers: Optional[Dict] = None) -> Tuple:
+        """GET a URL within its host's adaptive concurrency window.
+
+        Throttled responses (429/503) and timeouts shrink the host's window
+        and are retried, after Retry-After if the server sent one.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+
+        Returns:
+            Tuple of (status, body, charset, response_headers); body is only
+            read for 200 responses
+
+        Raises:
+            asyncio.TimeoutError: If the last attempt timed out
+        """
+        limiter = self.limiters.for_url(url)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+
+            async with limiter.slot():
+                start = time.monotonic()
+                try:
+                    async with self.session.get(url, headers=headers) as response:
+                        status = response.status
+                        body = await response.read() if status == 200 else b''
+                        charset = response.charset
+                        response_headers = response.headers
+                except asyncio.TimeoutError:
+                    limiter.on_throttle(timeout=True)
+                    if last_attempt:
+                        raise
+                    continue
+                except aiohttp.ClientError:
+                    limiter.on_error()
+                    raise
+                latency = time.monotonic() - start
+
+            if status in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(response_headers.get('Retry-After'))
+                limiter.on_throttle(retry_after)
+                if not last_attempt:
+                    if retry_after is None:
+                        # No hint from the server: exponential backoff
+                        await asyncio.sleep(self.rate_limit_delay * 2 ** attempt)
+                    continue
+            elif status in (200, 304):
+                limiter.on_success(latency)
+            else:
+                limiter.on_error(latency)
+
+            return status, body, charset, response_headers
+
+    @staticmethod
+    def _fill_page_info(page_info: Optional[Dict], info: Optional[Tuple]):
+        """Copy a (total_results, page_size) pair into the caller's dict."""
+        if page_info is not None and info:
+            page_info['total_results'], page_info['page_size'] = info
+
+    def _jobs_from_rows(self, rows: List, base_url: str) -> List[Dict]:
+        """Expand parsed (or cached) rows into job dictionaries."""
+        return [job_from_row(row, base_url) for row in rows]
 
     def get_page_url(self, base_search_url: str, page: int) -> str:
         """Generate URL for a specific page number.
@@ -256,55 +515,15 @@ class AsyncAvatureScraper:
         """Extract job information from an article element.
 
         Args:
-            article: BeautifulSoup article element
+            article: lxml (or BeautifulSoup) article element
             base_url: Base site URL
 
         Returns:
             Job dictionary or None
         """
         try:
-            # Find the job link
-            link = article.find('a', href=re.compile(r'JobDetail|FolderDetail', re.I))
-
-            if not link:
-                return None
-
-            # Extract title
-            title = link.get_text(strip=True)
-
-            # Extract URL
-            job_url = link.get('href')
-            if not job_url.startswith('http'):
-                job_url = urljoin(base_url, job_url)
-
-            # Extract job ID from URL
-            job_id_match = re.search(r'/(\d+)$', job_url)
-            job_id = job_id_match.group(1) if job_id_match else None
-
-            # Try to extract location
-            location = None
-            location_elem = article.find(attrs={'class': re.compile(r'location', re.I)})
-            if location_elem:
-                location = location_elem.get_text(strip=True)
-
-            # Metadata
-            metadata = {}
-            date_elem = article.find('time')
-            if date_elem:
-                metadata['date_posted'] = date_elem.get('datetime') or date_elem.get_text(strip=True)
-
-            job = {
-                'title': title,
-                'url': job_url,
-                'job_id': job_id,
-                'location': location,
-                'company_url': base_url,
-                'company': urlparse(base_url).netloc.split('.')[0],
-                'scraped_at': datetime.now().isoformat(),
-                'metadata': metadata,
-            }
-
-            return job
+            row = extract_job_row(article, base_url)
+            return job_from_row(row, base_url) if row else None
 
         except Exception as e:
             return None
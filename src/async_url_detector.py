@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Async URL pattern detector for Avature sites.
+Probes the candidate search URLs concurrently through the async scraper's
+session (and per-host limiter) instead of one blocking request at a time,
+sharing the TTL/confidence pattern cache with the sync detector.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    from .listing_parser import parse_document
+    from .pattern_cache import PatternCache
+    from .url_detector import (PATTERNS, STRONG_CONFIDENCE, LISTING_MARKERS,
+                               ProbeResponse, score_listing_page)
+except ImportError:
+    from listing_parser import parse_document
+    from pattern_cache import PatternCache
+    from url_detector import (PATTERNS, STRONG_CONFIDENCE, LISTING_MARKERS,
+                              ProbeResponse, score_listing_page)
+
+
+class AsyncAvatureURLDetector:
+    """Detect which URL pattern an Avature site uses, without blocking the loop"""
+
+    PATTERNS = PATTERNS
+
+    def __init__(self, fetch: Callable[..., Awaitable[Tuple]],
+                 cache_file: str = 'data/pattern_cache.json',
+                 validator_cache=None,
+                 pattern_cache: Optional[PatternCache] = None):
+        """Initialize detector.
+
+        Args:
+            fetch: Coroutine function (url, headers=None) returning
+                (status, body, charset, response_headers), normally
+                AsyncAvatureScraper.fetch so probes share its session and
+                per-host limiter
+            cache_file: Path to the JSON pattern cache
+            validator_cache: Optional ValidatorCache; pages that passed before
+                are re-checked with conditional requests
+            pattern_cache: Optional PatternCache to share (overrides cache_file)
+        """
+        self.fetch = fetch
+        self.validator_cache = validator_cache
+        self.cache = pattern_cache or PatternCache(cache_file)
+
+    async def detect_pattern(self, base_url: str,
+                             force_refresh: bool = False) -> Optional[str]:
+        """Return the site's working pattern (e.g. "/SearchJobs") or None."""
+        return (await self.detect_pattern_with_response(base_url, force_refresh))[0]
+
+    async def detect_pattern_with_response(self, base_url: str,
+                                           force_refresh: bool = False
+                                           ) -> Tuple[Optional[str], Optional[ProbeResponse]]:
+        """Detect the pattern and hand back the page that validated it.
+
+        A fresh cache entry is returned without any request; a stale one is
+        re-verified with a single request. Otherwise all candidates are
+        probed at once and the first pattern (in PATTERNS order) with a
+        clear job listing wins as soon as every pattern ahead of it has
+        failed; the probes still running are cancelled.
+
+        Args:
+            base_url: Base URL like "https://company.avature.net/careers"
+            force_refresh: Ignore cache and re-detect
+
+        Returns:
+            Tuple of (pattern or None, ProbeResponse or None); the response
+            is None for a fresh cache hit or a 304 Not Modified
+        """
+        if not force_refresh and base_url in self.cache:
+            cached_pattern = self.cache.get(base_url)['pattern']
+            if self.cache.is_fresh(base_url):
+                print(f"  ✓ Using cached pattern: {cached_pattern}")
+                return cached_pattern, None
+
+            confidence, probe = await self._probe(f"{base_url}{cached_pattern}")
+            if confidence > 0:
+                print(f"  ✓ Using cached pattern: {cached_pattern} (re-verified)")
+                self.cache.record(base_url, cached_pattern, confidence)
+                return cached_pattern, probe
+
+            print(f"  ⚠ Cached pattern {cached_pattern} no longer works, re-detecting")
+            self.cache.invalidate(base_url)
+
+        print(f"  🔍 Detecting URL pattern for {base_url}")
+        pattern, confidence, probe = await self._probe_all(base_url)
+
+        if pattern is None:
+            print(f"    ✗ No compatible pattern found")
+            return None, None
+
+        print(f"    ✓ Found working pattern: {pattern if pattern else '(base URL)'}")
+        self.cache.record(base_url, pattern, confidence)
+        return pattern, probe
+
+    async def _probe_all(self, base_url: str) -> Tuple[Optional[str], float,
+                                                       Optional[ProbeResponse]]:
+        """Probe every candidate concurrently and pick the winner.
+
+        Returns:
+            Tuple of (pattern or None, confidence, ProbeResponse or None)
+        """
+        tasks = {
+            asyncio.create_task(self._probe(f"{base_url}{pattern}")): pattern
+            for pattern in self.PATTERNS
+        }
+        results: Dict[str, Tuple[float, Optional[ProbeResponse]]] = {}
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    results[tasks[task]] = task.result()
+
+                # Walk candidates in priority order: a strong answer wins
+                # once everything ahead of it has been ruled out
+                for pattern in self.PATTERNS:
+                    if pattern not in results:
+                        break
+                    confidence, probe = results[pattern]
+                    if confidence >= STRONG_CONFIDENCE:
+                        return pattern, confidence, probe
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # No clear listing anywhere: take the best weak evidence
+        best = max(self.PATTERNS, key=lambda p: (results[p][0], -self.PATTERNS.index(p)))
+        confidence, probe = results[best]
+        if confidence == 0:
+            return None, 0.0, None
+        return best, confidence, probe
+
+    async def _probe(self, url: str) -> Tuple[float, Optional[ProbeResponse]]:
+        """Fetch a URL and check it for job indicators.
+
+        Args:
+            url: Full URL to test
+
+        Returns:
+            Tuple of (confidence, ProbeResponse for a 200 answer or None);
+            confidence is 0.0 if the page is not a job listing
+        """
+        try:
+            # Only pages that passed are cached, so 304 / same body means valid
+            entry = await self.validator_cache.get_async(url) if self.validator_cache else None
+            headers = self.validator_cache.request_headers(entry) if entry else None
+
+            status, body, charset, response_headers = await self.fetch(url, headers=headers)
+
+            if status == 304 and entry:
+                return STRONG_CONFIDENCE, None
+            if status != 200:
+                return 0.0, None
+
+            if self.validator_cache:
+                body_hash = self.validator_cache.content_hash(body)
+                if entry and entry['content_hash'] == body_hash:
+                    return STRONG_CONFIDENCE, ProbeResponse(
+                        url, body, charset, response_headers, None
+                    )
+
+            if LISTING_MARKERS.search(body):
+                # Job markup found: the scraper parses page 1, not us
+                confidence, root = STRONG_CONFIDENCE, None
+            else:
+                root = parse_document(body, charset)
+                text = body.decode(charset or 'utf-8', errors='replace')
+                confidence = score_listing_page(root, text)
+            if confidence == 0:
+                return 0.0, None
+
+            if self.validator_cache:
+                # Remember validators for the next check of this URL
+                await self.validator_cache.store_async(url, response_headers, body_hash)
+
+            return confidence, ProbeResponse(url, body, charset, response_headers, root)
+
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            print(f"      ⏱ Timeout testing {url}")
+            return 0.0, None
+        except Exception as e:
+            print(f"      ✗ Error testing {url}: {str(e)[:50]}")
+            return 0.0, None
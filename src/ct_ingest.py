@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Streaming Certificate Transparency ingestion for site discovery.
+crt.sh answers a wildcard query with one JSON array of every certificate
+ever logged for the domain. Instead of loading it whole, the array is
+parsed one entry at a time as bytes arrive (from HTTP or a saved dump),
+and each new subdomain is handed to the prober straight away. Memory is
+bounded by one entry plus the set of unique names, whatever the dump size.
+"""
+
+import codecs
+import gzip
+import json
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+import aiohttp
+
+try:
+    from .async_discovery import normalize_name
+except ImportError:
+    from async_discovery import normalize_name
+
+
+CRT_SH_URL = 'https://crt.sh/?q=%25.{domain}&output=json'
+
+# Bytes read per chunk from files and responses
+CHUNK_SIZE = 64 * 1024
+
+# A single CT entry larger than this means the input is not what we expect
+MAX_ENTRY_SIZE = 1 << 20
+
+
+class JSONArrayParser:
+    """Incremental parser for a top-level JSON array.
+
+    feed() takes raw bytes in any chunking and returns the array items
+    completed so far; only the unfinished item is kept in the buffer.
+    """
+
+    def __init__(self, max_item_size: int = MAX_ENTRY_SIZE):
+        """Initialize parser.
+
+        Args:
+            max_item_size: Largest item (in characters) to wait for
+                before giving up on the input
+        """
+        self.max_item_size = max_item_size
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._buffer = ''
+        # start -> first (after '[') -> item (after ',') / after (after item) -> done
+        self._state = 'start'
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add bytes and return the items they completed."""
+        buffer = self._buffer + self._text.decode(data)
+        items = []
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+            if self._state == 'start':
+                if char != '[':
+                    raise ValueError("CT data is not a JSON array")
+                self._state = 'first'
+                pos += 1
+            elif self._state == 'done':
+                raise ValueError("Unexpected data after the JSON array")
+            elif char == ']' and self._state in ('first', 'after'):
+                self._state = 'done'
+                pos += 1
+            elif self._state == 'after':
+                if char != ',':
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+                self._state = 'item'
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    item, end = None, None
+                # A bare number at the end of the buffer may be cut short
+                if end is None or (end == len(buffer) and isinstance(item, (int, float))):
+                    if len(buffer) - pos > self.max_item_size:
+                        raise ValueError("JSON array item too large or malformed")
+                    break
+                items.append(item)
+                self._state = 'after'
+                pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self):
+        """Check the array was complete."""
+        if self._state != 'done':
+            raise ValueError("CT data ended before the JSON array was closed")
+
+
+def extract_subdomains(entry: dict, domain: str = 'avature.net') -> Iterator[str]:
+    """Subdomain labels named by one crt.sh entry.
+
+    "*.acme.avature.net" and "acme.avature.net" both give "acme"; names
+    outside the domain and bare wildcards are skipped.
+
+    Args:
+        entry: crt.sh JSON object (name_value holds newline-separated names)
+        domain: Parent domain
+    """
+    suffix = '.' + domain
+    values = [entry.get('name_value') or '', entry.get('common_name') or '']
+    for value in values:
+        for name in value.split('\n'):
+            name = normalize_name(name)
+            if name.startswith('*.'):
+                name = name[2:]
+            if name.endswith(suffix):
+                subdomain = name[:-len(suffix)]
+                if subdomain and '*' not in subdomain:
+                    yield subdomain
+
+
+class CTIngestor:
+    """Stream unique subdomains out of a crt.sh result"""
+
+    def __init__(self, domain: str = 'avature.net', chunk_size: int = CHUNK_SIZE,
+                 max_entry_size: int = MAX_ENTRY_SIZE):
+        """Initialize ingestor.
+
+        Args:
+            domain: Parent domain to collect subdomains of
+            chunk_size: Bytes read at a time
+            max_entry_size: Largest CT entry accepted
+        """
+        self.domain = domain
+        self.chunk_size = chunk_size
+        self.max_entry_size = max_entry_size
+        self.seen = set()
+        self.stats = {'bytes': 0, 'entries': 0, 'unique_names': 0}
+
+    def _new_names(self, entries: Iterable[dict]) -> Iterator[str]:
+        """Subdomains not yielded before."""
+        for entry in entries:
+            self.stats['entries'] += 1
+            if not isinstance(entry, dict):
+                continue
+            for subdomain in extract_subdomains(entry, self.domain):
+                if subdomain not in self.seen:
+                    self.seen.add(subdomain)
+                    self.stats['unique_names'] += 1
+                    yield subdomain
+
+    def from_file(self, path: str) -> Iterator[str]:
+        """Stream names from a saved crt.sh JSON dump (.json or .json.gz)."""
+        parser = JSONArrayParser(self.max_entry_size)
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                self.stats['bytes'] += len(chunk)
+                yield from self._new_names(parser.feed(chunk))
+        parser.close()
+
+    async def from_url(self, url: Optional[str] = None,
+                       session: Optional[aiohttp.ClientSession] = None,
+                       timeout: float = 300.0) -> AsyncIterator[str]:
+        """Stream names from crt.sh (or another URL serving the same JSON).
+
+        Args:
+            url: Query URL (default: crt.sh wildcard query for the domain)
+            session: Optional session to reuse
+            timeout: Seconds for the whole download
+        """
+        url = url or CRT_SH_URL.format(domain=self.domain)
+        own_session = session is None
+        if own_session:
+            session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout))
+
+        parser = JSONArrayParser(self.max_entry_size)
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    self.stats['bytes'] += len(chunk)
+                    for name in self._new_names(parser.feed(chunk)):
+                        yield name
+            parser.close()
+        finally:
+            if own_session:
+                await session.close()
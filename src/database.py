@@ -6,29 +6,122 @@ Enables incremental updates and historical tracking.
 
 import sqlite3
 import json
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple, Union
 from pathlib import Path
 
 
 class JobDatabase:
     """SQLite database for job tracking and incremental updates."""
 
-    def __init__(self, db_path: str = "data/jobs.db"):
+    # Stay well below SQLite's host-parameter limit (999 on older builds)
+    MAX_SQL_PARAMS = 500
+
+    # Storage profiles: PRAGMAs applied when connections are opened.
+    # 'crawl' lets readers run alongside the writer during a scrape;
+    # 'compat' keeps SQLite's default rollback journal.
+    STORAGE_PROFILES = {
+        'crawl': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'mmap_size': 256 * 1024 * 1024,
+            'cache_size': -64 * 1024,       # Negative = KiB, i.e. 64 MiB
+            'temp_store': 'MEMORY',
+            'busy_timeout': 30000,
+        },
+        'compat': {
+            'journal_mode': 'DELETE',
+            'synchronous': 'FULL',
+            'busy_timeout': 30000,
+        },
+    }
+
+    # PRAGMAs that only make sense on the writer connection
+    WRITER_ONLY_PRAGMAS = ('journal_mode', 'synchronous')
+
+    def __init__(self, db_path: str = "data/jobs.db",
+                 profile: Union[str, Dict] = 'crawl',
+                 read_pool_size: int = 4):
         """Initialize database connection and create tables if needed.
 
         Args:
             db_path: Path to SQLite database file
+            profile: Name of a STORAGE_PROFILES entry, or a dict of PRAGMAs
+            read_pool_size: Maximum number of read-only connections kept open
         """
         self.db_path = db_path
 
+        if isinstance(profile, str):
+            if profile not in self.STORAGE_PROFILES:
+                raise ValueError(f"Unknown storage profile: {profile}")
+            profile = self.STORAGE_PROFILES[profile]
+        self.pragmas = dict(profile)
+
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(db_path)
+        # Single writer connection; may be driven from a worker thread
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self._apply_pragmas(self.conn, writer=True)
         self._create_tables()
 
+        # Read-only connections, opened lazily and reused
+        self.read_pool_size = read_pool_size
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._in_memory = db_path == ':memory:'
+
+    def _apply_pragmas(self, conn: sqlite3.Connection, writer: bool):
+        """Apply the storage profile to a connection.
+
+        Args:
+            conn: Connection to configure
+            writer: Whether this is the writer connection
+        """
+        for name, value in self.pragmas.items():
+            if not writer and name in self.WRITER_ONLY_PRAGMAS:
+                continue
+            conn.execute(f"PRAGMA {name} = {value}").fetchall()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a new read-only connection to the database file."""
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn, writer=False)
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool.
+
+        Waits for a free connection once read_pool_size are in use. Uses
+        the writer connection for in-memory databases, which cannot be
+        shared across connections.
+        """
+        if self._in_memory or self.read_pool_size <= 0:
+            yield self.conn
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_lock:
+                can_open = self._reader_count < self.read_pool_size
+                if can_open:
+                    self._reader_count += 1
+            conn = self._open_reader() if can_open else self._readers.get()
+
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
     def _create_tables(self):
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -46,10 +139,16 @@ class JobDatabase:
                 last_seen TEXT NOT NULL,
                 scrape_count INTEGER DEFAULT 1,
                 is_active INTEGER DEFAULT 1,
-                metadata TEXT
+                metadata TEXT,
+                duplicate_of TEXT
             )
         """)
 
+        # Databases created before duplicate marking lack the column
+        columns = [row['name'] for row in cursor.execute("PRAGMA table_info(jobs)")]
+        if 'duplicate_of' not in columns:
+            cursor.execute("ALTER TABLE jobs ADD COLUMN duplicate_of TEXT")
+
         # Create indexes for faster queries
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs(url)
@@ -60,6 +159,12 @@ class JobDatabase:
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_jobs_is_active ON jobs(is_active)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_company_active ON jobs(company, is_active)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_active_duplicate ON jobs(is_active, duplicate_of)
+        """)
 
         # Scrape runs table - tracks each scraping session
         cursor.execute("""
@@ -77,6 +182,19 @@ class JobDatabase:
             )
         """)
 
+        # Normalized dedup features per job, valid while content_hash matches
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_features (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                company TEXT NOT NULL,
+                title TEXT NOT NULL,
+                location TEXT NOT NULL,
+                key_terms TEXT NOT NULL,
+                seniority INTEGER
+            ) WITHOUT ROWID
+        """)
+
         self.conn.commit()
 
     def start_scrape_run(self) -> int:
@@ -195,6 +313,132 @@ class JobDatabase:
             else:
                 return ('unchanged', False)
 
+    def upsert_jobs(self, jobs: List[Dict]) -> Dict[str, int]:
+        """Insert or update a batch of jobs in a single transaction.
+
+        Diffs the whole batch against the table with one lookup per chunk of
+        URLs, then writes every row with one executemany upsert. Classification
+        matches calling upsert_job once per job in order, including repeated
+        URLs within the batch.
+
+        Args:
+            jobs: List of job dictionaries (same shape as upsert_job)
+
+        Returns:
+            Dictionary with 'new', 'updated' and 'unchanged' counts
+        """
+        counts = {'new': 0, 'updated': 0, 'unchanged': 0}
+        if not jobs:
+            return counts
+
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+
+        # Snapshot existing rows for every URL in the batch
+        urls = list({job['url'] for job in jobs})
+        existing = {}
+        for start in range(0, len(urls), self.MAX_SQL_PARAMS):
+            chunk = urls[start:start + self.MAX_SQL_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f"""
+                SELECT url, title, location, is_active
+                FROM jobs
+                WHERE url IN ({placeholders})
+            """, chunk)
+            for row in cursor.fetchall():
+                existing[row['url']] = (row['title'], row['location'], row['is_active'])
+
+        # Classify in order, tracking state so repeated URLs behave sequentially
+        rows = []
+        for job in jobs:
+            location = job.get('location')
+            previous = existing.get(job['url'])
+
+            if previous is None:
+                counts['new'] += 1
+            elif (previous[0] != job['title'] or
+                  previous[1] != location or
+                  previous[2] != 1):
+                counts['updated'] += 1
+            else:
+                counts['unchanged'] += 1
+
+            existing[job['url']] = (job['title'], location, 1)
+            rows.append((
+                job['url'],
+                job['company'],
+                job['title'],
+                location,
+                job.get('job_id'),
+                now,
+                now,
+                json.dumps(job.get('metadata', {}))
+            ))
+
+        try:
+            cursor.executemany("""
+                INSERT INTO jobs (url, company, title, location, job_id,
+                                first_seen, last_seen, scrape_count, is_active, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, 1, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    last_seen = excluded.last_seen,
+                    scrape_count = jobs.scrape_count + 1,
+                    is_active = 1,
+                    title = excluded.title,
+                    location = excluded.location,
+                    job_id = excluded.job_id,
+                    metadata = excluded.metadata
+            """, rows)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return counts
+
+    def touch_jobs(self, urls: List[str]) -> Set[str]:
+        """Refresh last_seen for active jobs that were seen again unchanged.
+
+        Used when a listing page is known not to have changed, so its jobs
+        need no diff or rewrite.
+
+        Args:
+            urls: Job URLs from the unchanged page
+
+        Returns:
+            Set of URLs touched (URLs missing or inactive are skipped)
+        """
+        if not urls:
+            return set()
+
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        urls = list(dict.fromkeys(urls))
+
+        try:
+            touched = set()
+            for start in range(0, len(urls), self.MAX_SQL_PARAMS):
+                chunk = urls[start:start + self.MAX_SQL_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT url FROM jobs
+                    WHERE url IN ({placeholders}) AND is_active = 1
+                """, chunk)
+                touched.update(row[0] for row in cursor.fetchall())
+
+            cursor.executemany("""
+                UPDATE jobs
+                SET last_seen = ?,
+                    scrape_count = scrape_count + 1
+                WHERE url = ?
+            """, ((now, url) for url in urls if url in touched))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return touched
+
     def mark_inactive_jobs(self, active_urls: List[str], company: str = None) -> int:
         """Mark jobs as inactive if they weren't seen in the latest scrape.
 
@@ -207,69 +451,108 @@ class JobDatabase:
         """
         cursor = self.conn.cursor()
 
-        if not active_urls:
-            # If no jobs found, mark all as inactive for this company
-            if company:
-                cursor.execute("""
-                    UPDATE jobs
-                    SET is_active = 0
-                    WHERE company = ? AND is_active = 1
-                """, (company,))
+        try:
+            if not active_urls:
+                # If no jobs found, mark all as inactive for this company
+                if company:
+                    cursor.execute("""
+                        UPDATE jobs
+                        SET is_active = 0
+                        WHERE company = ? AND is_active = 1
+                    """, (company,))
+                else:
+                    cursor.execute("""
+                        UPDATE jobs
+                        SET is_active = 0
+                        WHERE is_active = 1
+                    """)
             else:
+                # Load seen URLs into a temp table and deactivate with an
+                # anti-join, so the statement count is fixed however many
+                # URLs a tenant has (no host-parameter limit, no NOT IN list)
                 cursor.execute("""
-                    UPDATE jobs
-                    SET is_active = 0
-                    WHERE is_active = 1
+                    CREATE TEMP TABLE IF NOT EXISTS seen_urls (
+                        url TEXT PRIMARY KEY
+                    ) WITHOUT ROWID
                 """)
-        else:
-            # Mark jobs not in active_urls as inactive
-            placeholders = ','.join('?' * len(active_urls))
-            if company:
-                cursor.execute(f"""
-                    UPDATE jobs
-                    SET is_active = 0
-                    WHERE company = ? AND url NOT IN ({placeholders}) AND is_active = 1
-                """, [company] + active_urls)
-            else:
-                cursor.execute(f"""
-                    UPDATE jobs
-                    SET is_active = 0
-                    WHERE url NOT IN ({placeholders}) AND is_active = 1
-                """, active_urls)
+                cursor.execute("DELETE FROM temp.seen_urls")
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO temp.seen_urls (url) VALUES (?)",
+                    ((url,) for url in active_urls)
+                )
+
+                if company:
+                    cursor.execute("""
+                        UPDATE jobs
+                        SET is_active = 0
+                        WHERE company = ? AND is_active = 1
+                          AND NOT EXISTS (
+                              SELECT 1 FROM temp.seen_urls s WHERE s.url = jobs.url
+                          )
+                    """, (company,))
+                else:
+                    cursor.execute("""
+                        UPDATE jobs
+                        SET is_active = 0
+                        WHERE is_active = 1
+                          AND NOT EXISTS (
+                              SELECT 1 FROM temp.seen_urls s WHERE s.url = jobs.url
+                          )
+                    """)
+
+            affected = cursor.rowcount
+            if active_urls:
+                cursor.execute("DELETE FROM temp.seen_urls")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            if active_urls:
+                # Leave no seen URLs behind for the next statement on this
+                # shared connection
+                try:
+                    self.conn.execute("DELETE FROM temp.seen_urls")
+                    self.conn.commit()
+                except sqlite3.Error:
+                    pass
+            raise
 
-        affected = cursor.rowcount
-        self.conn.commit()
         return affected
 
-    def get_active_jobs(self, company: str = None) -> List[Dict]:
+    def get_active_jobs(self, company: str = None,
+                        include_duplicates: bool = True) -> List[Dict]:
         """Get all active jobs, optionally filtered by company.
 
         Args:
             company: Optional company name to filter by
+            include_duplicates: Also return jobs marked as a duplicate of
+                another (see mark_duplicates)
 
         Returns:
             List of job dictionaries
         """
-        cursor = self.conn.cursor()
+        duplicate_filter = "" if include_duplicates else "AND duplicate_of IS NULL"
 
-        if company:
-            cursor.execute("""
-                SELECT url, company, title, location, job_id,
-                       first_seen, last_seen, scrape_count
-                FROM jobs
-                WHERE is_active = 1 AND company = ?
-                ORDER BY company, title
-            """, (company,))
-        else:
-            cursor.execute("""
-                SELECT url, company, title, location, job_id,
-                       first_seen, last_seen, scrape_count
-                FROM jobs
-                WHERE is_active = 1
-                ORDER BY company, title
-            """)
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        return [dict(row) for row in cursor.fetchall()]
+            if company:
+                cursor.execute(f"""
+                    SELECT url, company, title, location, job_id,
+                           first_seen, last_seen, scrape_count, duplicate_of
+                    FROM jobs
+                    WHERE is_active = 1 AND company = ? {duplicate_filter}
+                    ORDER BY company, title
+                """, (company,))
+            else:
+                cursor.execute(f"""
+                    SELECT url, company, title, location, job_id,
+                           first_seen, last_seen, scrape_count, duplicate_of
+                    FROM jobs
+                    WHERE is_active = 1 {duplicate_filter}
+                    ORDER BY company, title
+                """)
+
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_all_jobs(self, include_inactive: bool = False) -> List[Dict]:
         """Get all jobs from the database.
@@ -280,25 +563,132 @@ class JobDatabase:
         Returns:
             List of job dictionaries
         """
-        cursor = self.conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            if include_inactive:
+                cursor.execute("""
+                    SELECT url, company, title, location, job_id,
+                           first_seen, last_seen, scrape_count, is_active
+                    FROM jobs
+                    ORDER BY company, title
+                """)
+            else:
+                cursor.execute("""
+                    SELECT url, company, title, location, job_id,
+                           first_seen, last_seen, scrape_count
+                    FROM jobs
+                    WHERE is_active = 1
+                    ORDER BY company, title
+                """)
 
-        if include_inactive:
+            return [dict(row) for row in cursor.fetchall()]
+
+    def mark_duplicates(self, duplicate_of: Dict[str, str]) -> int:
+        """Record which jobs duplicate which canonical job.
+
+        Replaces the previous marking in one pass: jobs in the mapping
+        point at their canonical URL, every other job is cleared.
+
+        Args:
+            duplicate_of: Dictionary mapping duplicate URL to canonical URL
+
+        Returns:
+            Number of jobs whose marking changed
+        """
+        cursor = self.conn.cursor()
+        try:
             cursor.execute("""
-                SELECT url, company, title, location, job_id,
-                       first_seen, last_seen, scrape_count, is_active
-                FROM jobs
-                ORDER BY company, title
+                CREATE TEMP TABLE IF NOT EXISTS duplicate_marks (
+                    url TEXT PRIMARY KEY,
+                    canonical_url TEXT NOT NULL
+                ) WITHOUT ROWID
             """)
-        else:
+            cursor.execute("DELETE FROM temp.duplicate_marks")
+            cursor.executemany(
+                "INSERT OR REPLACE INTO temp.duplicate_marks (url, canonical_url) VALUES (?, ?)",
+                duplicate_of.items()
+            )
+
+            # Only rows whose marking differs are written
             cursor.execute("""
-                SELECT url, company, title, location, job_id,
-                       first_seen, last_seen, scrape_count
-                FROM jobs
-                WHERE is_active = 1
-                ORDER BY company, title
+                UPDATE jobs
+                SET duplicate_of = (
+                    SELECT canonical_url FROM temp.duplicate_marks d WHERE d.url = jobs.url
+                )
+                WHERE (duplicate_of IS NOT NULL OR url IN (SELECT url FROM temp.duplicate_marks))
+                  AND duplicate_of IS NOT (
+                      SELECT canonical_url FROM temp.duplicate_marks d WHERE d.url = jobs.url
+                  )
             """)
+            changed = cursor.rowcount
+            cursor.execute("DELETE FROM temp.duplicate_marks")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return changed
+
+    def get_job_features(self, urls: List[str]) -> Dict[str, Dict]:
+        """Look up cached dedup features for a batch of jobs.
 
-        return [dict(row) for row in cursor.fetchall()]
+        Args:
+            urls: Job URLs
+
+        Returns:
+            Dictionary mapping URL to its feature row (content_hash, company,
+            title, location, key_terms, seniority); URLs without a row are
+            left out
+        """
+        features = {}
+        urls = list(set(urls))
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(urls), self.MAX_SQL_PARAMS):
+                chunk = urls[start:start + self.MAX_SQL_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT url, content_hash, company, title, location,
+                           key_terms, seniority
+                    FROM job_features
+                    WHERE url IN ({placeholders})
+                """, chunk)
+                for row in cursor.fetchall():
+                    features[row['url']] = dict(row)
+        return features
+
+    def save_job_features(self, rows: List[Tuple]) -> int:
+        """Store dedup features, replacing any older row for the same URL.
+
+        Args:
+            rows: Tuples of (url, content_hash, company, title, location,
+                key_terms, seniority)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        try:
+            self.conn.executemany("""
+                INSERT INTO job_features (url, content_hash, company, title,
+                                          location, key_terms, seniority)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    company = excluded.company,
+                    title = excluded.title,
+                    location = excluded.location,
+                    key_terms = excluded.key_terms,
+                    seniority = excluded.seniority
+            """, rows)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(rows)
 
     def get_recent_runs(self, limit: int = 10) -> List[Dict]:
         """Get recent scrape runs with statistics.
@@ -309,17 +699,18 @@ class JobDatabase:
         Returns:
             List of scrape run dictionaries
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT id, started_at, completed_at, sites_scraped,
-                   jobs_found, jobs_new, jobs_updated, jobs_deactivated,
-                   status, error_message
-            FROM scrape_runs
-            ORDER BY started_at DESC
-            LIMIT ?
-        """, (limit,))
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, started_at, completed_at, sites_scraped,
+                       jobs_found, jobs_new, jobs_updated, jobs_deactivated,
+                       status, error_message
+                FROM scrape_runs
+                ORDER BY started_at DESC
+                LIMIT ?
+            """, (limit,))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_stats(self) -> Dict:
         """Get overall database statistics.
@@ -327,54 +718,61 @@ class JobDatabase:
         Returns:
             Dictionary with statistics
         """
-        cursor = self.conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        # Total jobs
-        cursor.execute("SELECT COUNT(*) as total FROM jobs")
-        total_jobs = cursor.fetchone()['total']
+            # Total jobs
+            cursor.execute("SELECT COUNT(*) as total FROM jobs")
+            total_jobs = cursor.fetchone()['total']
 
-        # Active jobs
-        cursor.execute("SELECT COUNT(*) as active FROM jobs WHERE is_active = 1")
-        active_jobs = cursor.fetchone()['active']
+            # Active jobs
+            cursor.execute("SELECT COUNT(*) as active FROM jobs WHERE is_active = 1")
+            active_jobs = cursor.fetchone()['active']
 
-        # Inactive jobs
-        inactive_jobs = total_jobs - active_jobs
+            # Inactive jobs
+            inactive_jobs = total_jobs - active_jobs
 
-        # Jobs by company
-        cursor.execute("""
-            SELECT company, COUNT(*) as count
-            FROM jobs
-            WHERE is_active = 1
-            GROUP BY company
-            ORDER BY count DESC
-        """)
-        jobs_by_company = {row['company']: row['count'] for row in cursor.fetchall()}
+            # Jobs by company
+            cursor.execute("""
+                SELECT company, COUNT(*) as count
+                FROM jobs
+                WHERE is_active = 1
+                GROUP BY company
+                ORDER BY count DESC
+            """)
+            jobs_by_company = {row['company']: row['count'] for row in cursor.fetchall()}
 
-        # Total scrape runs
-        cursor.execute("SELECT COUNT(*) as runs FROM scrape_runs")
-        total_runs = cursor.fetchone()['runs']
+            # Total scrape runs
+            cursor.execute("SELECT COUNT(*) as runs FROM scrape_runs")
+            total_runs = cursor.fetchone()['runs']
 
-        # Last scrape run
-        cursor.execute("""
-            SELECT started_at, jobs_new, jobs_updated, jobs_deactivated
-            FROM scrape_runs
-            WHERE status = 'completed'
-            ORDER BY started_at DESC
-            LIMIT 1
-        """)
-        last_run = cursor.fetchone()
-
-        return {
-            'total_jobs': total_jobs,
-            'active_jobs': active_jobs,
-            'inactive_jobs': inactive_jobs,
-            'jobs_by_company': jobs_by_company,
-            'total_scrape_runs': total_runs,
-            'last_run': dict(last_run) if last_run else None
-        }
+            # Last scrape run
+            cursor.execute("""
+                SELECT started_at, jobs_new, jobs_updated, jobs_deactivated
+                FROM scrape_runs
+                WHERE status = 'completed'
+                ORDER BY started_at DESC
+                LIMIT 1
+            """)
+            last_run = cursor.fetchone()
+
+            return {
+                'total_jobs': total_jobs,
+                'active_jobs': active_jobs,
+                'inactive_jobs': inactive_jobs,
+                'jobs_by_company': jobs_by_company,
+                'total_scrape_runs': total_runs,
+                'last_run': dict(last_run) if last_run else None
+            }
 
     def close(self):
-        """Close the database connection."""
+        """Close the writer and any pooled read-only connections."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        self._reader_count = 0
         self.conn.close()
 
     def __enter__(self):
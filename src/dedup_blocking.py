@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Candidate generation (blocking) for fuzzy deduplication.
+Instead of scoring every pair of jobs within a company, jobs are indexed
+by a few blocking keys and only pairs that share a key - and that pass
+cheap upper bounds on the similarity - are handed to the full scorer.
+
+Keys per job:
+  - the exact normalized title
+  - a prefix of its key terms in rarest-first order, sized so that any
+    pair whose key-term Jaccard reaches the title threshold shares one
+    (prefix filtering: lossless for the Jaccard branch)
+  - its rarest few title words, which catches reworded and abbreviated
+    titles for the SequenceMatcher branch (approximate; recall is
+    checked against the exhaustive comparison in the tests)
+"""
+
+import bisect
+import math
+import re
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def title_words(f) -> Set[str]:
+    """Distinct words of a job's lowercased title."""
+    return set(WORD_PATTERN.findall(f.title_key))
+
+
+def block_keys(f) -> List[Tuple[str, str]]:
+    """Every key a job can be found under: title, key terms and title words."""
+    if not (f.title_key and f.location_key):
+        return []
+    keys = [('title', f.title_key)]
+    keys.extend(('term', term) for term in sorted(f.key_terms))
+    keys.extend(('word', word) for word in sorted(title_words(f)))
+    return keys
+
+
+def select_keys(f, frequency: Mapping[Tuple[str, str], int], title_threshold: float,
+                block_words: int = 3) -> List[Tuple[str, str]]:
+    """The keys a job is looked up by.
+
+    Args:
+        f: Job features (title_key, location_key and key_terms attributes)
+        frequency: Number of jobs per ('term', t) and ('word', w) key
+        title_threshold: Minimum title score for a duplicate
+        block_words: Rarest title words to use
+
+    Returns:
+        The exact title, the rarest-first key-term prefix and the rarest
+        title words; no keys for jobs without a title or location, which
+        can never match anything
+    """
+    if not (f.title_key and f.location_key):
+        return []
+    keys = [('title', f.title_key)]
+
+    terms = sorted(f.key_terms, key=lambda t: (frequency.get(('term', t), 0), t))
+    prefix = len(terms) - math.ceil(title_threshold * len(terms)) + 1
+    keys.extend(('term', term) for term in terms[:prefix])
+
+    rare = sorted(title_words(f), key=lambda w: (frequency.get(('word', w), 0), w))
+    keys.extend(('word', word) for word in rare[:block_words])
+    return keys
+
+
+def plausible(f1, f2, title_threshold: float,
+              location_compatible: Callable[[str, str], bool]) -> bool:
+    """Cheap upper bounds: can this pair reach the thresholds at all?"""
+    if not location_compatible(f1.location_key, f2.location_key):
+        return False
+
+    # SequenceMatcher ratio <= 2 * min(len) / total length
+    shorter, longer = sorted((len(f1.title_key), len(f2.title_key)))
+    ratio_bound = 2.0 * shorter / (shorter + longer)
+
+    # Jaccard <= smaller set / larger set
+    small, large = sorted((len(f1.key_terms), len(f2.key_terms)))
+    jaccard_bound = small / large if large else 0.0
+
+    return max(ratio_bound, jaccard_bound) >= title_threshold
+
+
+class CandidateIndex:
+    """Inverted index over one company's jobs that proposes likely pairs."""
+
+    def __init__(self, features: Sequence, title_threshold: float,
+                 location_compatible: Callable[[str, str], bool],
+                 block_words: int = 3,
+                 keys: Optional[List[List[Tuple[str, str]]]] = None):
+        """Build the index.
+
+        Args:
+            features: Per-job features with title_key, location_key and
+                key_terms attributes (see FuzzyDeduplicator.extract_features)
+            title_threshold: Minimum title score for a duplicate
+            location_compatible: Whether two location keys can ever be
+                similar enough for a duplicate
+            block_words: Rarest title words used as keys per job
+            keys: Lookup keys per job, already selected (e.g. by the index
+                of a whole company, for a slice of its jobs); selected
+                from features if omitted
+        """
+        self.features = features
+        self.title_threshold = title_threshold
+        self.location_compatible = location_compatible
+        self.block_words = block_words
+
+        if keys is None:
+            frequency = defaultdict(int)
+            for f in features:
+                for word in title_words(f):
+                    frequency[('word', word)] += 1
+                for term in f.key_terms:
+                    frequency[('term', term)] += 1
+            keys = [select_keys(f, frequency, title_threshold, block_words)
+                    for f in features]
+
+        self.postings: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        self.keys: List[List[Tuple[str, str]]] = keys
+
+        for i, job_keys in enumerate(keys):
+            for key in job_keys:
+                self.postings[key].append(i)
+
+    def candidates(self, i: int) -> List[int]:
+        """Indexes j > i worth scoring against job i, in ascending order."""
+        f = self.features[i]
+        found = set()
+        for key in self.keys[i]:
+            for j in self.postings[key]:
+                if j > i:
+                    found.add(j)
+
+        return [j for j in sorted(found) if self._plausible(f, self.features[j])]
+
+    def partners(self, start: int, stop: int) -> List[int]:
+        """Jobs j > start sharing a key with one of the jobs [start, stop).
+
+        Together with the jobs [start, stop) these are all the jobs
+        candidates() can return for them, in ascending order.
+        """
+        found = set()
+        for i in range(start, stop):
+            for key in self.keys[i]:
+                postings = self.postings[key]
+                found.update(postings[bisect.bisect_right(postings, start):])
+        return sorted(found)
+
+    def _plausible(self, f1, f2) -> bool:
+        return plausible(f1, f2, self.title_threshold, self.location_compatible)
+
+    def pair_count(self) -> int:
+        """Pairs the index proposes (after the plausibility bounds)."""
+        return sum(len(self.candidates(i)) for i in range(len(self.features)))
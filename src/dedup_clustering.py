@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Duplicate clustering for fuzzy deduplication.
+Duplicate pairs are merged with a union-find, so a cluster is everything
+connected by duplicate pairs (A~B and B~C put A, B and C together whatever
+order they are seen in). Each cluster's canonical is its earliest posting:
+smallest first_seen, then URL, so the choice does not depend on input order.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 (union by size, path halving)."""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        """Merge the sets of i and j; False if they were already one."""
+        i, j = self.find(i), self.find(j)
+        if i == j:
+            return False
+        if self.size[i] < self.size[j]:
+            i, j = j, i
+        self.parent[j] = i
+        self.size[i] += self.size[j]
+        return True
+
+    def groups(self) -> List[List[int]]:
+        """Sets with more than one member, each in ascending order."""
+        members: Dict[int, List[int]] = {}
+        for i in range(len(self.parent)):
+            members.setdefault(self.find(i), []).append(i)
+        return [group for group in members.values() if len(group) > 1]
+
+
+def canonical_order(job: Dict) -> Tuple[bool, str, str]:
+    """Sort key putting a cluster's canonical job first.
+
+    Earliest first_seen wins; jobs without one come after dated jobs, and
+    the URL breaks ties.
+    """
+    first_seen: Optional[str] = job.get('first_seen')
+    return (not first_seen, first_seen or '', job.get('url') or '')
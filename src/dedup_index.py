@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Persistent duplicate-cluster index for incremental deduplication.
+Clustering the whole corpus on every run is wasted work when a crawl only
+adds a few dozen jobs. ClusterIndex keeps the outcome in the jobs
+database instead - each job's cluster, each cluster's canonical URL and
+each job's blocking keys - so a run only has to place jobs that are new
+or whose content changed:
+
+  - a new job is looked up by its selected blocking keys (same selection
+    as CandidateIndex, with frequencies from the stored blocks)
+  - it is scored against the jobs found; every cluster it duplicates a
+    member of is merged with it (union-find semantics, as in
+    FuzzyDeduplicator.cluster_duplicates), or it starts a cluster of its own
+  - the canonical of a cluster is its earliest job (canonical_order)
+  - jobs that disappear or change leave the index, and the rest of their
+    cluster is placed again, since the cluster may have been held
+    together by them
+
+Dedup cost therefore follows the number of new and changed jobs, not the
+size of the corpus.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .dedup_blocking import block_keys, plausible, select_keys, title_words
+    from .dedup_clustering import canonical_order
+except ImportError:
+    from dedup_blocking import block_keys, plausible, select_keys, title_words
+    from dedup_clustering import canonical_order
+
+
+def encode_key(key) -> str:
+    """Stored form of a blocking key tuple, e.g. 'term:engineer'."""
+    kind, value = key
+    return f"{kind}:{value}"
+
+
+class ClusterIndex:
+    """Duplicate clusters of the active jobs, stored in SQLite."""
+
+    def __init__(self, db, deduplicator, block_words: int = 3):
+        """Open the index, creating its tables if needed.
+
+        Args:
+            db: JobDatabase holding the jobs (the index lives in the same file)
+            deduplicator: FuzzyDeduplicator providing features and scoring
+            block_words: Rarest title words used as lookup keys per job
+        """
+        self.db = db
+        self.conn = db.conn
+        self.deduplicator = deduplicator
+        self.block_words = block_words
+        self.stats = {'new': 0, 'changed': 0, 'removed': 0, 'replaced': 0,
+                      'pairs_scored': 0}
+
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS dedup_clusters (
+                cluster_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company TEXT NOT NULL,
+                canonical_url TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS dedup_members (
+                url TEXT PRIMARY KEY,
+                cluster_id INTEGER NOT NULL,
+                company TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                score REAL
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_dedup_members_cluster
+                ON dedup_members(cluster_id);
+
+            CREATE TABLE IF NOT EXISTS dedup_blocks (
+                company TEXT NOT NULL,
+                block_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                selected INTEGER NOT NULL,
+                PRIMARY KEY (company, block_key, url)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_dedup_blocks_url ON dedup_blocks(url);
+        """)
+        self.conn.commit()
+
+    def update(self, jobs: List[Dict]) -> Dict[str, int]:
+        """Bring the index in line with the current set of jobs.
+
+        Args:
+            jobs: Every active job (jobs missing from the list leave the
+                index); new jobs are placed in list order
+
+        Returns:
+            Counts for this update: new, changed, removed, replaced (jobs
+            placed again because a job left their cluster) and pairs_scored
+        """
+        stats = dict.fromkeys(self.stats, 0)
+        dedup = self.deduplicator
+
+        by_url = {job['url']: job for job in jobs if job.get('url')}
+        hashes = {url: dedup.content_hash(job) for url, job in by_url.items()}
+        stored = {row['url']: row['content_hash']
+                  for row in self.conn.execute("SELECT url, content_hash FROM dedup_members")}
+
+        gone = [url for url in stored if url not in hashes]
+        changed = [url for url, h in hashes.items() if url in stored and stored[url] != h]
+        stats['removed'] = len(gone)
+        stats['changed'] = len(changed)
+        stats['new'] = sum(1 for url in hashes if url not in stored)
+
+        try:
+            orphans = self._remove(gone + changed)
+            stats['replaced'] = len(orphans)
+
+            pending = set(orphans) | set(changed) | {url for url in hashes if url not in stored}
+            todo = [by_url[url] for url in by_url if url in pending]
+            if todo and not stored:
+                stats['pairs_scored'] += self._bootstrap(todo, hashes)
+            elif todo:
+                features = dict(zip((job['url'] for job in todo), dedup.features_for(todo)))
+                for job in todo:
+                    stats['pairs_scored'] += self._place(job, features[job['url']],
+                                                         hashes[job['url']], by_url)
+
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        for name, value in stats.items():
+            self.stats[name] += value
+        return stats
+
+    def _remove(self, urls: Iterable[str]) -> List[str]:
+        """Drop jobs from the index.
+
+        Returns:
+            URLs of the other members of their clusters; they are dropped
+            too and must be placed again
+        """
+        urls = set(urls)
+        orphans = []
+        for url in sorted(urls):
+            row = self.conn.execute("SELECT cluster_id FROM dedup_members WHERE url = ?",
+                                    (url,)).fetchone()
+            if row is None:
+                continue  # Already dropped with an earlier job's cluster
+
+            members = [r['url'] for r in self.conn.execute(
+                "SELECT url FROM dedup_members WHERE cluster_id = ?", (row['cluster_id'],))]
+            orphans.extend(m for m in members if m not in urls)
+            self.conn.execute("DELETE FROM dedup_clusters WHERE cluster_id = ?",
+                              (row['cluster_id'],))
+            self._delete_members(members)
+
+        return orphans
+
+    def _delete_members(self, urls: List[str]):
+        self.conn.executemany("DELETE FROM dedup_members WHERE url = ?", [(u,) for u in urls])
+        self.conn.executemany("DELETE FROM dedup_blocks WHERE url = ?", [(u,) for u in urls])
+
+    def _bootstrap(self, jobs: List[Dict], hashes: Dict[str, str]) -> int:
+        """Fill an empty index from one batch clustering run.
+
+        Returns:
+            Number of pairs scored
+        """
+        dedup = self.deduplicator
+        features = dedup.features_for(jobs)
+        pairs_before = dedup.stats['pairs_scored']
+        groups, best = dedup._clusters(jobs)
+
+        # Key frequencies per company, as CandidateIndex counts them
+        frequency = defaultdict(lambda: defaultdict(int))
+        for f in features:
+            for word in title_words(f):
+                frequency[f.company][('word', word)] += 1
+            for term in f.key_terms:
+                frequency[f.company][('term', term)] += 1
+
+        canonical = {}
+        for group in groups:
+            for i in group:
+                canonical[i] = group[0]
+
+        clusters = {}
+        for i, (job, f) in enumerate(zip(jobs, features)):
+            head = canonical.get(i, i)
+            if head not in clusters:
+                clusters[head] = self.conn.execute(
+                    "INSERT INTO dedup_clusters (company, canonical_url) VALUES (?, ?)",
+                    (f.company, jobs[head]['url'])
+                ).lastrowid
+            selected = select_keys(f, frequency[f.company], dedup.title_threshold,
+                                   self.block_words)
+            self._insert(job['url'], f, clusters[head], hashes[job['url']],
+                         best.get(i), selected)
+
+        return dedup.stats['pairs_scored'] - pairs_before
+
+    def _insert(self, url: str, features, cluster_id: int, content_hash: str,
+                score: Optional[float], selected: List):
+        self.conn.execute("""
+            INSERT INTO dedup_members (url, cluster_id, company, content_hash, score)
+            VALUES (?, ?, ?, ?, ?)
+        """, (url, cluster_id, features.company, content_hash, score))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO dedup_blocks (company, block_key, url, selected) "
+            "VALUES (?, ?, ?, ?)",
+            [(features.company, encode_key(key), url, int(key in selected))
+             for key in block_keys(features)]
+        )
+
+    def _place(self, job: Dict, features, content_hash: str, by_url: Dict[str, Dict]) -> int:
+        """Add one job to the clusters it duplicates, or a new cluster.
+
+        Returns:
+            Number of jobs it was scored against
+        """
+        dedup = self.deduplicator
+        url = job['url']
+        company = features.company
+        keys = block_keys(features)
+        selected = []
+        scored = 0
+        linked = {}     # cluster_id -> canonical URL
+        best = None
+
+        if keys:
+            placeholders = ','.join('?' * len(keys))
+            frequency = defaultdict(int)
+            for row in self.conn.execute(f"""
+                SELECT block_key, COUNT(*) AS n FROM dedup_blocks
+                WHERE company = ? AND block_key IN ({placeholders})
+                GROUP BY block_key
+            """, [company] + [encode_key(k) for k in keys]):
+                kind, value = row['block_key'].split(':', 1)
+                frequency[(kind, value)] = row['n']
+
+            selected = select_keys(features, frequency, dedup.title_threshold, self.block_words)
+            lookup = [encode_key(k) for k in selected]
+            placeholders = ','.join('?' * len(lookup))
+            rows = self.conn.execute(f"""
+                SELECT DISTINCT m.url, m.cluster_id, c.canonical_url
+                FROM dedup_blocks b
+                JOIN dedup_members m ON m.url = b.url
+                JOIN dedup_clusters c ON c.cluster_id = m.cluster_id
+                WHERE b.company = ? AND b.block_key IN ({placeholders}) AND b.selected = 1
+                ORDER BY m.url
+            """, [company] + lookup).fetchall()
+
+            others = dedup.features_for([by_url[row['url']] for row in rows])
+            for row, other in zip(rows, others):
+                if not plausible(other, features, dedup.title_threshold,
+                                 dedup.location_compatible):
+                    continue
+                scored += 1
+                is_dup, score, _ = dedup.score_features(other, features)
+                if is_dup:
+                    linked[row['cluster_id']] = row['canonical_url']
+                    best = score if best is None else max(best, score)
+                    self.conn.execute(
+                        "UPDATE dedup_members SET score = MAX(COALESCE(score, ?), ?) WHERE url = ?",
+                        (score, score, row['url'])
+                    )
+
+        if not linked:
+            cluster_id = self.conn.execute(
+                "INSERT INTO dedup_clusters (company, canonical_url) VALUES (?, ?)",
+                (company, url)
+            ).lastrowid
+        else:
+            # Merge every linked cluster into the oldest one
+            cluster_id, *merged = sorted(linked)
+            for other_id in merged:
+                self.conn.execute("UPDATE dedup_members SET cluster_id = ? WHERE cluster_id = ?",
+                                  (cluster_id, other_id))
+                self.conn.execute("DELETE FROM dedup_clusters WHERE cluster_id = ?", (other_id,))
+            canonical = min([job] + [by_url[u] for u in linked.values()], key=canonical_order)
+            self.conn.execute("UPDATE dedup_clusters SET canonical_url = ? WHERE cluster_id = ?",
+                              (canonical['url'], cluster_id))
+
+        self._insert(url, features, cluster_id, content_hash, best, selected)
+        return scored
+
+    def duplicates(self, jobs: List[Dict]) -> Dict[str, List[Dict]]:
+        """Duplicate clusters in the shape cluster_duplicates() returns.
+
+        Args:
+            jobs: Jobs to report on (normally those passed to update())
+
+        Returns:
+            Dictionary mapping canonical URL to [canonical job, duplicates...],
+            in canonical order; duplicates carry '_similarity_score'
+        """
+        by_url = {job['url']: job for job in jobs if job.get('url')}
+        groups: Dict[str, List[Dict]] = {}
+
+        for row in self.conn.execute("""
+            SELECT c.canonical_url, m.url, m.score
+            FROM dedup_members m JOIN dedup_clusters c ON c.cluster_id = m.cluster_id
+            WHERE m.url != c.canonical_url
+        """):
+            canonical = by_url.get(row['canonical_url'])
+            duplicate = by_url.get(row['url'])
+            if canonical is None or duplicate is None:
+                continue
+            group = groups.setdefault(row['canonical_url'], [canonical])
+            group.append({**duplicate, '_similarity_score': row['score']})
+
+        for group in groups.values():
+            group[1:] = sorted(group[1:], key=canonical_order)
+        return dict(sorted(groups.items(), key=lambda item: canonical_order(item[1][0])))
+
+    def duplicate_map(self) -> Dict[str, str]:
+        """Every indexed duplicate mapped to its cluster's canonical URL."""
+        return {row['url']: row['canonical_url'] for row in self.conn.execute("""
+            SELECT m.url, c.canonical_url
+            FROM dedup_members m JOIN dedup_clusters c ON c.cluster_id = m.cluster_id
+            WHERE m.url != c.canonical_url
+        """)}
+
+    def cluster_of(self, url: str) -> Optional[Dict]:
+        """Cluster id and canonical URL of a job, or None if not indexed."""
+        row = self.conn.execute("""
+            SELECT c.cluster_id, c.canonical_url
+            FROM dedup_members m JOIN dedup_clusters c ON c.cluster_id = m.cluster_id
+            WHERE m.url = ?
+        """, (url,)).fetchone()
+        return dict(row) if row else None
+
+    def rebuild(self, jobs: List[Dict]) -> Dict[str, int]:
+        """Drop the whole index and place every job again.
+
+        Needed after changing the deduplicator's thresholds, which the
+        stored clusters were built with.
+        """
+        self.conn.executescript("""
+            DELETE FROM dedup_blocks;
+            DELETE FROM dedup_members;
+            DELETE FROM dedup_clusters;
+        """)
+        self.conn.commit()
+        return self.update(jobs)
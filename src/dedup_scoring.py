@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Batched similarity scoring for fuzzy deduplication.
+FuzzyDeduplicator.score_features() scores one pair of jobs at a time.
+BatchScorer takes arrays of candidate pairs over one list of JobFeatures
+and fills in the same scores for all of them at once:
+
+  - key-term Jaccard from per-job term bitsets (AND + popcount in NumPy)
+  - location scores once per distinct pair of locations
+  - title SequenceMatcher ratios once per distinct pair of titles and,
+    when pruning, only for pairs whose character-count upper bound
+    (SequenceMatcher.quick_ratio) can still reach the thresholds
+
+Scores are bit-for-bit those of score_features(); pruning only leaves out
+the scores of pairs that cannot be duplicates.
+"""
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Set bits per byte value
+POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.int32)
+
+# Score arrays returned by BatchScorer.score, in score_features() detail order
+SCORE_FIELDS = ('title_similarity', 'terms_similarity', 'title_score',
+                'location_score', 'combined_score')
+
+
+def _ids(values: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """Dense integer id per value, plus the distinct values by id."""
+    index = {}
+    ids = np.fromiter((index.setdefault(value, len(index)) for value in values),
+                      dtype=np.intp, count=len(values))
+    return ids, list(index)
+
+
+class BatchScorer:
+    """Scores many candidate pairs of one list of jobs in bulk."""
+
+    def __init__(self, dedup, features: Sequence):
+        """Encode the jobs' features as arrays.
+
+        Args:
+            dedup: FuzzyDeduplicator whose thresholds and string
+                similarities are used
+            features: JobFeatures of the jobs (pairs index into this list)
+        """
+        self.dedup = dedup
+        self.features = features
+
+        self.company_id, _ = _ids([f.company for f in features])
+        self.title_id, self.titles = _ids([f.title for f in features])
+        self.location_id, self.locations = _ids([f.location for f in features])
+
+        # Key terms as bitsets: Jaccard = popcount(a & b) / popcount(a | b)
+        vocabulary = {}
+        for f in features:
+            for term in f.key_terms:
+                vocabulary.setdefault(term, len(vocabulary))
+        self.term_bits = np.zeros((len(features), max(1, (len(vocabulary) + 7) // 8)),
+                                  dtype=np.uint8)
+        for i, f in enumerate(features):
+            for term in f.key_terms:
+                bit = vocabulary[term]
+                self.term_bits[i, bit >> 3] |= 1 << (bit & 7)
+        self.term_count = POPCOUNT[self.term_bits].sum(axis=1)
+
+        # Character counts per distinct title, for the quick_ratio bound
+        lowered = [title.lower() for title in self.titles]
+        alphabet = {}
+        for title in lowered:
+            for char in title:
+                alphabet.setdefault(char, len(alphabet))
+        self.title_chars = np.zeros((len(lowered), max(1, len(alphabet))), dtype=np.int32)
+        for t, title in enumerate(lowered):
+            for char in title:
+                self.title_chars[t, alphabet[char]] += 1
+        self.title_length = np.array([len(title) for title in lowered], dtype=np.int64)
+
+        self._title_ratios: Dict[Tuple[int, int], float] = {}
+        self._location_scores: Dict[Tuple[int, int], float] = {}
+
+    def score(self, left: Sequence[int], right: Sequence[int],
+              prune: bool = False) -> Dict[str, np.ndarray]:
+        """Score pairs (left[k], right[k]).
+
+        Args:
+            left: Index of the first job of each pair
+            right: Index of the second job of each pair
+            prune: Skip the title ratio of pairs that cannot be duplicates;
+                their title_similarity, title_score and combined_score are NaN
+
+        Returns:
+            Dictionary of float arrays (SCORE_FIELDS) plus a boolean
+            'is_duplicate' array; pairs from different companies score 0
+        """
+        left = np.asarray(left, dtype=np.intp)
+        right = np.asarray(right, dtype=np.intp)
+        dedup = self.dedup
+
+        same = self.company_id[left] == self.company_id[right]
+        terms = self._jaccard(left, right)
+        location = self._distinct_scores(self.location_id[left], self.location_id[right],
+                                         self.locations, self._location_scores,
+                                         dedup.location_similarity)
+
+        title_left, title_right = self.title_id[left], self.title_id[right]
+        todo = same
+        if prune:
+            bound = np.maximum(self._quick_ratio(title_left, title_right), terms)
+            todo = (same & (bound >= dedup.title_threshold)
+                    & (location >= dedup.location_threshold)
+                    & (0.7 * bound + 0.3 * location >= dedup.combined_threshold))
+
+        title = np.full(len(left), np.nan)
+        title[todo] = self._distinct_scores(title_left[todo], title_right[todo],
+                                            self.titles, self._title_ratios,
+                                            dedup.compute_similarity)
+
+        title_score = np.maximum(title, terms)
+        combined = 0.7 * title_score + 0.3 * location
+        with np.errstate(invalid='ignore'):
+            is_duplicate = (todo & (title_score >= dedup.title_threshold)
+                            & (location >= dedup.location_threshold)
+                            & (combined >= dedup.combined_threshold))
+
+        scores = {
+            'title_similarity': title,
+            'terms_similarity': terms,
+            'title_score': title_score,
+            'location_score': location,
+            'combined_score': combined,
+        }
+        for field in SCORE_FIELDS:
+            scores[field][~same] = 0.0
+        scores['is_duplicate'] = is_duplicate
+        return scores
+
+    def _jaccard(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        intersection = POPCOUNT[self.term_bits[left] & self.term_bits[right]].sum(axis=1)
+        union = self.term_count[left] + self.term_count[right] - intersection
+        both = (self.term_count[left] > 0) & (self.term_count[right] > 0)
+        jaccard = np.zeros(len(left))
+        np.divide(intersection, union, out=jaccard, where=both & (union > 0))
+        return jaccard
+
+    def _quick_ratio(self, title_left: np.ndarray, title_right: np.ndarray) -> np.ndarray:
+        """Upper bound of the title ratio from shared character counts."""
+        pairs, inverse = np.unique(title_left * len(self.titles) + title_right,
+                                   return_inverse=True)
+        a, b = pairs // len(self.titles), pairs % len(self.titles)
+        common = np.minimum(self.title_chars[a], self.title_chars[b]).sum(axis=1)
+        total = self.title_length[a] + self.title_length[b]
+        bound = np.zeros(len(pairs))
+        np.divide(2.0 * common, total, out=bound,
+                  where=(self.title_length[a] > 0) & (self.title_length[b] > 0))
+        return bound[inverse.ravel()]
+
+    @staticmethod
+    def _distinct_scores(ids_left: np.ndarray, ids_right: np.ndarray, values: List[str],
+                         memo: Dict[Tuple[int, int], float],
+                         similarity: Callable[[str, str], float]) -> np.ndarray:
+        """Call similarity once per distinct (ordered) pair of values."""
+        if not len(ids_left):
+            return np.zeros(0)
+        pairs, inverse = np.unique(ids_left * len(values) + ids_right, return_inverse=True)
+        scores = np.empty(len(pairs))
+        for n, code in enumerate(pairs.tolist()):
+            key = divmod(code, len(values))
+            if key not in memo:
+                memo[key] = similarity(values[key[0]], values[key[1]])
+            scores[n] = memo[key]
+        return scores[inverse.ravel()]
@@ -4,14 +4,37 @@ Fuzzy deduplication engine for job postings.
 Uses normalized text and similarity metrics to detect duplicates.
 """
 
-from typing import List, Dict, Set, Tuple, Optional
+from typing import FrozenSet, Iterable, List, Dict, NamedTuple, Set, Tuple, Optional
 from collections import defaultdict
 import difflib
+import hashlib
+import sys
 
 try:
     from .normalizer import TextNormalizer
+    from .dedup_blocking import CandidateIndex
+    from .dedup_scoring import BatchScorer
+    from .dedup_clustering import UnionFind, canonical_order
 except ImportError:
     from normalizer import TextNormalizer
+    from dedup_blocking import CandidateIndex
+    from dedup_scoring import BatchScorer
+    from dedup_clustering import UnionFind, canonical_order
+
+
+# Bump when normalization rules change so cached features are recomputed
+FEATURE_VERSION = 1
+
+
+class JobFeatures(NamedTuple):
+    """Normalized fields of one job: all the similarity kernel reads."""
+    company: str
+    title: str
+    location: str
+    title_key: str          # Lowercased title (what the similarity sees)
+    location_key: str       # Lowercased location
+    key_terms: FrozenSet[str]
+    seniority: Optional[int]
 
 
 class FuzzyDeduplicator:
@@ -19,18 +42,37 @@ class FuzzyDeduplicator:
 
     def __init__(self, title_threshold: float = 0.85,
                  location_threshold: float = 0.90,
-                 combined_threshold: float = 0.80):
+                 combined_threshold: float = 0.80,
+                 blocking: bool = True, db=None, vectorized: bool = True,
+                 batch_size: int = 20000):
         """Initialize deduplicator.
 
         Args:
             title_threshold: Similarity threshold for titles (0-1)
             location_threshold: Similarity threshold for locations (0-1)
             combined_threshold: Combined similarity threshold (0-1)
+            blocking: Score only the pairs proposed by a CandidateIndex
+                (False compares every pair within a company)
+            db: Optional JobDatabase; job features are cached in it across
+                runs, keyed by URL and content hash
+            vectorized: Score candidate pairs in bulk with a BatchScorer
+                (False scores them one at a time with score_features)
+            batch_size: Candidate pairs per BatchScorer block
         """
         self.title_threshold = title_threshold
         self.location_threshold = location_threshold
         self.combined_threshold = combined_threshold
+        self.blocking = blocking
+        self.db = db
+        self.vectorized = vectorized
+        self.batch_size = batch_size
         self.normalizer = TextNormalizer()
+        self.stats = {'pairs_total': 0, 'pairs_scored': 0,
+                      'features_computed': 0, 'features_cached': 0}
+
+        # Features by content hash, for repeat calls within a run
+        self._features: Dict[str, JobFeatures] = {}
+        self._compatible: Dict[Tuple[str, str], bool] = {}
 
     def compute_similarity(self, str1: str, str2: str) -> float:
         """Compute similarity between two strings.
@@ -69,6 +111,99 @@ class FuzzyDeduplicator:
 
         return intersection / union
 
+    @staticmethod
+    def content_hash(job: Dict) -> str:
+        """Hash of the fields features are derived from.
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            Hex digest; changes when company, title, location or
+            FEATURE_VERSION change
+        """
+        content = '\x1f'.join((str(FEATURE_VERSION), job.get('company') or '',
+                               job.get('title') or '', job.get('location') or ''))
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+    def extract_features(self, job: Dict) -> JobFeatures:
+        """Normalize the fields of a job used for comparison.
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            JobFeatures for the job
+        """
+        title = self.normalizer.normalize_title(job.get('title', ''))
+        location = self.normalizer.normalize_location(job.get('location', ''))
+        return self._make_features(
+            self.normalizer.normalize_company_name(job.get('company', '')),
+            title,
+            location,
+            self.normalizer.extract_key_terms(title),
+            self.normalizer.extract_seniority_level(title),
+        )
+
+    @staticmethod
+    def _make_features(company: str, title: str, location: str,
+                       key_terms, seniority: Optional[int]) -> JobFeatures:
+        return JobFeatures(
+            company=company,
+            title=title,
+            location=location,
+            title_key=title.lower(),
+            location_key=location.lower(),
+            # Interned: the same few hundred terms recur across all jobs
+            key_terms=frozenset(sys.intern(term) for term in key_terms),
+            seniority=seniority,
+        )
+
+    def features_for(self, jobs: List[Dict]) -> List[JobFeatures]:
+        """Features for a batch of jobs, reusing earlier work.
+
+        Looks in this run's memo first, then in the database (rows whose
+        content hash still matches), and only normalizes what is left;
+        newly computed features are written back to the database.
+
+        Args:
+            jobs: List of job dictionaries
+
+        Returns:
+            JobFeatures in the same order as jobs
+        """
+        hashes = [self.content_hash(job) for job in jobs]
+        missing = [i for i, h in enumerate(hashes) if h not in self._features]
+
+        if self.db is not None and missing:
+            urls = [jobs[i]['url'] for i in missing if jobs[i].get('url')]
+            rows = self.db.get_job_features(urls)
+            for i in missing:
+                row = rows.get(jobs[i].get('url'))
+                if row and row['content_hash'] == hashes[i] and hashes[i] not in self._features:
+                    self._features[hashes[i]] = self._make_features(
+                        row['company'], row['title'], row['location'],
+                        row['key_terms'].split(), row['seniority']
+                    )
+                    self.stats['features_cached'] += 1
+
+        new_rows = []
+        for i in missing:
+            if hashes[i] in self._features:
+                continue
+            features = self.extract_features(jobs[i])
+            self._features[hashes[i]] = features
+            self.stats['features_computed'] += 1
+            if jobs[i].get('url'):
+                new_rows.append((jobs[i]['url'], hashes[i], features.company,
+                                 features.title, features.location,
+                                 ' '.join(sorted(features.key_terms)), features.seniority))
+
+        if self.db is not None and new_rows:
+            self.db.save_job_features(new_rows)
+
+        return [self._features[h] for h in hashes]
+
     def are_jobs_similar(self, job1: Dict, job2: Dict) -> Tuple[bool, float, Dict]:
         """Check if two jobs are similar (potential duplicates).
 
@@ -79,38 +214,40 @@ class FuzzyDeduplicator:
         Returns:
             Tuple of (is_duplicate, similarity_score, details)
         """
-        # Must be from same company
-        company1 = self.normalizer.normalize_company_name(job1.get('company', ''))
-        company2 = self.normalizer.normalize_company_name(job2.get('company', ''))
+        return self.score_features(self.extract_features(job1),
+                                   self.extract_features(job2))
 
-        if company1 != company2:
-            return False, 0.0, {}
+    def location_similarity(self, loc1: str, loc2: str) -> float:
+        """Similarity of two normalized locations ("Remote" matches "Remote")."""
+        if loc1.lower() == "remote" and loc2.lower() == "remote":
+            return 1.0
+        return self.compute_similarity(loc1, loc2)
+
+    def score_features(self, f1: JobFeatures, f2: JobFeatures) -> Tuple[bool, float, Dict]:
+        """Score two jobs from their precomputed features.
 
-        # Normalize titles
-        title1 = self.normalizer.normalize_title(job1.get('title', ''))
-        title2 = self.normalizer.normalize_title(job2.get('title', ''))
+        Args:
+            f1: Features of the first job
+            f2: Features of the second job
 
-        # Normalize locations
-        loc1 = self.normalizer.normalize_location(job1.get('location', ''))
-        loc2 = self.normalizer.normalize_location(job2.get('location', ''))
+        Returns:
+            Tuple of (is_duplicate, similarity_score, details)
+        """
+        # Must be from same company
+        if f1.company != f2.company:
+            return False, 0.0, {}
 
         # Compute title similarity
-        title_similarity = self.compute_similarity(title1, title2)
+        title_similarity = self.compute_similarity(f1.title, f2.title)
 
         # Also check key terms overlap
-        terms1 = self.normalizer.extract_key_terms(title1)
-        terms2 = self.normalizer.extract_key_terms(title2)
-        terms_similarity = self.compute_jaccard_similarity(terms1, terms2)
+        terms_similarity = self.compute_jaccard_similarity(f1.key_terms, f2.key_terms)
 
         # Use max of direct similarity and terms similarity
         title_score = max(title_similarity, terms_similarity)
 
-        # Compute location similarity
-        location_score = self.compute_similarity(loc1, loc2)
-
-        # Special case: if both are "Remote", consider locations identical
-        if loc1.lower() == "remote" and loc2.lower() == "remote":
-            location_score = 1.0
+        # Compute location similarity ("Remote" on both sides is identical)
+        location_score = self.location_similarity(f1.location, f2.location)
 
         # Compute combined score (weighted average)
         # Title is more important than location
@@ -124,10 +261,10 @@ class FuzzyDeduplicator:
         )
 
         details = {
-            'title1': title1,
-            'title2': title2,
-            'location1': loc1,
-            'location2': loc2,
+            'title1': f1.title,
+            'title2': f2.title,
+            'location1': f1.location,
+            'location2': f2.location,
             'title_similarity': title_similarity,
             'terms_similarity': terms_similarity,
             'title_score': title_score,
@@ -140,62 +277,170 @@ class FuzzyDeduplicator:
     def find_duplicates(self, jobs: List[Dict]) -> Dict[str, List[Dict]]:
         """Find duplicate jobs in a list.
 
+        The groups of cluster_duplicates: every duplicate pair is linked,
+        so they do not depend on the order of jobs.
+
         Args:
             jobs: List of job dictionaries
 
         Returns:
-            Dictionary mapping canonical job URL to list of duplicate jobs
+            Dictionary mapping canonical job URL to [canonical, duplicates...];
+            duplicates carry '_similarity_score' and '_similarity_details'
+            (as score_features returns them) of the best pair linking them
+            into the group
         """
-        # Group jobs by company first (optimization)
-        jobs_by_company = defaultdict(list)
-        for job in jobs:
-            company = self.normalizer.normalize_company_name(job.get('company', ''))
-            jobs_by_company[company].append(job)
-
-        duplicates = {}
-        processed = set()
-
-        # Check each company's jobs
-        for company, company_jobs in jobs_by_company.items():
-            if len(company_jobs) < 2:
-                continue  # No duplicates possible
+        features = self.features_for(jobs)
+        pairs = list(self._company_pairs(jobs, features))
+        return self.clusters_from_pairs(jobs, pairs, features)
 
-            # Compare each pair of jobs
-            for i, job1 in enumerate(company_jobs):
-                job1_url = job1.get('url', '')
+    def cluster_duplicates(self, jobs: List[Dict]) -> Dict[str, List[Dict]]:
+        """Find duplicate clusters with a union-find over duplicate pairs.
 
-                if job1_url in processed:
-                    continue
+        Every duplicate pair is linked, so a chain of near matches ends up
+        in one cluster whatever the input order. Each cluster's canonical
+        is its earliest job (see canonical_order).
 
-                # Check against remaining jobs
-                for job2 in company_jobs[i+1:]:
-                    job2_url = job2.get('url', '')
+        Args:
+            jobs: List of job dictionaries
 
-                    if job2_url in processed:
-                        continue
+        Returns:
+            Dictionary mapping canonical job URL to [canonical, duplicates...]
+            in canonical order; duplicates carry '_similarity_score', the
+            best score of a pair linking them into the cluster
+        """
+        return self.clusters_from_pairs(jobs, self._company_pairs(jobs))
 
-                    # Check similarity
-                    is_dup, score, details = self.are_jobs_similar(job1, job2)
+    def clusters_from_pairs(self, jobs: List[Dict],
+                            pairs: Iterable[Tuple[int, int, float]],
+                            features: Optional[List[JobFeatures]] = None
+                            ) -> Dict[str, List[Dict]]:
+        """Build the cluster_duplicates result from duplicate pairs.
 
-                    if is_dup:
-                        # Add to duplicates group
-                        if job1_url not in duplicates:
-                            duplicates[job1_url] = [job1]
+        Args:
+            jobs: List of job dictionaries
+            pairs: (i, j, score) duplicate pairs, as indexes into jobs
+            features: Features of jobs; if given, duplicates also carry the
+                '_similarity_details' of their best pair (find_duplicates)
 
-                        duplicates[job1_url].append({
-                            **job2,
-                            '_similarity_score': score,
-                            '_similarity_details': details
-                        })
+        Returns:
+            Dictionary mapping canonical job URL to [canonical, duplicates...],
+            as cluster_duplicates returns it
+        """
+        pairs = list(pairs)
+        groups, best = self._group_pairs(jobs, pairs)
 
-                        processed.add(job2_url)
+        # The pair that gave each duplicate its best score
+        linked_by = {}
+        if features is not None:
+            for i, j, score in pairs:
+                for k in (i, j):
+                    if k not in linked_by and score == best[k]:
+                        linked_by[k] = (i, j)
 
+        duplicates = {}
+        for group in groups:
+            canonical = jobs[group[0]]
+            members = [canonical]
+            for k in group[1:]:
+                duplicate = {**jobs[k], '_similarity_score': best[k]}
+                if features is not None:
+                    i, j = linked_by[k]
+                    duplicate['_similarity_details'] = self.score_features(
+                        features[i], features[j]
+                    )[2]
+                members.append(duplicate)
+            duplicates[canonical.get('url', '')] = members
         return duplicates
 
+    def _clusters(self, jobs: List[Dict]) -> Tuple[List[List[int]], Dict[int, float]]:
+        """Clusters as lists of job indexes (canonical first, clusters in
+        canonical order), and the best duplicate score of each clustered job."""
+        return self._group_pairs(jobs, self._company_pairs(jobs))
+
+    def _company_pairs(self, jobs: List[Dict], features: Optional[List[JobFeatures]] = None):
+        """Yield (i, j, score) for every duplicate pair of jobs, company by company."""
+        features = self.features_for(jobs) if features is None else features
+        by_company = defaultdict(list)
+        for i, f in enumerate(features):
+            by_company[f.company].append(i)
+
+        for members in by_company.values():
+            if len(members) < 2:
+                continue
+            for a, b, score in self._duplicate_pairs([features[i] for i in members]):
+                yield members[a], members[b], score
+
+    @staticmethod
+    def _group_pairs(jobs: List[Dict], pairs: Iterable[Tuple[int, int, float]]
+                     ) -> Tuple[List[List[int]], Dict[int, float]]:
+        clusters = UnionFind(len(jobs))
+        best: Dict[int, float] = {}
+        for i, j, score in pairs:
+            clusters.union(i, j)
+            for k in (i, j):
+                best[k] = max(best.get(k, score), score)
+
+        groups = [sorted(group, key=lambda i: (canonical_order(jobs[i]), i))
+                  for group in clusters.groups()]
+        groups.sort(key=lambda group: (canonical_order(jobs[group[0]]), group[0]))
+        return groups, best
+
+    def _duplicate_pairs(self, features: List[JobFeatures], rows: Optional[range] = None,
+                         keys: Optional[List] = None):
+        """Yield (i, j, score) for every duplicate pair among one company's jobs.
+
+        rows limits the pairs to those whose first job i is in the range
+        (j > i may be any job), so one company can be split across workers.
+        keys are the blocking keys per job (see CandidateIndex), when
+        features are only a slice of the company.
+        """
+        count = len(features)
+        rows = range(count) if rows is None else rows
+        index = self._candidate_index(features, keys) if self.blocking else None
+        scorer = BatchScorer(self, features) if self.vectorized else None
+        self.stats['pairs_total'] += sum(count - 1 - i for i in rows)
+
+        left, right = [], []
+        for i in rows:
+            for j in (index.candidates(i) if index else range(i + 1, count)):
+                if scorer:
+                    left.append(i)
+                    right.append(j)
+                    continue
+                self.stats['pairs_scored'] += 1
+                is_dup, score, _ = self.score_features(features[i], features[j])
+                if is_dup:
+                    yield i, j, score
+
+            if scorer and left and (len(left) >= self.batch_size or i == rows[-1]):
+                self.stats['pairs_scored'] += len(left)
+                scores = scorer.score(left, right, prune=True)
+                for k in scores['is_duplicate'].nonzero()[0].tolist():
+                    yield left[k], right[k], float(scores['combined_score'][k])
+                left, right = [], []
+
+    def location_compatible(self, loc1: str, loc2: str) -> bool:
+        """Whether two location keys are similar enough for a duplicate."""
+        # Few distinct locations per company: score each pair once
+        key = (loc1, loc2) if loc1 <= loc2 else (loc2, loc1)
+        if key not in self._compatible:
+            self._compatible[key] = (self.location_similarity(loc1, loc2)
+                                     >= self.location_threshold)
+        return self._compatible[key]
+
+    def _candidate_index(self, features: List[JobFeatures],
+                         keys: Optional[List] = None) -> CandidateIndex:
+        """Blocking index for one company's jobs."""
+        return CandidateIndex(features, self.title_threshold, self.location_compatible,
+                              keys=keys)
+
     def deduplicate_jobs(self, jobs: List[Dict],
                         keep_strategy: str = 'first') -> Tuple[List[Dict], List[Dict]]:
         """Deduplicate a list of jobs.
 
+        Each duplicate cluster (see cluster_duplicates) keeps its canonical
+        job and loses the rest.
+
         Args:
             jobs: List of job dictionaries
             keep_strategy: Which job to keep ('first', 'last', 'most_recent')
@@ -203,38 +448,39 @@ class FuzzyDeduplicator:
         Returns:
             Tuple of (unique_jobs, removed_duplicates)
         """
-        duplicates = self.find_duplicates(jobs)
+        groups, _ = self._clusters(jobs)
 
-        # Track which jobs to remove
-        urls_to_remove = set()
-        for canonical_url, dup_group in duplicates.items():
-            # Keep the first job (canonical), remove others
-            for dup_job in dup_group[1:]:  # Skip first (canonical)
-                urls_to_remove.add(dup_job.get('url', ''))
+        # Keep each cluster's canonical, remove the others
+        to_remove = set()
+        for group in groups:
+            to_remove.update(group[1:])
 
         # Split into unique and duplicates
         unique_jobs = []
         removed_duplicates = []
 
-        for job in jobs:
-            job_url = job.get('url', '')
-            if job_url in urls_to_remove:
+        for i, job in enumerate(jobs):
+            if i in to_remove:
                 removed_duplicates.append(job)
             else:
                 unique_jobs.append(job)
 
         return unique_jobs, removed_duplicates
 
-    def generate_duplicate_report(self, jobs: List[Dict]) -> str:
+    def generate_duplicate_report(self, jobs: List[Dict],
+                                  duplicates: Optional[Dict[str, List[Dict]]] = None) -> str:
         """Generate a human-readable duplicate report.
 
         Args:
             jobs: List of job dictionaries
+            duplicates: Groups already found for these jobs (e.g. by a
+                ClusterIndex); computed with find_duplicates if omitted
 
         Returns:
             Formatted report string
         """
-        duplicates = self.find_duplicates(jobs)
+        if duplicates is None:
+            duplicates = self.find_duplicates(jobs)
 
         if not duplicates:
             return "No duplicates found."
@@ -279,16 +525,20 @@ class FuzzyDeduplicator:
 
         return "\n".join(report)
 
-    def get_deduplication_stats(self, jobs: List[Dict]) -> Dict:
+    def get_deduplication_stats(self, jobs: List[Dict],
+                                duplicates: Optional[Dict[str, List[Dict]]] = None) -> Dict:
         """Get deduplication statistics.
 
         Args:
             jobs: List of job dictionaries
+            duplicates: Groups already found for these jobs (e.g. by a
+                ClusterIndex); computed with find_duplicates if omitted
 
         Returns:
             Statistics dictionary
         """
-        duplicates = self.find_duplicates(jobs)
+        if duplicates is None:
+            duplicates = self.find_duplicates(jobs)
 
         total_jobs = len(jobs)
         duplicate_groups = len(duplicates)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Persistent state for site discovery.
+Every candidate subdomain is stored with its last probe result, so later
+runs only verify names that are new or whose re-check interval has
+expired. The (large) set of known-dead names is also kept in an
+in-memory Bloom filter, so checking a new name rarely touches SQLite.
+"""
+
+import hashlib
+import math
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .async_discovery import ProbeResult, normalize_name
+except ImportError:
+    from async_discovery import ProbeResult, normalize_name
+
+
+# Probe outcomes
+LIVE, DEAD, ERROR = 'live', 'dead', 'error'
+
+# Answers that say nothing about whether the site exists
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """Size the filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: False positive rate at capacity
+        """
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(item))
+
+
+def classify(result: ProbeResult) -> str:
+    """Map a probe result to LIVE, DEAD or ERROR (retry next run)."""
+    if result.found:
+        return LIVE
+    if result.error == 'NXDOMAIN':
+        return DEAD
+    if result.status is None or result.status in TRANSIENT_STATUSES:
+        return ERROR
+    return DEAD
+
+
+class DiscoveryStore:
+    """SQLite record of every discovery candidate and its last probe."""
+
+    def __init__(self, db_path: str = 'data/discovery.db',
+                 recheck_dead: float = 30 * 24 * 3600,
+                 recheck_live: float = 7 * 24 * 3600,
+                 batch_size: int = 500):
+        """Open (or create) the store.
+
+        Args:
+            db_path: Path to the SQLite file (':memory:' for a throwaway store)
+            recheck_dead: Seconds a dead name is skipped before re-probing
+            recheck_live: Seconds a live site is trusted before re-probing
+            batch_size: Probe results written per transaction
+        """
+        self.db_path = db_path
+        self.recheck_dead = timedelta(seconds=recheck_dead)
+        self.recheck_live = timedelta(seconds=recheck_live)
+        self.batch_size = batch_size
+        self._pending = 0
+
+        if db_path != ':memory:':
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        if db_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                name TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                state TEXT NOT NULL,
+                status INTEGER,
+                error TEXT,
+                first_seen TEXT NOT NULL,
+                last_checked TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+        self._load()
+
+    def _load(self):
+        """Build the in-memory views: live sites and the dead-name filter."""
+        self.live: Dict[str, Dict] = {}
+        dead = self.conn.execute(
+            "SELECT COUNT(*) FROM candidates WHERE state = ?", (DEAD,)
+        ).fetchone()[0]
+        # Headroom for the names this run will add
+        self.dead_filter = BloomFilter(max(2 * dead, 10000))
+
+        for row in self.conn.execute("SELECT name, url, state, last_checked FROM candidates "
+                                     "WHERE state IN (?, ?)", (LIVE, DEAD)):
+            if row['state'] == LIVE:
+                self.live[row['name']] = {'url': row['url'],
+                                          'last_checked': row['last_checked']}
+            else:
+                self.dead_filter.add(row['name'])
+
+    def is_due(self, name: str, now: Optional[datetime] = None) -> bool:
+        """Whether a candidate should be probed this run.
+
+        New names, names whose last probe failed transiently and names
+        whose re-check interval has expired are due; the rest are skipped.
+
+        Args:
+            name: Subdomain label
+            now: Current time (for tests)
+        """
+        name = normalize_name(name)
+        now = now or datetime.now()
+
+        if name in self.live:
+            checked = datetime.fromisoformat(self.live[name]['last_checked'])
+            return now - checked >= self.recheck_live
+
+        if name not in self.dead_filter:
+            # Never seen, or only seen with a transient error
+            return True
+
+        # Filter hit: confirm (it may be a false positive) and check age
+        row = self.conn.execute(
+            "SELECT state, last_checked FROM candidates WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None or row['state'] != DEAD:
+            return True
+        return now - datetime.fromisoformat(row['last_checked']) >= self.recheck_dead
+
+    def due(self, names: Iterable[str], now: Optional[datetime] = None) -> Iterator[str]:
+        """Filter candidates down to the ones that need probing (lazily)."""
+        for name in names:
+            if self.is_due(name, now):
+                yield name
+
+    def record(self, result: ProbeResult, now: Optional[datetime] = None):
+        """Store one probe result (committed in batches; call flush())."""
+        state = classify(result)
+        checked = (now or datetime.now()).isoformat(timespec='seconds')
+
+        if state == ERROR and result.name in self.live:
+            # A blip on a known site: keep it live, and due, for next run
+            self.conn.execute("UPDATE candidates SET status = ?, error = ? WHERE name = ?",
+                              (result.status, result.error, result.name))
+            self._count_pending()
+            return
+
+        self.conn.execute("""
+            INSERT INTO candidates (name, url, state, status, error, first_seen, last_checked)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                url = excluded.url,
+                state = excluded.state,
+                status = excluded.status,
+                error = excluded.error,
+                last_checked = excluded.last_checked
+        """, (result.name, result.url, state, result.status, result.error,
+              checked, checked))
+
+        if state == LIVE:
+            self.live[result.name] = {'url': result.url, 'last_checked': checked}
+        else:
+            self.live.pop(result.name, None)
+            if state == DEAD:
+                self.dead_filter.add(result.name)
+
+        self._count_pending()
+
+    def _count_pending(self):
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Commit recorded results."""
+        self.conn.commit()
+        self._pending = 0
+
+    def live_urls(self) -> List[str]:
+        """Career URLs of every site whose last probe succeeded."""
+        return sorted(entry['url'] for entry in self.live.values())
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Stored row for a candidate, or None."""
+        row = self.conn.execute("SELECT * FROM candidates WHERE name = ?",
+                                (normalize_name(name),)).fetchone()
+        return dict(row) if row else None
+
+    def get_stats(self) -> Dict:
+        """Candidate counts by state."""
+        counts = {LIVE: 0, DEAD: 0, ERROR: 0}
+        for row in self.conn.execute("SELECT state, COUNT(*) AS n FROM candidates GROUP BY state"):
+            counts[row['state']] = row['n']
+        counts['total'] = sum(counts.values())
+        return counts
+
+    def close(self):
+        """Commit and close the store."""
+        self.flush()
+        self.conn.close()
@@ -2,19 +2,40 @@
 """
 Enhanced Avature site discovery using multiple advanced strategies
 """
+import asyncio
 import requests
 import re
+import sys
 import time
 from urllib.parse import urlparse
 from tqdm import tqdm
 import json
 
+try:
+    from .async_discovery import AsyncDiscoveryEngine, iterate
+    from .ct_ingest import CTIngestor
+    from .discovery_store import DiscoveryStore
+except ImportError:
+    from async_discovery import AsyncDiscoveryEngine, iterate
+    from ct_ingest import CTIngestor
+    from discovery_store import DiscoveryStore
+
 class EnhancedDiscovery:
-    def __init__(self):
-        self.discovered_sites = set()
+    def __init__(self, engine=None, store=None):
+        """
+        Args:
+            engine: Optional AsyncDiscoveryEngine used to verify candidates
+                in bulk (default: one with the standard politeness budget)
+            store: Optional DiscoveryStore with the results of earlier runs
+                (default: data/discovery.db); known sites are kept and only
+                new or expired candidates are probed
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
+        self.engine = engine or AsyncDiscoveryEngine(headers=self.headers)
+        self.store = store or DiscoveryStore()
+        self.discovered_sites = set(self.store.live_urls())
 
     def strategy_a_expanded_subdomains(self):
         """
@@ -27,14 +48,9 @@ class EnhancedDiscovery:
 
         print(f"Testing {len(companies)} potential subdomains...")
 
-        found = 0
-        for company in tqdm(companies, desc="Testing"):
-            url = f"https://{company}.avature.net/careers"
-            if self.check_and_add(url):
-                found += 1
-            time.sleep(0.2)  # Be polite
+        found = self.verify_candidates(companies, desc="Testing")
 
-        print(f"  Found {found} new sites via subdomain testing")
+        print(f"  Found {len(found)} new sites via subdomain testing")
         return self.discovered_sites
 
     def load_company_list(self):
@@ -141,13 +157,17 @@ class EnhancedDiscovery:
 
         return sorted(companies)
 
-    def strategy_b_reverse_dns_sweep(self):
+    def strategy_b_reverse_dns_sweep(self, ct_dump=None):
         """
         Strategy B: Query DNS for *.avature.net subdomains
         This would require access to DNS zone files or services like:
         - SecurityTrails API
         - Rapid7 Sonar DNS data
         - Certificate Transparency logs
+
+        Args:
+            ct_dump: Optional path to a saved crt.sh JSON dump (.json or
+                .json.gz) to read instead of querying crt.sh
         """
         print("\n[Strategy B] Reverse DNS / Certificate Transparency")
         print("  Note: Requires API keys or CT log parsing")
@@ -156,37 +176,19 @@ class EnhancedDiscovery:
         print("    - SecurityTrails API")
         print("    - Rapid7 Open Data")
 
-        # Try crt.sh (free, no API key needed)
+        # Try crt.sh (free, no API key needed). The result is streamed:
+        # names are verified while the rest of the array is still arriving
+        ingestor = CTIngestor()
         try:
-            url = "https://crt.sh/?q=%.avature.net&output=json"
-            response = requests.get(url, timeout=30)
-
-            if response.status_code == 200:
-                certs = response.json()
-                subdomains = set()
-
-                for cert in certs:
-                    name = cert.get('name_value', '')
-                    if 'avature.net' in name:
-                        # Extract subdomain
-                        parts = name.replace('*.', '').strip().split('\n')
-                        for part in parts:
-                            if '.avature.net' in part:
-                                subdomain = part.split('.avature.net')[0].strip()
-                                if subdomain and subdomain != '*':
-                                    careers_url = f"https://{subdomain}.avature.net/careers"
-                                    subdomains.add(careers_url)
-
-                print(f"  Found {len(subdomains)} potential sites from crt.sh")
-
-                # Verify them
-                for site in tqdm(list(subdomains)[:100], desc="Verifying"):
-                    self.check_and_add(site)
-                    time.sleep(0.3)
+            names = ingestor.from_file(ct_dump) if ct_dump else ingestor.from_url()
+            found = self.verify_candidates(names, desc="Verifying")
+            print(f"  Verified {len(found)} live sites")
 
         except Exception as e:
             print(f"  Error: {e}")
 
+        print(f"  Read {ingestor.stats['unique_names']} unique names from "
+              f"{ingestor.stats['entries']} CT entries")
         return self.discovered_sites
 
     def strategy_c_google_search_api(self):
@@ -203,6 +205,59 @@ class EnhancedDiscovery:
 
         return self.discovered_sites
 
+    def verify_candidates(self, names, desc="Verifying"):
+        """
+        Verify subdomain names in bulk with the async engine and add the
+        live career sites to the discovered set.
+
+        Names probed recently (live or dead) are skipped; every probe
+        result is written to the discovery store.
+
+        Args:
+            names: Subdomain labels (e.g. "acme" for acme.avature.net), as
+                a list or a plain/async iterator that is consumed lazily
+            desc: Progress bar label
+
+        Returns:
+            List of career URLs that answered 200
+        """
+        skipped = 0
+
+        async def due():
+            nonlocal skipped
+            async for name in iterate(names):
+                if self.store.is_due(name):
+                    yield name
+                else:
+                    skipped += 1
+
+        async def run():
+            found = []
+            # Streams (e.g. CT logs) have no length up front
+            total = len(names) if hasattr(names, '__len__') else None
+            with tqdm(total=total, desc=desc) as progress:
+                async for result in self.engine.results(due()):
+                    progress.update(1)
+                    self.store.record(result)
+                    if result.found:
+                        self.discovered_sites.add(result.url)
+                        found.append(result.url)
+                    elif result.name not in self.store.live:
+                        self.discovered_sites.discard(result.url)
+                progress.update(skipped)
+            return found
+
+        before = dict(self.engine.stats)
+        try:
+            found = asyncio.run(run())
+        finally:
+            self.store.flush()
+        stats = {key: value - before[key] for key, value in self.engine.stats.items()}
+        print(f"  {skipped} candidates skipped (checked recently)")
+        print(f"  DNS: {stats['nxdomain']} NXDOMAIN dropped, "
+              f"HTTP: {stats['probed']} probed, {stats['throttled']} throttled")
+        return found
+
     def check_and_add(self, url):
         """Check if URL exists and add to discovered set."""
         try:
@@ -222,19 +277,21 @@ class EnhancedDiscovery:
 
         print(f"\n[Saved] {len(self.discovered_sites)} sites to {output_file}")
 
-def main():
+def main(ct_dump=None):
     discovery = EnhancedDiscovery()
 
     # Run strategies
     discovery.strategy_a_expanded_subdomains()
-    discovery.strategy_b_reverse_dns_sweep()
+    discovery.strategy_b_reverse_dns_sweep(ct_dump)
 
     # Save results
     discovery.save_results('data/input/enhanced_discovered_sites.txt')
+    discovery.store.close()
 
     print(f"\n{'='*80}")
     print(f"Enhanced discovery complete! Found {len(discovery.discovered_sites)} sites")
     print(f"{'='*80}")
 
 if __name__ == "__main__":
-    main()
+    # Optional argument: saved crt.sh dump to use instead of querying crt.sh
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-host concurrency control for the async scrapers.
+Each host gets an AIMD window: in-flight requests grow additively while
+responses are fast and clean, and shrink multiplicatively on 429/503 or
+timeouts, pausing the host for Retry-After when the server asks.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# Statuses that mean "slow down" rather than "broken"
+THROTTLE_STATUSES = (429, 503)
+
+# Never pause a host longer than this, whatever Retry-After says
+MAX_RETRY_AFTER = 300.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value (delta-seconds or HTTP-date)
+
+    Returns:
+        Seconds to wait (capped at MAX_RETRY_AFTER) or None if absent/invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HostLimiter:
+    """AIMD window of in-flight requests for a single host."""
+
+    def __init__(self, initial_limit: int = 3, min_limit: int = 1,
+                 max_limit: int = 16, decrease_factor: float = 0.5,
+                 latency_target: float = 2.0, max_error_rate: float = 0.1):
+        """Initialize limiter.
+
+        Args:
+            initial_limit: Starting window
+            min_limit: Window never shrinks below this
+            max_limit: Window never grows above this
+            decrease_factor: Window multiplier on throttling / timeouts
+            latency_target: Responses slower than this (seconds) stop growth
+            max_error_rate: Smoothed error rate above which growth stops
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.max_error_rate = max_error_rate
+
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self.paused_until = 0.0
+
+        # Smoothed latency / error rate (EWMA)
+        self.latency = None
+        self.error_rate = 0.0
+        self._last_decrease = 0.0
+
+        # Counters for reporting
+        self.stats = {'requests': 0, 'throttled': 0, 'timeouts': 0,
+                      'errors': 0, 'peak_limit': self.limit}
+
+        self._condition = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the limiter binds to the running loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """Wait for a free slot (and for any Retry-After pause to end)."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=pause)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.in_flight < int(self.limit):
+                    break
+                await condition.wait()
+
+            self.in_flight += 1
+            self.stats['requests'] += 1
+
+    async def release(self):
+        """Free a slot."""
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a slot for one request."""
+        await self.acquire()
+        try:
+            yield self
+        finally:
+            await self.release()
+
+    def _record(self, latency: Optional[float], error: bool):
+        """Fold one response into the smoothed latency and error rate."""
+        if latency is not None:
+            self.latency = (latency if self.latency is None
+                            else 0.8 * self.latency + 0.2 * latency)
+        self.error_rate = 0.9 * self.error_rate + (0.1 if error else 0.0)
+
+    def on_success(self, latency: float):
+        """A request completed normally: grow by about one slot per window."""
+        self._record(latency, error=False)
+
+        healthy = (latency <= self.latency_target and
+                   self.error_rate <= self.max_error_rate)
+        if healthy and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.stats['peak_limit'] = max(self.stats['peak_limit'], self.limit)
+
+    def on_error(self, latency: Optional[float] = None):
+        """A request failed without a throttling signal: stop growing."""
+        self._record(latency, error=True)
+        self.stats['errors'] += 1
+
+    def on_throttle(self, retry_after: Optional[float] = None, timeout: bool = False):
+        """The host pushed back (429/503/timeout): shrink the window.
+
+        Args:
+            retry_after: Seconds from Retry-After; pauses the whole host
+            timeout: True if the signal was a timeout
+        """
+        self._record(None, error=True)
+        self.stats['timeouts' if timeout else 'throttled'] += 1
+        now = time.monotonic()
+
+        # One decrease per round trip: requests already in flight when the
+        # host pushed back would otherwise each halve the window again
+        window = max(self.latency or 0.0, 0.1)
+        if now - self._last_decrease >= window:
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+            self._last_decrease = now
+
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+
+
+class HostLimiterPool:
+    """One HostLimiter per host, created on first use."""
+
+    def __init__(self, **limiter_kwargs):
+        """Initialize pool.
+
+        Args:
+            **limiter_kwargs: Passed to every HostLimiter
+        """
+        self.limiter_kwargs = limiter_kwargs
+        self.limiters: Dict[str, HostLimiter] = {}
+
+    def for_url(self, url: str) -> HostLimiter:
+        """Get the limiter for a URL's host."""
+        return self.for_host(urlparse(url).netloc)
+
+    def for_host(self, host: str) -> HostLimiter:
+        """Get the limiter for a host name or address."""
+        host = host.lower()
+        if host not in self.limiters:
+            self.limiters[host] = HostLimiter(**self.limiter_kwargs)
+        return self.limiters[host]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-host counters and current window."""
+        return {
+            host: dict(limiter.stats, limit=round(limiter.limit, 2))
+            for host, limiter in self.limiters.items()
+        }
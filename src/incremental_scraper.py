@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import List, Dict
 from scraper import AvatureScraper
 from database import JobDatabase
+from listing_parser import parse_document, find_articles, has_next_page
 
 
 class IncrementalScraper(AvatureScraper):
@@ -60,7 +61,7 @@ class IncrementalScraper(AvatureScraper):
         try:
             # Detect URL pattern if detector is available
             if self.use_url_detector and self.url_detector:
-                pattern = self.url_detector.detect_pattern(base_url)
+                pattern, probe = self.url_detector.detect_pattern_with_response(base_url)
 
                 if pattern is None:
                     site_stats['error'] = "No compatible URL pattern found"
@@ -70,26 +71,21 @@ class IncrementalScraper(AvatureScraper):
                 search_url = f"{base_url}{pattern}"
             else:
                 search_url = f"{base_url}/SearchJobs"
+                probe = None
 
-            # Scrape with smart stopping
-            jobs, stats = self.scrape_search_page_smart(search_url, base_url)
+            # Scrape with smart stopping (the detector's page is page 1)
+            jobs, stats = self.scrape_search_page_smart(search_url, base_url, probe=probe)
 
             site_stats['jobs_found'] = len(jobs)
             site_stats['success'] = True
 
-            # Process each job through database
-            active_urls = []
-            for job in jobs:
-                action, changed = self.db.upsert_job(job)
+            # Process all jobs through database in one transaction
+            counts = self.db.upsert_jobs(jobs)
+            site_stats['jobs_new'] = counts['new']
+            site_stats['jobs_updated'] = counts['updated']
+            site_stats['jobs_unchanged'] = counts['unchanged']
 
-                if action == 'new':
-                    site_stats['jobs_new'] += 1
-                elif action == 'updated':
-                    site_stats['jobs_updated'] += 1
-                else:
-                    site_stats['jobs_unchanged'] += 1
-
-                active_urls.append(job['url'])
+            active_urls = [job['url'] for job in jobs]
 
             # Mark jobs that weren't seen as inactive
             company = jobs[0]['company'] if jobs else None
@@ -118,9 +114,15 @@ class IncrementalScraper(AvatureScraper):
 
         return site_stats
 
-    def scrape_search_page_smart(self, search_url, base_url):
+    def scrape_search_page_smart(self, search_url, base_url, probe=None):
         """Scrape with smart stopping - stop if no new jobs in N consecutive pages.
 
+        Args:
+            search_url: Search URL (page 1)
+            base_url: Base site URL
+            probe: Optional ProbeResponse for search_url from the URL
+                detector, used as page 1 instead of downloading it again
+
         Returns:
             Tuple of (jobs_list, stats_dict)
         """
@@ -140,14 +142,18 @@ class IncrementalScraper(AvatureScraper):
             try:
                 page_url = self.get_page_url(search_url, page)
 
-                import requests
-                response = requests.get(page_url, headers=self.headers, timeout=15)
-                response.raise_for_status()
+                if page == 1 and probe is not None and probe.url == page_url:
+                    root = probe.root
+                    if root is None:
+                        root = parse_document(probe.body, probe.encoding)
+                else:
+                    import requests
+                    response = requests.get(page_url, headers=self.headers, timeout=15)
+                    response.raise_for_status()
 
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'lxml')
+                    root = parse_document(response.text)
 
-                articles = soup.find_all('article')
+                articles = find_articles(root)
 
                 if not articles:
                     print("No more jobs")
@@ -181,11 +187,7 @@ class IncrementalScraper(AvatureScraper):
                     pages_without_new = 0
 
                 # Check for next page
-                import re
-                next_button = soup.find('a', {'class': re.compile(r'next|pagination', re.I)})
-                pagination_links = soup.find_all('a', href=re.compile(r'page=\d+'))
-
-                if not next_button and not pagination_links:
+                if not has_next_page(root):
                     break
 
                 page += 1
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Shared extractor for Avature listing (search results) pages.
+Parses with lxml and precompiled XPath selectors instead of building a
+BeautifulSoup tree, keeping the output of the original BeautifulSoup
+extraction.
+"""
+
+import re
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Union
+from urllib.parse import urljoin, urlparse
+
+import lxml.html
+from lxml import etree
+from bs4.dammit import EncodingDetector
+
+
+# Compact job record returned by parse_listing_page:
+# (title, url, job_id, location, date_posted)
+JobRow = Tuple[str, str, Optional[str], Optional[str], Optional[str]]
+
+# Pagination facts from a results legend: (total_results, page_size)
+PageInfo = Tuple[int, int]
+
+_NS = {'re': 'http://exslt.org/regular-expressions'}
+
+
+def _xpath(expr: str) -> etree.XPath:
+    return etree.XPath(expr, namespaces=_NS, smart_strings=False)
+
+
+# Selectors (same matching rules as the BeautifulSoup find() calls they replace)
+ARTICLES = _xpath('//article')
+JOB_LINK = _xpath("(.//a[re:test(@href, 'JobDetail|FolderDetail', 'i')])[1]")
+LOCATION = _xpath("(.//*[re:test(@class, 'location', 'i')])[1]")
+TIME = _xpath('(.//time)[1]')
+TEXT = _xpath('.//text()[not(parent::script or parent::style)]')
+NEXT_PAGE = _xpath(
+    "boolean(//a[re:test(@class, 'next|pagination', 'i')]"
+    " | //a[re:test(@href, 'page=\\d+')])"
+)
+LEGEND = _xpath("//*[re:test(@class, 'legend', 'i')]")
+
+JOB_ID_PATTERN = re.compile(r'/(\d+)$')
+
+# "1-20 of 145 results", "Showing 21 – 40 of 1,203"
+RESULT_RANGE_PATTERN = re.compile(
+    r'(\d[\d,.]*)\s*[-\u2013\u2014]\s*(\d[\d,.]*)\s+of\s+(\d[\d,.]*)', re.I
+)
+
+_PARSE_ERRORS = (UnicodeDecodeError, LookupError, etree.LxmlError)
+
+
+def parse_document(markup: Union[bytes, str],
+                   encoding: Optional[str] = None) -> Optional[etree._Element]:
+    """Parse a page into an lxml tree.
+
+    Bytes are decoded the way BeautifulSoup does it: the given encoding
+    first, then BOM, declared charset and fallbacks in turn.
+
+    Args:
+        markup: Raw page bytes or decoded text
+        encoding: Charset from the response headers, if known
+
+    Returns:
+        Root element, or None if the page could not be parsed
+    """
+    if isinstance(markup, str):
+        candidates = [(markup, None)]
+    else:
+        detector = EncodingDetector(
+            markup,
+            known_definite_encodings=[encoding] if encoding else [],
+            is_html=True
+        )
+        candidates = ((detector.markup, candidate)
+                      for candidate in detector.encodings)
+
+    for data, candidate in candidates:
+        parser = etree.HTMLParser(encoding=candidate, recover=True)
+        try:
+            parser.feed(data)
+            return parser.close()
+        except _PARSE_ERRORS:
+            continue
+
+    return None
+
+
+def find_articles(root: Optional[etree._Element]) -> List[etree._Element]:
+    """Return all <article> elements of a parsed page."""
+    return ARTICLES(root) if root is not None else []
+
+
+def has_next_page(root: Optional[etree._Element]) -> bool:
+    """Check a parsed page for a next button or page=N links."""
+    return root is not None and NEXT_PAGE(root)
+
+
+def _count(text: str) -> int:
+    return int(re.sub(r'[,.]', '', text))
+
+
+def extract_page_info(root: Optional[etree._Element]) -> Optional[PageInfo]:
+    """Read total results and page size from the results legend.
+
+    Avature renders e.g. "1-20 of 145 results" above the listing.
+
+    Args:
+        root: Root element from parse_document
+
+    Returns:
+        (total_results, page_size) or None if the page shows no usable count
+    """
+    if root is None:
+        return None
+
+    for legend in LEGEND(root):
+        match = RESULT_RANGE_PATTERN.search(' '.join(TEXT(legend)))
+        if not match:
+            continue
+        first, last, total = (_count(group) for group in match.groups())
+        if first != 1 or last < first or total < last:
+            continue  # Not a first page, or a legend we misread
+        return total, last - first + 1
+
+    return None
+
+
+def page_count(total_results: int, page_size: int, max_pages: int) -> int:
+    """Number of pages implied by a result count.
+
+    Args:
+        total_results: Total jobs from the legend
+        page_size: Jobs per page from the legend
+        max_pages: Upper bound on pages to visit
+
+    Returns:
+        Pages to fetch (at least 1, at most max_pages)
+    """
+    return min(max_pages, max(1, -(-total_results // page_size)))
+
+
+def _text(element: etree._Element) -> str:
+    """Equivalent of BeautifulSoup get_text(strip=True)."""
+    return ''.join(text.strip() for text in TEXT(element))
+
+
+def extract_job_row(article, base_url: str) -> Optional[JobRow]:
+    """Extract a compact job record from an article element.
+
+    Args:
+        article: lxml article element (a BeautifulSoup tag is also accepted)
+        base_url: Base site URL
+
+    Returns:
+        JobRow tuple or None if the article has no job link
+    """
+    if not isinstance(article, etree._Element):
+        article = lxml.html.fragment_fromstring(str(article))
+
+    # Find the job link
+    links = JOB_LINK(article)
+    if not links:
+        return None
+    link = links[0]
+
+    # Extract title
+    title = _text(link)
+
+    # Extract URL
+    job_url = link.get('href')
+    if not job_url.startswith('http'):
+        job_url = urljoin(base_url, job_url)
+
+    # Extract job ID from URL
+    job_id_match = JOB_ID_PATTERN.search(job_url)
+    job_id = job_id_match.group(1) if job_id_match else None
+
+    # Try to extract location
+    location = None
+    location_elems = LOCATION(article)
+    if location_elems:
+        location = _text(location_elems[0])
+
+    # Date posted
+    date_posted = None
+    date_elems = TIME(article)
+    if date_elems:
+        date_posted = date_elems[0].get('datetime') or _text(date_elems[0])
+
+    return (title, job_url, job_id, location, date_posted)
+
+
+def extract_rows(root: Optional[etree._Element], base_url: str) -> List[JobRow]:
+    """Extract job records from every article of a parsed page.
+
+    Args:
+        root: Root element from parse_document
+        base_url: Base site URL
+
+    Returns:
+        List of JobRow tuples
+    """
+    rows = []
+    for article in find_articles(root):
+        try:
+            row = extract_job_row(article, base_url)
+        except Exception:
+            row = None
+        if row:
+            rows.append(row)
+
+    return rows
+
+
+def parse_listing_page(body: Union[bytes, str], base_url: str,
+                       encoding: Optional[str] = None) -> List[JobRow]:
+    """Parse a listing page into compact job records.
+
+    Module-level so it can be shipped to a process pool.
+
+    Args:
+        body: Raw page bytes (or decoded text)
+        base_url: Base site URL
+        encoding: Charset from the response headers, if known
+
+    Returns:
+        List of JobRow tuples (empty if the page has no articles)
+    """
+    return extract_rows(parse_document(body, encoding), base_url)
+
+
+def parse_first_page(body: Union[bytes, str], base_url: str,
+                     encoding: Optional[str] = None
+                     ) -> Tuple[List[JobRow], Optional[PageInfo]]:
+    """Parse page 1 of a listing: job records plus its result count.
+
+    Module-level so it can be shipped to a process pool.
+
+    Args:
+        body: Raw page bytes (or decoded text)
+        base_url: Base site URL
+        encoding: Charset from the response headers, if known
+
+    Returns:
+        Tuple of (JobRow list, PageInfo or None)
+    """
+    root = parse_document(body, encoding)
+    return extract_rows(root, base_url), extract_page_info(root)
+
+
+def job_from_row(row: JobRow, base_url: str) -> Dict:
+    """Expand a compact job record into the scraper's job dictionary.
+
+    Args:
+        row: JobRow tuple from parse_listing_page
+        base_url: Base site URL
+
+    Returns:
+        Job dictionary
+    """
+    title, job_url, job_id, location, date_posted = row
+
+    metadata = {}
+    if date_posted:
+        metadata['date_posted'] = date_posted
+
+    return {
+        'title': title,
+        'url': job_url,
+        'job_id': job_id,
+        'location': location,
+        'company_url': base_url,
+        'company': urlparse(base_url).netloc.split('.')[0],
+        'scraped_at': datetime.now().isoformat(),
+        'metadata': metadata,
+    }
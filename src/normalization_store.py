@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Persistent store of TextNormalizer results.
+Keeps the most recently used normalizations per kind (title, location,
+key terms, ...) in a sidecar SQLite file, so a new run starts with the
+titles and locations earlier runs already normalized.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+
+class NormalizationStore:
+    """Sidecar SQLite table of (kind, input text) -> normalized result."""
+
+    def __init__(self, store_path: str = "data/normalizations.db"):
+        """Open (or create) the store.
+
+        Args:
+            store_path: Path to the SQLite file (':memory:' for a throwaway store)
+        """
+        self.store_path = store_path
+        if store_path != ':memory:':
+            Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(store_path, check_same_thread=False)
+
+        if store_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS normalizations (
+                kind TEXT NOT NULL,
+                text TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                PRIMARY KEY (kind, text)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_normalizations_used
+            ON normalizations(kind, used)
+        """)
+        self.conn.commit()
+
+    def load(self, kind: str, version: int, limit: int) -> List[Tuple[str, object]]:
+        """Most recently used results of one kind.
+
+        Args:
+            kind: Normalization kind ('title', 'location', ...)
+            version: Normalizer rules version; rows of other versions are ignored
+            limit: Largest number of rows returned
+
+        Returns:
+            (text, result) pairs, least recently used first
+        """
+        rows = self.conn.execute("""
+            SELECT text, result FROM normalizations
+            WHERE kind = ? AND version = ?
+            ORDER BY used DESC
+            LIMIT ?
+        """, (kind, version, limit)).fetchall()
+        return [(text, json.loads(result)) for text, result in reversed(rows)]
+
+    def save(self, kind: str, version: int, entries: Iterable[Tuple[str, object]],
+             keep: int) -> int:
+        """Store results of one kind and drop the least recently used rest.
+
+        Args:
+            kind: Normalization kind
+            version: Normalizer rules version
+            entries: (text, JSON-serializable result) pairs, least recently
+                used first; all count as used after every row already stored
+            keep: Rows of this kind kept after saving (most recently used)
+
+        Returns:
+            Number of rows written
+        """
+        try:
+            # Recency rank: increasing across saves and within one, so the
+            # LRU order survives a reload
+            last = self.conn.execute(
+                "SELECT COALESCE(MAX(used), 0) FROM normalizations"
+            ).fetchone()[0]
+            entries = [(text, result) for text, result in entries if isinstance(text, str)]
+            rows = [(kind, text, version, json.dumps(result), last + 1 + position)
+                    for position, (text, result) in enumerate(entries)]
+            self.conn.executemany("""
+                INSERT INTO normalizations (kind, text, version, result, used)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(kind, text) DO UPDATE SET
+                    version = excluded.version,
+                    result = excluded.result,
+                    used = excluded.used
+            """, rows)
+            self.conn.execute("""
+                DELETE FROM normalizations
+                WHERE kind = ? AND text NOT IN (
+                    SELECT text FROM normalizations WHERE kind = ?
+                    ORDER BY used DESC LIMIT ?
+                )
+            """, (kind, kind, keep))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(rows)
+
+    def close(self):
+        """Close the store."""
+        self.conn.close()
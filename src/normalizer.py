@@ -4,8 +4,114 @@ Text normalization utilities for job deduplication.
 Handles title and location normalization.
 """
 
+import functools
 import re
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Pattern
+
+# Bump when normalization rules change so stored results are recomputed
+NORMALIZER_VERSION = 1
+
+# Results memoized per TextNormalizer method
+CACHED_KINDS = ('title', 'location', 'seniority', 'key_terms', 'company')
+
+_MISSING = object()
+
+WHITESPACE = re.compile(r'\s+')
+TITLE_SPECIAL_CHARS = re.compile(r'[^\w\s\-/()&]')
+REMOTE = re.compile(r'\b(remote|work from home|wfh)\b', re.IGNORECASE)
+
+# Company suffixes, removed one after another
+COMPANY_SUFFIXES = [
+    r'\bInc\.?$',
+    r'\bLLC\.?$',
+    r'\bLtd\.?$',
+    r'\bCorp\.?$',
+    r'\bCorporation$',
+    r'\bLimited$',
+    r'\bCompany$',
+    r'\bCo\.?$',
+]
+
+# Words dropped from key terms
+FILLER_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+    'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was',
+    'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do',
+    'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'must', 'can'
+})
+
+
+def _alternation(patterns: List[str], flags: int = 0) -> Pattern:
+    """One regex trying the patterns in order; group n + 1 is pattern n.
+
+    When every pattern is a word boundary and a letter, the boundary and
+    a lookahead on the first letters are tested once per position before
+    any alternative is tried.
+    """
+    if all(pattern.startswith(r'\b') and pattern[2:3].isalnum() for pattern in patterns):
+        first = ''.join(sorted({pattern[2] for pattern in patterns}))
+        alternatives = '|'.join(f'({pattern[2:]})' for pattern in patterns)
+        return re.compile(rf'\b(?=[{first}])(?:{alternatives})', flags)
+    return re.compile('|'.join(f'({pattern})' for pattern in patterns), flags)
+
+
+class LRUCache:
+    """Size-bounded map that drops its least recently used entry when full."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """Value for key (counted as a hit or a miss)."""
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store value, evicting the least recently used entry if full."""
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def info(self) -> Dict:
+        """Hits, misses, hit rate and current size."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self.data), 'maxsize': self.maxsize}
+
+
+def _memoized(kind: str):
+    """Serve a TextNormalizer method from its per-kind LRU cache.
+
+    Sets are cached frozen and returned as fresh copies, so callers may
+    modify what they get.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, text):
+            cache = self._caches.get(kind)
+            if cache is None:
+                return method(self, text)
+            value = cache.get(text, _MISSING)
+            if value is _MISSING:
+                value = method(self, text)
+                cache.put(text, frozenset(value) if isinstance(value, set) else value)
+                return value
+            return set(value) if isinstance(value, frozenset) else value
+        return wrapper
+    return decorator
 
 
 class TextNormalizer:
@@ -106,10 +212,81 @@ class TextNormalizer:
         'chi-town': 'Chicago',
     }
 
-    def __init__(self):
-        """Initialize normalizer."""
-        pass
+    def __init__(self, cache_size: int = 10000, store=None):
+        """Initialize normalizer.
 
+        Each replacement table is compiled into one alternation, so a
+        string is scanned once per table instead of once per entry. The
+        output is the same as substituting the entries one at a time.
+
+        Args:
+            cache_size: Results kept per method in an LRU cache (0 disables
+                caching); titles and locations repeat heavily across jobs
+            store: Optional NormalizationStore; the caches start with its
+                most recently used results and flush() writes them back
+        """
+        self.cache_size = cache_size
+        self.store = store
+        self._caches: Dict[str, LRUCache] = (
+            {kind: LRUCache(cache_size) for kind in CACHED_KINDS} if cache_size > 0 else {}
+        )
+        if store is not None:
+            for kind, cache in self._caches.items():
+                for text, result in store.load(kind, NORMALIZER_VERSION, cache_size):
+                    cache.put(text, frozenset(result) if kind == 'key_terms' else result)
+
+        self._title_pattern = _alternation(list(self.TITLE_ABBREVIATIONS), re.IGNORECASE)
+        self._title_replacements = [None] + list(self.TITLE_ABBREVIATIONS.values())
+
+        self._synonym_pattern = _alternation(
+            [r'\b' + re.escape(abbrev) + r'\b' for abbrev in self.LOCATION_SYNONYMS],
+            re.IGNORECASE)
+        self._synonym_replacements = [None] + list(self.LOCATION_SYNONYMS.values())
+
+        self._state_pattern = re.compile(
+            r',\s*(' + '|'.join(self.STATE_ABBREVIATIONS) + r')\b')
+
+        # Levels that contain an earlier level as a word ('senior manager'
+        # holds 'senior') never match one at a time: the earlier level is
+        # removed first, so they are left out of the alternation
+        alive = []
+        for level in self.SENIORITY_LEVELS:
+            if not any(re.search(r'\b' + re.escape(earlier) + r'\b', level, re.IGNORECASE)
+                       for earlier in alive):
+                alive.append(level)
+        self._level_pattern = _alternation(
+            [r'\b' + re.escape(level) + r'\b' for level in alive], re.IGNORECASE)
+
+        self._levels_longest_first = sorted(self.SENIORITY_LEVELS.items(),
+                                            key=lambda x: -len(x[0]))
+        self._company_suffixes = [re.compile(suffix, re.IGNORECASE)
+                                  for suffix in COMPANY_SUFFIXES]
+
+    def _expand_title_abbreviations(self, title: str) -> str:
+        """Replace every TITLE_ABBREVIATIONS match in one scan.
+
+        One at a time, an abbreviation expanded with its trailing dot
+        ('Sr.Eng' -> 'SeniorEng') removes the word boundary in front of
+        the next word, so entries later in the table no longer match it
+        there. That match is skipped here as well.
+        """
+        replacements = self._title_replacements
+        parts = []
+        last = 0
+        dotted_end, dotted_entry = -1, 0
+        for match in self._title_pattern.finditer(title):
+            entry = match.lastindex
+            if match.start() == dotted_end and entry > dotted_entry:
+                continue
+            parts.append(title[last:match.start()])
+            parts.append(replacements[entry])
+            last = match.end()
+            if title[last - 1] == '.':
+                dotted_end, dotted_entry = last, entry
+        parts.append(title[last:])
+        return ''.join(parts)
+
+    @_memoized('title')
     def normalize_title(self, title: str) -> str:
         """Normalize a job title.
 
@@ -126,21 +303,21 @@ class TextNormalizer:
         normalized = title.strip().title()
 
         # Expand abbreviations
-        for abbrev, full in self.TITLE_ABBREVIATIONS.items():
-            normalized = re.sub(abbrev, full, normalized, flags=re.IGNORECASE)
+        normalized = self._expand_title_abbreviations(normalized)
 
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = WHITESPACE.sub(' ', normalized).strip()
 
         # Remove special characters but keep important ones
-        normalized = re.sub(r'[^\w\s\-/()&]', '', normalized)
+        normalized = TITLE_SPECIAL_CHARS.sub('', normalized)
 
         # Standardize separators
         normalized = normalized.replace('/', ' / ')
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = WHITESPACE.sub(' ', normalized).strip()
 
         return normalized
 
+    @_memoized('location')
     def normalize_location(self, location: str) -> str:
         """Normalize a location string.
 
@@ -156,25 +333,25 @@ class TextNormalizer:
         normalized = location.strip()
 
         # Remove "Remote" indicators
-        if re.search(r'\b(remote|work from home|wfh)\b', normalized, re.IGNORECASE):
+        if REMOTE.search(normalized):
             return "Remote"
 
         # Expand common synonyms
-        for abbrev, full in self.LOCATION_SYNONYMS.items():
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-            normalized = re.sub(pattern, full, normalized, flags=re.IGNORECASE)
+        replacements = self._synonym_replacements
+        normalized = self._synonym_pattern.sub(
+            lambda match: replacements[match.lastindex], normalized)
 
-        # Expand state abbreviations
-        for abbrev, full in self.STATE_ABBREVIATIONS.items():
-            # Match state abbreviation at end of string (e.g., "Seattle, WA")
-            pattern = r',\s*' + abbrev + r'\b'
-            normalized = re.sub(pattern, f', {full}', normalized)
+        # Expand state abbreviations (e.g., "Seattle, WA")
+        states = self.STATE_ABBREVIATIONS
+        normalized = self._state_pattern.sub(
+            lambda match: ', ' + states[match.group(1)], normalized)
 
         # Standardize format: "City, State" or "City, Country"
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = WHITESPACE.sub(' ', normalized).strip()
 
         return normalized
 
+    @_memoized('seniority')
     def extract_seniority_level(self, title: str) -> Optional[int]:
         """Extract seniority level from title.
 
@@ -186,16 +363,14 @@ class TextNormalizer:
         """
         title_lower = title.lower()
 
-        # Check for exact matches first
-        for level_name, level_value in sorted(
-            self.SENIORITY_LEVELS.items(),
-            key=lambda x: -len(x[0])  # Longest match first
-        ):
+        # Longest match first
+        for level_name, level_value in self._levels_longest_first:
             if level_name in title_lower:
                 return level_value
 
         return None
 
+    @_memoized('key_terms')
     def extract_key_terms(self, title: str) -> set:
         """Extract key terms from a job title.
 
@@ -209,22 +384,7 @@ class TextNormalizer:
         normalized = self.normalize_title(title)
 
         # Remove seniority indicators
-        for level in self.SENIORITY_LEVELS.keys():
-            normalized = re.sub(
-                r'\b' + re.escape(level) + r'\b',
-                '',
-                normalized,
-                flags=re.IGNORECASE
-            )
-
-        # Remove common filler words
-        filler_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
-            'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was',
-            'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do',
-            'does', 'did', 'will', 'would', 'could', 'should', 'may',
-            'might', 'must', 'can'
-        }
+        normalized = self._level_pattern.sub('', normalized)
 
         # Split into words
         words = normalized.lower().split()
@@ -232,11 +392,12 @@ class TextNormalizer:
         # Keep meaningful words (3+ characters, not filler)
         key_terms = {
             word for word in words
-            if len(word) >= 3 and word not in filler_words
+            if len(word) >= 3 and word not in FILLER_WORDS
         }
 
         return key_terms
 
+    @_memoized('company')
     def normalize_company_name(self, company: str) -> str:
         """Normalize company name.
 
@@ -252,28 +413,42 @@ class TextNormalizer:
         normalized = company.strip()
 
         # Remove common suffixes
-        suffixes = [
-            r'\bInc\.?$',
-            r'\bLLC\.?$',
-            r'\bLtd\.?$',
-            r'\bCorp\.?$',
-            r'\bCorporation$',
-            r'\bLimited$',
-            r'\bCompany$',
-            r'\bCo\.?$',
-        ]
-
-        for suffix in suffixes:
-            normalized = re.sub(suffix, '', normalized, flags=re.IGNORECASE)
+        for suffix in self._company_suffixes:
+            normalized = suffix.sub('', normalized)
 
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = WHITESPACE.sub(' ', normalized).strip()
 
         # Title case
         normalized = normalized.title()
 
         return normalized
 
+    def cache_info(self) -> Dict[str, Dict]:
+        """Hit counters and sizes of the result caches.
+
+        Returns:
+            Dictionary mapping kind ('title', 'location', 'seniority',
+            'key_terms', 'company') to hits, misses, hit_rate, size and
+            maxsize; empty when caching is disabled
+        """
+        return {kind: cache.info() for kind, cache in self._caches.items()}
+
+    def flush(self) -> int:
+        """Write the cached results to the store, if there is one.
+
+        Returns:
+            Number of results written
+        """
+        if self.store is None:
+            return 0
+        written = 0
+        for kind, cache in self._caches.items():
+            entries = [(text, sorted(value) if isinstance(value, frozenset) else value)
+                       for text, value in cache.data.items()]
+            written += self.store.save(kind, NORMALIZER_VERSION, entries, self.cache_size)
+        return written
+
 
 def test_normalizer():
     """Test the normalizer."""
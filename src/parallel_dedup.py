@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Multi-core fuzzy deduplication across companies.
+Jobs are only ever compared within their company, so the companies are
+independent partitions of the work. ParallelDeduplicator normalizes the
+jobs and scores each company's candidate pairs on a process pool, then
+links the duplicate pairs into clusters in the parent:
+
+  - companies larger than block_size are split into row blocks (the pairs
+    whose first job falls in the block), so one large tenant does not
+    leave the other workers idle at the end of the run
+  - a task carries only its block's jobs and the later jobs they can be
+    paired with: the ones sharing a blocking key, found with the company's
+    CandidateIndex built once in the parent (without blocking, every
+    later job)
+  - tasks are submitted largest first (by the number of pairs they can
+    score), the usual longest-processing-time schedule
+  - clustering is order-independent (union-find), so the result is the
+    same as FuzzyDeduplicator.cluster_duplicates() on one core
+"""
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .deduplicator import FuzzyDeduplicator, JobFeatures
+except ImportError:
+    from deduplicator import FuzzyDeduplicator, JobFeatures
+
+# Jobs per normalization task
+FEATURE_CHUNK = 2000
+
+# Deduplicators built in this (worker) process, by settings
+_deduplicators: Dict[Tuple, FuzzyDeduplicator] = {}
+
+
+def _deduplicator(settings: Dict) -> FuzzyDeduplicator:
+    key = tuple(sorted(settings.items()))
+    if key not in _deduplicators:
+        _deduplicators[key] = FuzzyDeduplicator(**settings)
+    return _deduplicators[key]
+
+
+def extract_chunk(settings: Dict, jobs: List[Dict]) -> List[JobFeatures]:
+    """Features of a chunk of jobs (runs in a worker)."""
+    dedup = _deduplicator(settings)
+    return [dedup.extract_features(job) for job in jobs]
+
+
+def score_block(settings: Dict, features: List[JobFeatures], keys: Optional[List],
+                rows: int) -> Tuple[List[Tuple[int, int, float]], Dict]:
+    """Duplicate pairs (i, j, score) of a block with i among the first rows jobs.
+
+    Runs in a worker. features are the block's jobs followed by their
+    partners, in company order; keys are their blocking keys (None without
+    blocking). Indexes are positions in features.
+    """
+    dedup = FuzzyDeduplicator(**settings)
+    pairs = list(dedup._duplicate_pairs(features, range(rows), keys))
+    return pairs, {'pairs_scored': dedup.stats['pairs_scored']}
+
+
+class ParallelDeduplicator:
+    """Runs cluster_duplicates over many companies on a process pool."""
+
+    def __init__(self, deduplicator: Optional[FuzzyDeduplicator] = None,
+                 max_workers: Optional[int] = None, block_size: int = 5000):
+        """Initialize parallel deduplicator.
+
+        Args:
+            deduplicator: FuzzyDeduplicator whose settings are used (default:
+                FuzzyDeduplicator()); if it has a database, features come
+                from its cache in this process instead of the pool
+            max_workers: Worker processes (default: CPU count); 1 runs
+                every task in this process
+            block_size: Largest number of rows of one company per task
+        """
+        self.deduplicator = deduplicator or FuzzyDeduplicator()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.block_size = block_size
+        self.stats = {'tasks': 0, 'largest_task': 0, 'jobs_sent': 0,
+                      'pairs_total': 0, 'pairs_scored': 0}
+        self._pool = None
+
+    @property
+    def settings(self) -> Dict:
+        """Constructor arguments that rebuild the deduplicator in a worker."""
+        dedup = self.deduplicator
+        return {
+            'title_threshold': dedup.title_threshold,
+            'location_threshold': dedup.location_threshold,
+            'combined_threshold': dedup.combined_threshold,
+            'blocking': dedup.blocking,
+            'vectorized': dedup.vectorized,
+            'batch_size': dedup.batch_size,
+        }
+
+    def _get_pool(self):
+        """Create the worker pool on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _map(self, func, tasks: List[Tuple]) -> List:
+        """Call func(settings, *task) for every task, in task order."""
+        if self.max_workers <= 1:
+            return [func(self.settings, *task) for task in tasks]
+        pool = self._get_pool()
+        futures = [pool.submit(func, self.settings, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+    def cluster_duplicates(self, jobs: List[Dict]) -> Dict[str, List[Dict]]:
+        """Find duplicate clusters, spreading the work over the pool.
+
+        Args:
+            jobs: List of job dictionaries
+
+        Returns:
+            Dictionary mapping canonical job URL to [canonical, duplicates...],
+            the same as FuzzyDeduplicator.cluster_duplicates(jobs)
+        """
+        features = self.features_for(jobs)
+        by_company = defaultdict(list)
+        for i, f in enumerate(features):
+            by_company[f.company].append(i)
+
+        blocks = []
+        for members in by_company.values():
+            if len(members) < 2:
+                continue
+            company_features = [features[i] for i in members]
+            index = (self.deduplicator._candidate_index(company_features)
+                     if self.deduplicator.blocking else None)
+            for start in range(0, len(members), self.block_size):
+                stop = min(start + self.block_size, len(members))
+                later = (index.partners(start, stop) if index
+                         else range(stop, len(members)))
+                # Company positions of the task's jobs: the block, then partners
+                positions = list(range(start, stop)) + [j for j in later if j >= stop]
+                task = ([company_features[j] for j in positions],
+                        [index.keys[j] for j in positions] if index else None,
+                        stop - start)
+                blocks.append((self._cost(len(members), start, stop),
+                               [members[j] for j in positions], task))
+
+        # Largest first: the long tasks start while the short ones fill in
+        blocks.sort(key=lambda block: block[0], reverse=True)
+        results = self._map(score_block, [block[2] for block in blocks])
+
+        pairs = []
+        for (cost, jobs_of_task, _), (block_pairs, stats) in zip(blocks, results):
+            pairs.extend((jobs_of_task[a], jobs_of_task[b], score)
+                         for a, b, score in block_pairs)
+            self.stats['pairs_total'] += cost
+            self.stats['pairs_scored'] += stats['pairs_scored']
+        self.stats['tasks'] += len(blocks)
+        self.stats['jobs_sent'] += sum(len(block[2][0]) for block in blocks)
+        self.stats['largest_task'] = max([self.stats['largest_task']]
+                                         + [block[2][2] for block in blocks])
+
+        return self.deduplicator.clusters_from_pairs(jobs, pairs)
+
+    def features_for(self, jobs: List[Dict]) -> List[JobFeatures]:
+        """Features of jobs, normalized on the pool.
+
+        Each distinct (company, title, location) is normalized once.
+        With a database the deduplicator's cache is used instead.
+        """
+        dedup = self.deduplicator
+        if dedup.db is not None:
+            return dedup.features_for(jobs)
+
+        hashes = [dedup.content_hash(job) for job in jobs]
+        distinct = {}
+        for h, job in zip(hashes, jobs):
+            if h not in distinct:
+                distinct[h] = {field: job.get(field) or ''
+                               for field in ('company', 'title', 'location')}
+
+        order = list(distinct)
+        chunks = [order[i:i + FEATURE_CHUNK] for i in range(0, len(order), FEATURE_CHUNK)]
+        results = self._map(extract_chunk, [([distinct[h] for h in chunk],) for chunk in chunks])
+
+        computed = {}
+        for chunk, chunk_features in zip(chunks, results):
+            computed.update(zip(chunk, chunk_features))
+        return [computed[h] for h in hashes]
+
+    @staticmethod
+    def _cost(count: int, start: int, stop: int) -> int:
+        """Estimated work of rows [start, stop) of a company of count jobs.
+
+        The pairs (i, j > i) the rows could score: exact without blocking
+        (and counted as the rows' pairs_total), and with blocking still
+        growing with both the rows and the company.
+        """
+        return (stop - start) * (2 * count - start - stop - 1) // 2
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Pluggable executor for parsing Avature listing pages.
+Moves the CPU-bound HTML parse off the event loop (inline, thread or process).
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+try:
+    from .listing_parser import JobRow, PageInfo, parse_listing_page, parse_first_page
+except ImportError:
+    from listing_parser import JobRow, PageInfo, parse_listing_page, parse_first_page
+
+
+class ParseExecutor:
+    """Runs parse_listing_page inline, on a thread pool or on a process pool."""
+
+    MODES = ('inline', 'thread', 'process')
+
+    def __init__(self, mode: str = 'inline', max_workers: Optional[int] = None):
+        """Initialize parse executor.
+
+        Args:
+            mode: 'inline' (event loop thread), 'thread' or 'process'
+            max_workers: Pool size for thread/process modes (default: CPU count)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown parse mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self._pool = None
+
+    def _get_pool(self):
+        """Create the worker pool on first use."""
+        if self._pool is None:
+            if self.mode == 'thread':
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='parse')
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    async def parse(self, body: bytes, base_url: str,
+                    encoding: Optional[str] = None) -> List[JobRow]:
+        """Parse a listing page without blocking the event loop.
+
+        Args:
+            body: Raw page bytes
+            base_url: Base site URL
+            encoding: Charset from the response headers, if known
+
+        Returns:
+            List of JobRow tuples
+        """
+        return await self._run(parse_listing_page, body, base_url, encoding)
+
+    async def parse_first_page(self, body: bytes, base_url: str,
+                               encoding: Optional[str] = None
+                               ) -> Tuple[List[JobRow], Optional[PageInfo]]:
+        """Parse page 1 of a listing, including its result count.
+
+        Args:
+            body: Raw page bytes
+            base_url: Base site URL
+            encoding: Charset from the response headers, if known
+
+        Returns:
+            Tuple of (JobRow list, (total_results, page_size) or None)
+        """
+        return await self._run(parse_first_page, body, base_url, encoding)
+
+    async def _run(self, func, *args):
+        """Call a module-level parse function according to the mode."""
+        if self.mode == 'inline':
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), func, *args)
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
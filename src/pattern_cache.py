@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of detected URL patterns, shared by the sync and async
+URL detectors. Each entry records when the pattern was last verified and
+how confident the check was; fresh entries are trusted without another
+request.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+
+class PatternCache:
+    """JSON-backed map of site -> pattern with per-entry TTL and confidence.
+
+    File layout (data/pattern_cache.json):
+
+        {
+          "https://acme.avature.net/careers": {
+            "pattern": "/SearchJobs",
+            "confidence": 1.0,
+            "verified_at": "2026-02-03T23:15:29",
+            "ttl": 604800
+          },
+          "last_updated": "2026-02-03T23:15:29"
+        }
+
+    Entries from the older flat format ({site: pattern}) are read as
+    unverified, so they are checked once and then rewritten.
+    """
+
+    def __init__(self, cache_file: str = 'data/pattern_cache.json',
+                 ttl: float = 7 * 24 * 3600, min_confidence: float = 0.5):
+        """Load the cache.
+
+        Args:
+            cache_file: Path to the JSON file
+            ttl: Seconds a pattern verified with full confidence stays fresh;
+                less confident entries get a proportionally shorter TTL
+            min_confidence: Entries below this are always re-verified
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.min_confidence = min_confidence
+        self.entries: Dict[str, Dict] = {}
+        self.last_updated = None
+        self._load()
+
+    def _load(self):
+        """Read the cache file (missing or corrupt files start empty)."""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self.last_updated = data.pop('last_updated', None)
+        for site, value in data.items():
+            if isinstance(value, str):
+                # Old flat format: pattern only, never verified with a TTL
+                value = {'pattern': value, 'confidence': 0.0,
+                         'verified_at': None, 'ttl': 0}
+            if isinstance(value, dict) and 'pattern' in value:
+                self.entries[site] = value
+
+    def save(self):
+        """Write the cache file."""
+        directory = os.path.dirname(self.cache_file)
+        os.makedirs(directory if directory else '.', exist_ok=True)
+
+        data = dict(self.entries)
+        data['last_updated'] = self.last_updated
+        with open(self.cache_file, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    def get(self, site: str) -> Optional[Dict]:
+        """Cached entry for a site, or None."""
+        return self.entries.get(site)
+
+    def is_fresh(self, site: str, now: Optional[datetime] = None) -> bool:
+        """Whether the site's pattern can be used without verifying it.
+
+        Args:
+            site: Base site URL
+            now: Current time (for tests)
+
+        Returns:
+            True if the entry is confident enough and inside its TTL
+        """
+        entry = self.entries.get(site)
+        if not entry or not entry.get('verified_at'):
+            return False
+        if entry.get('confidence', 0.0) < self.min_confidence:
+            return False
+
+        verified_at = datetime.fromisoformat(entry['verified_at'])
+        age = (now or datetime.now()) - verified_at
+        return age < timedelta(seconds=entry.get('ttl', 0))
+
+    def record(self, site: str, pattern: str, confidence: float):
+        """Store a pattern that just passed verification.
+
+        Re-verifying the same pattern raises its confidence (and so its TTL)
+        towards 1.0.
+
+        Args:
+            site: Base site URL
+            pattern: Working pattern path
+            confidence: Strength of the job-page evidence, 0.0-1.0
+        """
+        previous = self.entries.get(site)
+        if previous and previous['pattern'] == pattern:
+            confidence = max(confidence,
+                             min(1.0, previous.get('confidence', 0.0) + 0.25))
+
+        now = datetime.now()
+        self.entries[site] = {
+            'pattern': pattern,
+            'confidence': round(confidence, 2),
+            'verified_at': now.isoformat(timespec='seconds'),
+            'ttl': int(self.ttl * confidence),
+        }
+        self.last_updated = now.isoformat()
+        self.save()
+
+    def invalidate(self, site: str):
+        """Forget a site's pattern (it stopped working)."""
+        if self.entries.pop(site, None) is not None:
+            self.save()
+
+    def clear(self, site: Optional[str] = None):
+        """Clear one site, or the whole cache."""
+        if site:
+            self.invalidate(site)
+        else:
+            self.entries = {}
+            self.save()
+
+    def __contains__(self, site: str) -> bool:
+        return site in self.entries
+
+    def get_stats(self) -> Dict:
+        """Counts by pattern plus how many entries are still fresh."""
+        patterns = {}
+        for entry in self.entries.values():
+            name = entry['pattern'] if entry['pattern'] else '(base URL)'
+            patterns[name] = patterns.get(name, 0) + 1
+
+        return {
+            'total_sites': len(self.entries),
+            'fresh_sites': sum(1 for site in self.entries if self.is_fresh(site)),
+            'patterns': patterns,
+            'last_updated': self.last_updated or 'Never',
+        }
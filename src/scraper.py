@@ -7,9 +7,18 @@ import re
 import time
 import json
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
 from tqdm import tqdm
-from datetime import datetime
+
+try:
+    from .listing_parser import (parse_document, extract_rows, has_next_page,
+                                 extract_page_info, page_count,
+                                 extract_job_row, job_from_row)
+    from .validator_cache import ValidatorCache
+except ImportError:
+    from listing_parser import (parse_document, extract_rows, has_next_page,
+                                extract_page_info, page_count,
+                                extract_job_row, job_from_row)
+    from validator_cache import ValidatorCache
 
 # Import URL detector for pattern detection
 try:
@@ -20,21 +29,24 @@ except ImportError:
     print("Warning: url_detector not available, using default /SearchJobs pattern")
 
 class AvatureScraper:
-    def __init__(self, use_url_detector=True):
+    def __init__(self, use_url_detector=True, validator_cache=None):
         """
         Initialize scraper
 
         Args:
             use_url_detector: Use URL detector for automatic pattern detection
+            validator_cache: Optional ValidatorCache; listing pages are then
+                fetched conditionally and unchanged pages are not re-parsed
         """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
         self.jobs = []
+        self.validator_cache = validator_cache
 
         # Initialize URL detector if available and requested
         if use_url_detector and URL_DETECTOR_AVAILABLE:
-            self.url_detector = AvatureURLDetector()
+            self.url_detector = AvatureURLDetector(validator_cache=validator_cache)
             self.use_url_detector = True
         else:
             self.url_detector = None
@@ -47,7 +59,7 @@ class AvatureScraper:
         try:
             # Detect URL pattern if detector is available
             if self.use_url_detector and self.url_detector:
-                pattern = self.url_detector.detect_pattern(base_url)
+                pattern, probe = self.url_detector.detect_pattern_with_response(base_url)
 
                 if pattern is None:
                     print(f"  ✗ No compatible URL pattern found for {base_url}")
@@ -57,8 +69,10 @@ class AvatureScraper:
             else:
                 # Fallback to default pattern
                 search_url = f"{base_url}/SearchJobs"
+                probe = None
 
-            jobs = self.scrape_search_page(search_url, base_url)
+            # The page fetched to validate the pattern doubles as page 1
+            jobs = self.scrape_search_page(search_url, base_url, probe=probe)
 
             print(f"  Found {len(jobs)} jobs")
             return jobs
@@ -67,11 +81,24 @@ class AvatureScraper:
             print(f"  Error: {e}")
             return []
 
-    def scrape_search_page(self, search_url, base_url):
-        """Scrape jobs from the search/listing page with pagination."""
+    def scrape_search_page(self, search_url, base_url, probe=None):
+        """Scrape jobs from the search/listing page with pagination.
+
+        If page 1 shows a result count ("1-20 of 145 results") the scraper
+        stops after the last page it implies; otherwise it follows the
+        next-page links until a page comes back empty.
+
+        Args:
+            search_url: Search URL (page 1)
+            base_url: Base site URL
+            probe: Optional ProbeResponse for search_url from the URL
+                detector, used as page 1 instead of downloading it again
+        """
         jobs = []
         page = 1
         max_pages = 100  # Safety limit
+        page_info = {}
+        last_page = None
 
         while page <= max_pages:
             print(f"  Page {page}...", end=' ')
@@ -81,31 +108,32 @@ class AvatureScraper:
                 # Try common patterns
                 page_url = self.get_page_url(search_url, page)
 
-                response = requests.get(page_url, headers=self.headers, timeout=15)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, 'lxml')
-
-                # Find job articles
-                articles = soup.find_all('article')
+                if page == 1:
+                    rows, has_next, unchanged = self.fetch_listing_page(
+                        page_url, base_url, page_info, probe=probe
+                    )
+                else:
+                    rows, has_next, unchanged = self.fetch_listing_page(page_url, base_url)
 
-                if not articles:
+                if not rows:
                     print("No more jobs")
                     break
 
-                print(f"{len(articles)} jobs")
+                print(f"{len(rows)} jobs" + (" (unchanged)" if unchanged else ""))
 
-                for article in articles:
-                    job = self.extract_job_from_article(article, base_url)
-                    if job:
-                        jobs.append(job)
+                for row in rows:
+                    jobs.append(self.job_from_row(row, base_url))
 
-                # Check if there's a next page
-                # Look for pagination controls
-                next_button = soup.find('a', {'class': re.compile(r'next|pagination', re.I)})
-                pagination_links = soup.find_all('a', href=re.compile(r'page=\d+'))
+                if page == 1 and page_info:
+                    last_page = page_count(page_info['total_results'],
+                                           page_info['page_size'], max_pages)
 
-                if not next_button and not pagination_links:
+                # Check if there's a next page: the result count is exact,
+                # otherwise look for pagination controls
+                if last_page is not None:
+                    if page >= last_page:
+                        break
+                elif not has_next:
                     # No more pages
                     break
 
@@ -118,6 +146,75 @@ class AvatureScraper:
 
         return jobs
 
+    def fetch_listing_page(self, page_url, base_url, page_info=None, probe=None):
+        """Download and parse a listing page, skipping the parse if unchanged.
+
+        With a validator cache the request carries If-None-Match /
+        If-Modified-Since; a 304 or a body with the stored hash replays the
+        rows cached for the page.
+
+        Args:
+            page_url: Listing page URL
+            base_url: Base site URL
+            page_info: Optional dict, filled in place with total_results and
+                page_size if the page shows a result count
+            probe: Optional ProbeResponse already fetched for page_url; it
+                is used (and its parse reused) instead of a new request
+
+        Returns:
+            Tuple of (job rows, has_next_page, unchanged)
+        """
+        cache = self.validator_cache
+        entry = cache.get(page_url, site=base_url) if cache else None
+        if entry and entry['rows'] is None:
+            entry = None  # Validators only, nothing to replay
+
+        if probe is not None and probe.url == page_url:
+            content, response_headers = probe.body, probe.headers
+        else:
+            probe = None
+            headers = dict(self.headers)
+            headers.update(ValidatorCache.request_headers(entry))
+            response = requests.get(page_url, headers=headers, timeout=15)
+
+            if response.status_code == 304 and entry:
+                self._fill_page_info(page_info, entry['page_info'])
+                return entry['rows'], entry['has_next'], True
+            response.raise_for_status()
+            content, response_headers = response.content, response.headers
+
+        if cache:
+            body_hash = ValidatorCache.content_hash(content)
+            if entry and entry['content_hash'] == body_hash:
+                cache.store(page_url, response_headers, body_hash,
+                            entry['rows'], entry['has_next'], site=base_url,
+                            page_info=entry['page_info'])
+                self._fill_page_info(page_info, entry['page_info'])
+                return entry['rows'], entry['has_next'], True
+
+        if probe is None:
+            root = parse_document(response.text)
+        elif probe.root is not None:
+            root = probe.root  # Already parsed by the detector
+        else:
+            root = parse_document(probe.body, probe.encoding)
+        rows = extract_rows(root, base_url)
+        has_next = has_next_page(root)
+        info = extract_page_info(root)
+        self._fill_page_info(page_info, info)
+
+        if cache:
+            cache.store(page_url, response_headers, body_hash, rows, has_next,
+                        site=base_url, page_info=info)
+
+        return rows, has_next, False
+
+    @staticmethod
+    def _fill_page_info(page_info, info):
+        """Copy a (total_results, page_size) pair into the caller's dict."""
+        if page_info is not None and info:
+            page_info['total_results'], page_info['page_size'] = info
+
     def get_page_url(self, base_search_url, page):
         """Generate URL for a specific page number."""
         if page == 1:
@@ -132,56 +229,19 @@ class AvatureScraper:
     def extract_job_from_article(self, article, base_url):
         """Extract job information from an article element."""
         try:
-            # Find the job link
-            link = article.find('a', href=re.compile(r'JobDetail|FolderDetail', re.I))
-
-            if not link:
-                return None
-
-            # Extract title
-            title = link.get_text(strip=True)
-
-            # Extract URL
-            job_url = link.get('href')
-            if not job_url.startswith('http'):
-                job_url = urljoin(base_url, job_url)
-
-            # Extract job ID from URL
-            job_id_match = re.search(r'/(\d+)$', job_url)
-            job_id = job_id_match.group(1) if job_id_match else None
-
-            # Try to extract location from article
-            location = None
-            location_elem = article.find(attrs={'class': re.compile(r'location', re.I)})
-            if location_elem:
-                location = location_elem.get_text(strip=True)
-
-            # Try to extract other metadata
-            metadata = {}
-
-            # Look for date posted
-            date_elem = article.find('time')
-            if date_elem:
-                metadata['date_posted'] = date_elem.get('datetime') or date_elem.get_text(strip=True)
-
-            job = {
-                'title': title,
-                'url': job_url,
-                'job_id': job_id,
-                'location': location,
-                'company_url': base_url,
-                'company': urlparse(base_url).netloc.split('.')[0],
-                'scraped_at': datetime.now().isoformat(),
-                'metadata': metadata,
-                'description': None,  # Will be filled by scrape_job_detail if needed
-            }
-
-            return job
+            row = extract_job_row(article, base_url)
+            return self.job_from_row(row, base_url) if row else None
 
         except Exception as e:
             print(f"    Error extracting job: {e}")
             return None
 
+    def job_from_row(self, row, base_url):
+        """Build a job dictionary from a parsed listing row."""
+        job = job_from_row(row, base_url)
+        job['description'] = None  # Will be filled by scrape_job_detail if needed
+        return job
+
     def scrape_job_detail(self, job_url):
         """Scrape full job description from detail page."""
         try:
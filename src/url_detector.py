@@ -7,57 +7,140 @@ and checking for job indicators in the HTML response.
 """
 import requests
 import re
-import json
-import os
-from bs4 import BeautifulSoup
-from typing import Optional, Dict
-from datetime import datetime
+from lxml import etree
+from typing import Iterable, Optional, Dict, Mapping, NamedTuple, Tuple
+
+try:
+    from .listing_parser import parse_document, find_articles
+    from .pattern_cache import PatternCache
+except ImportError:
+    from listing_parser import parse_document, find_articles
+    from pattern_cache import PatternCache
+
+
+# Common Avature URL patterns, ordered by frequency
+PATTERNS = [
+    '/SearchJobs',        # Most common (Bloomberg, Tesco, UCLA)
+    '/JobSearch',         # Alternative pattern
+    '/FolderDetail',      # Folder-based view
+    '/JobList',           # List pattern
+    '/Opportunities',     # Some sites use this
+    '',                   # Direct /careers page (fallback)
+]
+
+_NS = {'re': 'http://exslt.org/regular-expressions'}
+
+# Job-page indicators (same matching rules as the BeautifulSoup checks they replace)
+JOB_CLASS = etree.XPath("boolean(//*[re:test(@class, 'job', 'i')])", namespaces=_NS)
+JOB_LINK = etree.XPath("boolean(//a[re:test(@href, 'JobDetail|FolderDetail', 'i')])",
+                       namespaces=_NS)
+SEARCH_CLASS = etree.XPath("boolean(//*[re:test(@class, 'search|filter', 'i')])",
+                           namespaces=_NS)
+JOB_TEXT_PATTERN = re.compile(r'jobs?\s+found|positions?\s+available|openings?', re.I)
+
+# Confidence at or above which a probe answer is taken without waiting
+# for the other candidates
+STRONG_CONFIDENCE = 1.0
+
+# Byte patterns that settle a page as a job listing without parsing it
+# (a job <article> or a job link)
+LISTING_MARKERS = re.compile(rb'<article[\s>]|JobDetail|FolderDetail', re.I)
+
+# Bytes re-scanned across chunk boundaries (longest marker)
+MARKER_OVERLAP = 16
+
+STREAM_CHUNK_SIZE = 8192
+
+
+class ProbeResponse(NamedTuple):
+    """The page that validated a pattern, kept so it can serve as page 1."""
+    url: str
+    body: bytes
+    encoding: Optional[str]          # Charset from Content-Type, if declared
+    headers: Mapping[str, str]
+    root: Optional[etree._Element]   # Parsed page, None if it was not parsed
+
+
+def score_listing_page(root: Optional[etree._Element], text: str) -> float:
+    """Rate how clearly a page is a job listing.
+
+    Indicators are checked strongest first and the first hit decides.
+
+    Args:
+        root: Parsed page
+        text: Page text (for the wording check)
+
+    Returns:
+        1.0 for job articles or job links, 0.6 for job-named elements,
+        0.4 for job wording, 0.3 for search/filter widgets, 0.0 otherwise
+    """
+    if root is not None:
+        # Strategy 1: Look for article tags (most common)
+        # Strategy 3: Look for JobDetail or FolderDetail links
+        if find_articles(root) or JOB_LINK(root):
+            return 1.0
+
+        # Strategy 2: Look for elements with "job" in class name
+        if JOB_CLASS(root):
+            return 0.6
+
+    # Strategy 4: Look for common job-related text patterns
+    if JOB_TEXT_PATTERN.search(text):
+        return 0.4
+
+    # Strategy 5: Look for search/filter elements
+    if root is not None and SEARCH_CLASS(root):
+        return 0.3
+
+    return 0.0
+
+
+def scan_stream(chunks: Iterable[bytes]) -> Tuple[bool, bytes]:
+    """Read a body chunk by chunk, watching for LISTING_MARKERS.
+
+    Args:
+        chunks: Body chunks as they arrive
+
+    Returns:
+        Tuple of (marker seen, body)
+    """
+    buffer = bytearray()
+    matched = False
+    for chunk in chunks:
+        if matched:
+            buffer += chunk
+            continue
+
+        start = max(0, len(buffer) - MARKER_OVERLAP)
+        buffer += chunk
+        matched = LISTING_MARKERS.search(buffer, start) is not None
+
+    return matched, bytes(buffer)
 
 
 class AvatureURLDetector:
     """Detect which URL pattern an Avature site uses"""
 
-    # Common Avature URL patterns, ordered by frequency
-    PATTERNS = [
-        '/SearchJobs',        # Most common (Bloomberg, Tesco, UCLA)
-        '/JobSearch',         # Alternative pattern
-        '/FolderDetail',      # Folder-based view
-        '/JobList',           # List pattern
-        '/Opportunities',     # Some sites use this
-        '',                   # Direct /careers page (fallback)
-    ]
+    PATTERNS = PATTERNS
 
-    def __init__(self, cache_file='data/pattern_cache.json'):
+    def __init__(self, cache_file='data/pattern_cache.json', validator_cache=None,
+                 pattern_cache: Optional[PatternCache] = None):
         """
         Initialize detector with optional pattern cache
 
         Args:
             cache_file: Path to JSON file for caching detected patterns
+            validator_cache: Optional ValidatorCache; pages that passed before
+                are re-checked with conditional requests
+            pattern_cache: Optional PatternCache to share (overrides cache_file)
         """
         self.cache_file = cache_file
-        self.cache = self._load_cache()
+        self.validator_cache = validator_cache
+        self.cache = pattern_cache or PatternCache(cache_file)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
 
-    def _load_cache(self) -> Dict[str, str]:
-        """Load pattern cache from file"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {}
-
-    def _save_cache(self):
-        """Save pattern cache to file"""
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.cache_file) if os.path.dirname(self.cache_file) else '.', exist_ok=True)
-
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f, indent=2)
-
     def detect_pattern(self, base_url: str, force_refresh: bool = False) -> Optional[str]:
         """
         Try each pattern and return the first that works
@@ -69,15 +152,42 @@ class AvatureURLDetector:
         Returns:
             Working pattern path (e.g., "/SearchJobs"), or None if none work
         """
+        return self.detect_pattern_with_response(base_url, force_refresh)[0]
+
+    def detect_pattern_with_response(self, base_url: str, force_refresh: bool = False
+                                     ) -> Tuple[Optional[str], Optional[ProbeResponse]]:
+        """
+        Like detect_pattern, but also hand back the page that was fetched
+
+        The search page downloaded to validate the pattern is page 1 of the
+        listing, so scrapers can extract jobs from it instead of fetching
+        it again. A cached pattern that is still fresh is returned without
+        any request.
+
+        Args:
+            base_url: Base URL like "https://company.avature.net/careers"
+            force_refresh: Ignore cache and re-detect
+
+        Returns:
+            Tuple of (pattern or None, ProbeResponse or None); the response
+            is None for a fresh cache hit or a 304 Not Modified
+        """
         # Check cache first
         if not force_refresh and base_url in self.cache:
-            cached_pattern = self.cache[base_url]
-            # Verify cached pattern still works
-            if self._test_url(f"{base_url}{cached_pattern}"):
+            cached_pattern = self.cache.get(base_url)['pattern']
+            if self.cache.is_fresh(base_url):
                 print(f"  ✓ Using cached pattern: {cached_pattern}")
-                return cached_pattern
+                return cached_pattern, None
+
+            # Verify cached pattern still works
+            confidence, probe = self._probe(f"{base_url}{cached_pattern}")
+            if confidence > 0:
+                print(f"  ✓ Using cached pattern: {cached_pattern} (re-verified)")
+                self.cache.record(base_url, cached_pattern, confidence)
+                return cached_pattern, probe
             else:
                 print(f"  ⚠ Cached pattern {cached_pattern} no longer works, re-detecting")
+                self.cache.invalidate(base_url)
 
         # Try each pattern
         print(f"  🔍 Detecting URL pattern for {base_url}")
@@ -85,18 +195,17 @@ class AvatureURLDetector:
             test_url = f"{base_url}{pattern}"
             print(f"    Testing: {pattern if pattern else '(base URL)'}")
 
-            if self._test_url(test_url):
+            confidence, probe = self._probe(test_url)
+            if confidence > 0:
                 print(f"    ✓ Found working pattern: {pattern if pattern else '(base URL)'}")
 
                 # Cache the result
-                self.cache[base_url] = pattern
-                self.cache['last_updated'] = datetime.now().isoformat()
-                self._save_cache()
+                self.cache.record(base_url, pattern, confidence)
 
-                return pattern
+                return pattern, probe
 
         print(f"    ✗ No compatible pattern found")
-        return None
+        return None, None
 
     def _test_url(self, url: str) -> bool:
         """
@@ -108,64 +217,88 @@ class AvatureURLDetector:
         Returns:
             True if page contains job indicators
         """
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+        return self._probe(url)[0] > 0
 
-            # Check status code
-            if response.status_code != 200:
-                return False
+    def _probe(self, url: str) -> Tuple[float, Optional[ProbeResponse]]:
+        """
+        Fetch a URL and check it for job indicators
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'lxml')
+        The body is streamed and scanned for job articles / job links at
+        the byte level; a hit settles the check without parsing. Other
+        pages are parsed and scored on the weaker indicators. Bodies of
+        non-200 answers are never downloaded.
 
-            # Look for job indicators
-            indicators = [
-                # Strategy 1: Look for article tags (most common)
-                len(soup.find_all('article')) > 0,
+        Args:
+            url: Full URL to test
 
-                # Strategy 2: Look for elements with "job" in class name
-                len(soup.find_all(attrs={'class': re.compile(r'job', re.I)})) > 0,
+        Returns:
+            Tuple of (confidence, ProbeResponse for a 200 answer or None);
+            confidence is 0.0 if the page is not a job listing
+        """
+        try:
+            # Only pages that passed are cached, so 304 / same body means valid
+            entry = self.validator_cache.get(url) if self.validator_cache else None
+            headers = dict(self.headers)
+            if entry:
+                headers.update(self.validator_cache.request_headers(entry))
 
-                # Strategy 3: Look for JobDetail or FolderDetail links
-                len(soup.find_all('a', href=re.compile(r'JobDetail|FolderDetail', re.I))) > 0,
+            response = requests.get(url, headers=headers, timeout=10, stream=True)
+            try:
+                if response.status_code == 304 and entry:
+                    return STRONG_CONFIDENCE, None
+
+                # Check status code
+                if response.status_code != 200:
+                    return 0.0, None
+
+                matched, body = scan_stream(response.iter_content(STREAM_CHUNK_SIZE))
+            finally:
+                # Drops the connection if the body was never read
+                response.close()
+
+            content_type = response.headers.get('Content-Type', '').lower()
+            encoding = response.encoding if 'charset' in content_type else None
+
+            if self.validator_cache:
+                body_hash = self.validator_cache.content_hash(body)
+                if entry and entry['content_hash'] == body_hash:
+                    return STRONG_CONFIDENCE, ProbeResponse(
+                        url, body, encoding, response.headers, None
+                    )
+
+            if matched:
+                # Job markup found: no parse needed here (the scraper parses
+                # page 1 once)
+                confidence, root = STRONG_CONFIDENCE, None
+            else:
+                # Parse HTML and look for the weaker job indicators
+                root = parse_document(body, encoding)
+                text = body.decode(encoding or 'utf-8', errors='replace')
+                confidence = score_listing_page(root, text)
 
-                # Strategy 4: Look for common job-related text patterns
-                bool(re.search(r'jobs?\s+found|positions?\s+available|openings?',
-                              response.text, re.I)),
+            # If any indicator is True, this is likely a job listing page
+            if confidence == 0:
+                return 0.0, None
 
-                # Strategy 5: Look for search/filter elements
-                len(soup.find_all(attrs={'class': re.compile(r'search|filter', re.I)})) > 0,
-            ]
+            if self.validator_cache:
+                # Remember validators for the next check of this URL
+                self.validator_cache.store(url, response.headers, body_hash)
 
-            # If any indicator is True, this is likely a job listing page
-            return any(indicators)
+            return confidence, ProbeResponse(url, body, encoding, response.headers, root)
 
         except requests.exceptions.Timeout:
             print(f"      ⏱ Timeout testing {url}")
-            return False
+            return 0.0, None
         except requests.exceptions.RequestException as e:
             print(f"      ✗ Error testing {url}: {str(e)[:50]}")
-            return False
+            return 0.0, None
         except Exception as e:
             print(f"      ✗ Unexpected error: {str(e)[:50]}")
-            return False
+            return 0.0, None
 
     def get_cache_stats(self) -> Dict:
         """Get statistics about the pattern cache"""
-        stats = {
-            'total_sites': len([k for k in self.cache.keys() if k != 'last_updated']),
-            'patterns': {},
-            'last_updated': self.cache.get('last_updated', 'Never')
-        }
-
-        # Count patterns
-        for url, pattern in self.cache.items():
-            if url == 'last_updated':
-                continue
-            pattern_name = pattern if pattern else '(base URL)'
-            stats['patterns'][pattern_name] = stats['patterns'].get(pattern_name, 0) + 1
-
-        return stats
+        return self.cache.get_stats()
 
     def clear_cache(self, site_url: Optional[str] = None):
         """
@@ -176,12 +309,10 @@ class AvatureURLDetector:
         """
         if site_url:
             if site_url in self.cache:
-                del self.cache[site_url]
-                self._save_cache()
+                self.cache.clear(site_url)
                 print(f"Cleared cache for {site_url}")
         else:
-            self.cache = {}
-            self._save_cache()
+            self.cache.clear()
             print("Cleared entire pattern cache")
 
 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Persistent HTTP validator cache for listing pages.
+Stores ETag / Last-Modified / body fingerprint per (site, page URL), plus
+the rows the page produced, so unchanged pages can be answered without
+re-parsing.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class ValidatorCache:
+    """Sidecar SQLite store of response validators keyed by (site, page URL)."""
+
+    def __init__(self, cache_path: str = "data/validators.db"):
+        """Open (or create) the validator store.
+
+        Args:
+            cache_path: Path to the SQLite file (':memory:' for a throwaway cache)
+        """
+        self.cache_path = cache_path
+        if cache_path != ':memory:':
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        if cache_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+
+        # Older stores were keyed by URL alone or lacked result counts; it
+        # is only a cache, so rebuild rather than migrate
+        columns = [row['name'] for row in
+                   self.conn.execute("PRAGMA table_info(page_validators)")]
+        if columns and not {'site', 'page_size'} <= set(columns):
+            self.conn.execute("DROP TABLE page_validators")
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_validators (
+                site TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT NOT NULL,
+                rows TEXT,
+                has_next INTEGER,
+                total_results INTEGER,
+                page_size INTEGER,
+                checked_at TEXT NOT NULL,
+                PRIMARY KEY (site, url)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def content_hash(body: bytes) -> str:
+        """Hash a response body for change detection."""
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def get(self, url: str, site: str = '') -> Optional[Dict]:
+        """Look up the stored validators for a page.
+
+        Args:
+            url: Page URL
+            site: Site the page belongs to ('' for standalone checks such
+                as pattern detection)
+
+        Returns:
+            Dictionary with etag, last_modified, content_hash, rows,
+            has_next and page_info (None where only validators were stored),
+            or None if the URL was never cached
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM page_validators WHERE site = ? AND url = ?",
+                (site, url)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'etag': row['etag'],
+            'last_modified': row['last_modified'],
+            'content_hash': row['content_hash'],
+            'rows': ([tuple(r) for r in json.loads(row['rows'])]
+                     if row['rows'] is not None else None),
+            'has_next': bool(row['has_next']) if row['has_next'] is not None else None,
+            'page_info': ((row['total_results'], row['page_size'])
+                          if row['page_size'] is not None else None),
+        }
+
+    @staticmethod
+    def request_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Build conditional request headers from a cache entry.
+
+        Args:
+            entry: Result of get(), or None
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if none stored)
+        """
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, response_headers, content_hash: str,
+              rows: Optional[List] = None, has_next: Optional[bool] = None,
+              site: str = '', page_info: Optional[Tuple[int, int]] = None):
+        """Record validators for a freshly downloaded page.
+
+        Args:
+            url: Page URL
+            response_headers: Response headers (any case-insensitive mapping)
+            content_hash: content_hash() of the body
+            rows: Parsed job rows to replay while the page is unchanged
+            has_next: Whether the page links to a next page
+            site: Site the page belongs to
+            page_info: (total_results, page_size) read from the page
+        """
+        total_results, page_size = page_info or (None, None)
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO page_validators
+                    (site, url, etag, last_modified, content_hash, rows, has_next,
+                     total_results, page_size, checked_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(site, url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_hash = excluded.content_hash,
+                    rows = excluded.rows,
+                    has_next = excluded.has_next,
+                    total_results = excluded.total_results,
+                    page_size = excluded.page_size,
+                    checked_at = excluded.checked_at
+            """, (
+                site,
+                url,
+                response_headers.get('ETag'),
+                response_headers.get('Last-Modified'),
+                content_hash,
+                json.dumps(rows) if rows is not None else None,
+                int(has_next) if has_next is not None else None,
+                total_results,
+                page_size,
+                datetime.now().isoformat()
+            ))
+            self.conn.commit()
+
+    async def get_async(self, url: str, site: str = '') -> Optional[Dict]:
+        """get() on a worker thread, keeping SQLite off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, url, site)
+
+    async def store_async(self, *args, **kwargs):
+        """store() on a worker thread, keeping SQLite off the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self.store, *args, **kwargs))
+
+    def close(self):
+        """Close the store."""
+        self.conn.close()
@@ -18,6 +18,7 @@ from unittest.mock import Mock, patch, MagicMock
 from src.scraper import AvatureScraper
 from bs4 import BeautifulSoup
 import json
+import tempfile
 
 
 class TestAvatureScraperInitialization(unittest.TestCase):
@@ -287,6 +288,426 @@ class TestRateLimiting(unittest.TestCase):
         self.assertGreater(site_delay, page_delay)
 
 
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def bs4_listing_rows(body, base_url):
+    """Reference extraction: the original BeautifulSoup listing-page path"""
+    import re
+    from urllib.parse import urljoin
+
+    soup = BeautifulSoup(body, 'lxml')
+    rows = []
+    for article in soup.find_all('article'):
+        link = article.find('a', href=re.compile(r'JobDetail|FolderDetail', re.I))
+        if not link:
+            continue
+        job_url = link.get('href')
+        if not job_url.startswith('http'):
+            job_url = urljoin(base_url, job_url)
+        job_id_match = re.search(r'/(\d+)$', job_url)
+        location_elem = article.find(attrs={'class': re.compile(r'location', re.I)})
+        date_elem = article.find('time')
+        rows.append((
+            link.get_text(strip=True),
+            job_url,
+            job_id_match.group(1) if job_id_match else None,
+            location_elem.get_text(strip=True) if location_elem else None,
+            (date_elem.get('datetime') or date_elem.get_text(strip=True)) if date_elem else None,
+        ))
+    return rows
+
+
+class TestListingParser(unittest.TestCase):
+    """Test the lxml listing-page extractor against saved fixture pages"""
+
+    BASE_URL = 'https://acme.avature.net/careers'
+
+    def load(self, name):
+        """Read a fixture page as bytes"""
+        with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+            return f.read()
+
+    def test_matches_beautifulsoup_on_fixtures(self):
+        """Test that every fixture yields the same rows as the BeautifulSoup path"""
+        from src.listing_parser import parse_listing_page
+
+        for name in sorted(os.listdir(FIXTURES_DIR)):
+            body = self.load(name)
+            with self.subTest(fixture=name):
+                expected = bs4_listing_rows(body, self.BASE_URL)
+                self.assertEqual(parse_listing_page(body, self.BASE_URL), expected)
+                # Decoded text (sync scraper input) takes the same path
+                text = body.decode('utf-8', errors='replace')
+                self.assertEqual(parse_listing_page(text, self.BASE_URL),
+                                 bs4_listing_rows(text, self.BASE_URL))
+
+    def test_standard_page(self):
+        """Test extraction from a typical results page"""
+        from src.listing_parser import parse_listing_page
+
+        rows = parse_listing_page(self.load('listing_standard.html'), self.BASE_URL)
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0][0], 'Dispatcher (Dimond, Invercargill)')
+        self.assertEqual(rows[0][3], 'Southland')
+        self.assertIsNone(rows[1][3])
+        self.assertEqual(rows[2], ('Driver', 'https://fb.avature.net/careers/JobDetail/Driver/42029',
+                                   '42029', 'Northland', '2026-01-28'))
+        self.assertEqual(rows[3][4], 'Posted today')
+
+    def test_declared_charset(self):
+        """Test that a non-UTF-8 page is decoded from its meta charset"""
+        from src.listing_parser import parse_listing_page
+
+        rows = parse_listing_page(self.load('listing_windows1252.html'), self.BASE_URL)
+
+        self.assertEqual(rows[0][0], 'Diseñador Gráfico – Señor')
+        self.assertEqual(rows[1][3], 'Zürich')
+
+    def test_pagination_detection(self):
+        """Test next-page detection"""
+        from src.listing_parser import parse_document, has_next_page
+
+        self.assertTrue(has_next_page(parse_document(self.load('listing_standard.html'))))
+        self.assertTrue(has_next_page(parse_document(self.load('listing_edge_cases.html'))))
+        self.assertFalse(has_next_page(parse_document(self.load('listing_empty.html'))))
+        self.assertFalse(has_next_page(parse_document(b'')))
+
+    def test_result_count(self):
+        """Test reading total results and page size from the legend"""
+        from src.listing_parser import parse_document, extract_page_info, page_count
+
+        root = parse_document(self.load('listing_standard.html'))
+        self.assertEqual(extract_page_info(root), (37, 4))
+        self.assertIsNone(extract_page_info(parse_document(self.load('listing_empty.html'))))
+        # Only a first page's legend describes the page size
+        later = b'<div class="legend">Showing 21 - 40 of 1,203 jobs</div>'
+        self.assertIsNone(extract_page_info(parse_document(later)))
+        first = b'<div class="legend">Showing 1 \xe2\x80\x93 20 of 1,203 jobs</div>'
+        self.assertEqual(extract_page_info(parse_document(first, 'utf-8')), (1203, 20))
+
+        self.assertEqual(page_count(37, 4, 100), 10)
+        self.assertEqual(page_count(40, 4, 100), 10)
+        self.assertEqual(page_count(0, 20, 100), 1)
+        self.assertEqual(page_count(5000, 20, 100), 100)
+
+    def test_scraper_accepts_beautifulsoup_article(self):
+        """Test that extract_job_from_article still takes BeautifulSoup tags"""
+        scraper = AvatureScraper(use_url_detector=False)
+        soup = BeautifulSoup(self.load('listing_standard.html'), 'lxml')
+
+        job = scraper.extract_job_from_article(soup.find_all('article')[2], self.BASE_URL)
+
+        self.assertEqual(job['title'], 'Driver')
+        self.assertEqual(job['location'], 'Northland')
+        self.assertEqual(job['metadata'], {'date_posted': '2026-01-28'})
+        self.assertIsNone(job['description'])
+
+
+class TestConditionalRequests(unittest.TestCase):
+    """Test conditional fetching with the validator cache (sync path)"""
+
+    PAGE_URL = 'https://acme.avature.net/careers/SearchJobs'
+    BASE_URL = 'https://acme.avature.net/careers'
+
+    def setUp(self):
+        """Create a throwaway validator cache"""
+        from src.validator_cache import ValidatorCache
+        self.cache = ValidatorCache(':memory:')
+        with open(os.path.join(FIXTURES_DIR, 'listing_standard.html'), 'rb') as f:
+            self.body = f.read()
+
+    def tearDown(self):
+        """Close the validator cache"""
+        self.cache.close()
+
+    def response(self, status, body=b''):
+        """Build a fake requests response"""
+        response = Mock()
+        response.status_code = status
+        response.content = body
+        response.text = body.decode('utf-8')
+        response.iter_content = lambda chunk_size: iter([body])
+        response.headers = {'ETag': '"v1"'} if status == 200 else {}
+        return response
+
+    def test_not_modified_replays_rows(self):
+        """Test that a 304 replays the rows cached for the page"""
+        scraper = AvatureScraper(use_url_detector=False, validator_cache=self.cache)
+
+        with patch('src.scraper.requests.get') as get:
+            get.return_value = self.response(200, self.body)
+            rows1, has_next1, unchanged1 = scraper.fetch_listing_page(self.PAGE_URL, self.BASE_URL)
+
+            get.return_value = self.response(304)
+            rows2, has_next2, unchanged2 = scraper.fetch_listing_page(self.PAGE_URL, self.BASE_URL)
+
+        self.assertFalse(unchanged1)
+        self.assertTrue(unchanged2)
+        self.assertEqual(rows2, rows1)
+        self.assertEqual(has_next2, has_next1)
+        self.assertEqual(get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+
+    def test_stops_at_counted_last_page(self):
+        """Test that the page-1 result count ends pagination exactly"""
+        scraper = AvatureScraper(use_url_detector=False, validator_cache=self.cache)
+
+        with patch('src.scraper.requests.get') as get, patch('src.scraper.time.sleep'):
+            get.return_value = self.response(200, self.body)  # "1-4 of 37 results"
+            jobs = scraper.scrape_search_page(self.PAGE_URL, self.BASE_URL)
+
+        # Every page links to a next one; without the count it would run on
+        self.assertEqual(get.call_count, 10)
+        self.assertEqual(len(jobs), 40)
+        self.assertEqual(self.cache.get(self.PAGE_URL, site=self.BASE_URL)['page_info'],
+                         (37, 4))
+
+    def test_not_modified_replays_page_info(self):
+        """Test that a 304 on page 1 still reports the cached result count"""
+        scraper = AvatureScraper(use_url_detector=False, validator_cache=self.cache)
+
+        with patch('src.scraper.requests.get') as get:
+            get.return_value = self.response(200, self.body)
+            scraper.fetch_listing_page(self.PAGE_URL, self.BASE_URL)
+
+            get.return_value = self.response(304)
+            page_info = {}
+            scraper.fetch_listing_page(self.PAGE_URL, self.BASE_URL, page_info)
+
+        self.assertEqual(page_info, {'total_results': 37, 'page_size': 4})
+
+    def test_detector_accepts_not_modified(self):
+        """Test that the URL detector trusts a 304 for a page that passed before"""
+        from src.url_detector import AvatureURLDetector
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            detector = AvatureURLDetector(
+                cache_file=os.path.join(temp_dir, 'pattern_cache.json'),
+                validator_cache=self.cache
+            )
+
+            with patch('src.url_detector.requests.get') as get:
+                get.return_value = self.response(200, self.body)
+                self.assertTrue(detector._test_url(self.PAGE_URL))
+
+                get.return_value = self.response(304)
+                self.assertTrue(detector._test_url(self.PAGE_URL))
+
+        self.assertEqual(get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+
+
+class TestProbeReuse(unittest.TestCase):
+    """Test that the URL detector's probe response is reused as page 1"""
+
+    BASE_URL = 'https://acme.avature.net/careers'
+
+    def setUp(self):
+        """Create a detector with a throwaway pattern cache"""
+        from src.url_detector import AvatureURLDetector
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.detector = AvatureURLDetector(
+            cache_file=os.path.join(self.temp_dir.name, 'pattern_cache.json')
+        )
+        with open(os.path.join(FIXTURES_DIR, 'listing_standard.html'), 'rb') as f:
+            self.body = f.read()
+
+    def tearDown(self):
+        """Remove the pattern cache"""
+        self.temp_dir.cleanup()
+
+    def response(self, body):
+        """Build a fake 200 response"""
+        response = Mock()
+        response.status_code = 200
+        response.content = body
+        response.text = body.decode('utf-8')
+        response.iter_content = lambda chunk_size: iter([body])
+        response.headers = {}
+        return response
+
+    def test_detection_returns_probe(self):
+        """Test that detection hands back the validated page"""
+        with patch('src.url_detector.requests.get') as get:
+            get.return_value = self.response(self.body)
+            pattern, probe = self.detector.detect_pattern_with_response(self.BASE_URL)
+            # Plain detect_pattern still returns just the (now cached) pattern
+            self.assertEqual(self.detector.detect_pattern(self.BASE_URL), '/SearchJobs')
+
+        self.assertEqual(pattern, '/SearchJobs')
+        self.assertEqual(probe.url, self.BASE_URL + '/SearchJobs')
+        self.assertEqual(probe.body, self.body)
+        self.assertIsNone(probe.root)  # Job markup seen, parse left to the scraper
+
+    def test_indicators(self):
+        """Test the job-page indicators on pages without articles"""
+        with patch('src.url_detector.requests.get') as get:
+            get.return_value = self.response(b'<div class="Search-Bar">x</div>')
+            self.assertTrue(self.detector._test_url(self.BASE_URL))
+
+            get.return_value = self.response(b'<p>12 Openings</p>')
+            self.assertTrue(self.detector._test_url(self.BASE_URL))
+
+            get.return_value = self.response(b'<div class="menu"><a href="/About">About</a></div>')
+            self.assertFalse(self.detector._test_url(self.BASE_URL))
+
+    def test_scraper_skips_page_one_download(self):
+        """Test that a site costs one request per page, detection included"""
+        scraper = AvatureScraper(use_url_detector=False)
+        scraper.url_detector = self.detector
+        scraper.use_url_detector = True
+
+        with patch('src.url_detector.requests.get') as get, patch('src.scraper.time.sleep'):
+            get.return_value = self.response(self.body)  # "1-4 of 37 results"
+            jobs = scraper.scrape_site(self.BASE_URL)
+
+        # 10 pages, and page 1 was the detector's probe
+        self.assertEqual(get.call_count, 10)
+        self.assertEqual(len(jobs), 40)
+        self.assertNotIn(self.BASE_URL + '/SearchJobs',
+                         [call.args[0] for call in get.call_args_list[1:]])
+
+
+class TestPatternCache(unittest.TestCase):
+    """Test the TTL/confidence pattern cache"""
+
+    SITE = 'https://acme.avature.net/careers'
+
+    def setUp(self):
+        """Create a throwaway cache path"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, 'pattern_cache.json')
+
+    def tearDown(self):
+        """Remove the cache"""
+        self.temp_dir.cleanup()
+
+    def test_record_and_reload(self):
+        """Test a verified entry is fresh and survives a reload"""
+        from src.pattern_cache import PatternCache
+
+        PatternCache(self.cache_file).record(self.SITE, '/SearchJobs', 1.0)
+        cache = PatternCache(self.cache_file)
+
+        self.assertEqual(cache.get(self.SITE)['pattern'], '/SearchJobs')
+        self.assertTrue(cache.is_fresh(self.SITE))
+        self.assertEqual(cache.get_stats()['fresh_sites'], 1)
+
+    def test_ttl_scales_with_confidence(self):
+        """Test weak evidence expires sooner and is re-verified"""
+        from datetime import datetime, timedelta
+        from src.pattern_cache import PatternCache
+
+        cache = PatternCache(self.cache_file, ttl=1000, min_confidence=0.5)
+        cache.record(self.SITE, '', 0.6)
+        later = datetime.now() + timedelta(seconds=700)
+        self.assertFalse(cache.is_fresh(self.SITE, now=later))
+
+        cache.record(self.SITE, '', 0.3)  # Confirmed again: confidence grows
+        self.assertGreater(cache.get(self.SITE)['confidence'], 0.6)
+
+        cache.record('https://weak.avature.net/careers', '', 0.3)
+        self.assertFalse(cache.is_fresh('https://weak.avature.net/careers'))
+
+    def test_legacy_format_needs_verification(self):
+        """Test flat {site: pattern} files load as unverified entries"""
+        from src.pattern_cache import PatternCache
+
+        with open(self.cache_file, 'w') as f:
+            json.dump({self.SITE: '/SearchJobs', 'last_updated': '2026-02-03T23:15:29'}, f)
+
+        cache = PatternCache(self.cache_file)
+
+        self.assertIn(self.SITE, cache)
+        self.assertEqual(cache.get(self.SITE)['pattern'], '/SearchJobs')
+        self.assertFalse(cache.is_fresh(self.SITE))
+
+    def test_detector_skips_fresh_and_drops_broken(self):
+        """Test the sync detector trusts fresh entries and forgets dead ones"""
+        from src.url_detector import AvatureURLDetector
+        from src.pattern_cache import PatternCache
+
+        cache = PatternCache(self.cache_file)
+        cache.record(self.SITE, '/SearchJobs', 1.0)
+        detector = AvatureURLDetector(pattern_cache=cache)
+
+        with patch('src.url_detector.requests.get') as get:
+            self.assertEqual(detector.detect_pattern(self.SITE), '/SearchJobs')
+            self.assertEqual(get.call_count, 0)
+
+            cache.entries[self.SITE]['ttl'] = 0
+            get.return_value = Mock(status_code=404)
+            self.assertIsNone(detector.detect_pattern(self.SITE))
+
+        self.assertNotIn(self.SITE, cache)
+
+
+class TestStreamingVerifier(unittest.TestCase):
+    """Test the streaming byte-level page verifier"""
+
+    def chunks(self, parts, consumed):
+        """Yield parts, recording how many were read"""
+        for part in parts:
+            consumed.append(part)
+            yield part
+
+    def test_marker_across_chunk_boundary(self):
+        """Test a marker split between two chunks is still found"""
+        from src.url_detector import scan_stream
+
+        matched, body = scan_stream([b'<html><body><art', b'icle class="x">'])
+        self.assertTrue(matched)
+        self.assertEqual(body, b'<html><body><article class="x">')
+
+        matched, _ = scan_stream([b'<div class="article">', b'<articles>'])
+        self.assertFalse(matched)
+
+    def test_reads_whole_body(self):
+        """Test the body is read to the end after a marker is seen"""
+        from src.url_detector import scan_stream
+
+        consumed = []
+        parts = [b'<nav>' * 100, b'<a href="/careers/JobDetail/1">', b'<p>rest</p>' * 100]
+        matched, body = scan_stream(self.chunks(parts, consumed))
+
+        self.assertTrue(matched)
+        self.assertEqual(len(consumed), 3)
+        self.assertEqual(body, b''.join(parts))
+
+    def test_probe_skips_parse_on_marker(self):
+        """Test a job article settles the probe and the page is handed back unparsed"""
+        from src.url_detector import AvatureURLDetector
+
+        parts = [b'<html>', b'<article><a href="/JobDetail/1">x</a></article>', b'x' * 10000]
+        response = Mock(status_code=200, headers={})
+        response.iter_content = lambda chunk_size: iter(parts)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            detector = AvatureURLDetector(cache_file=os.path.join(temp_dir, 'cache.json'))
+            with patch('src.url_detector.requests.get', return_value=response) as get, \
+                    patch('src.url_detector.parse_document') as parse:
+                confidence, probe = detector._probe('https://acme.avature.net/careers/SearchJobs')
+
+        self.assertTrue(get.call_args.kwargs['stream'])
+        self.assertGreater(confidence, 0)
+        self.assertEqual(probe.body, b''.join(parts))
+        self.assertIsNone(probe.root)
+        parse.assert_not_called()
+
+    def test_error_body_not_downloaded(self):
+        """Test a non-200 answer is rejected without reading its body"""
+        from src.url_detector import AvatureURLDetector
+
+        response = Mock(status_code=404, headers={})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            detector = AvatureURLDetector(cache_file=os.path.join(temp_dir, 'cache.json'))
+            with patch('src.url_detector.requests.get', return_value=response):
+                self.assertFalse(detector._test_url('https://acme.avature.net/careers/JobList'))
+
+        response.iter_content.assert_not_called()
+        response.close.assert_called_once()
+
+
 def run_phase1_tests():
     """Run all Phase 1 tests"""
     # Create test suite
@@ -303,6 +724,11 @@ def run_phase1_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestDataValidation))
     suite.addTests(loader.loadTestsFromTestCase(TestCompanyExtraction))
     suite.addTests(loader.loadTestsFromTestCase(TestRateLimiting))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingParser))
+    suite.addTests(loader.loadTestsFromTestCase(TestConditionalRequests))
+    suite.addTests(loader.loadTestsFromTestCase(TestProbeReuse))
+    suite.addTests(loader.loadTestsFromTestCase(TestPatternCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestStreamingVerifier))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
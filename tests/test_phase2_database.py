@@ -79,6 +79,79 @@ class TestDatabaseInitialization(unittest.TestCase):
         conn.close()
 
 
+class TestStorageProfile(unittest.TestCase):
+    """Test storage profiles and the read-only connection pool"""
+
+    def setUp(self):
+        """Create temporary database path for testing"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'jobs.db')
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.temp_dir.cleanup()
+
+    def test_crawl_profile_uses_wal(self):
+        """Test that the default profile enables WAL with tuned pragmas"""
+        db = JobDatabase(self.db_path)
+
+        journal_mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = db.conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = db.conn.execute("PRAGMA temp_store").fetchone()[0]
+        db.close()
+
+        self.assertEqual(journal_mode, 'wal')
+        self.assertEqual(synchronous, 1)  # NORMAL
+        self.assertEqual(temp_store, 2)   # MEMORY
+
+    def test_compat_profile(self):
+        """Test that the compat profile keeps the rollback journal"""
+        db = JobDatabase(self.db_path, profile='compat')
+
+        journal_mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        db.close()
+
+        self.assertEqual(journal_mode, 'delete')
+
+    def test_unknown_profile_rejected(self):
+        """Test that an unknown profile name raises"""
+        with self.assertRaises(ValueError):
+            JobDatabase(self.db_path, profile='turbo')
+
+    def test_reads_not_blocked_by_writer(self):
+        """Test that stats queries run while a write transaction is open"""
+        db = JobDatabase(self.db_path)
+        db.upsert_jobs([{
+            'url': 'https://bloomberg.avature.net/careers/JobDetail/Job1/1',
+            'job_id': '1',
+            'title': 'Job 1',
+            'location': 'NY',
+            'company': 'bloomberg'
+        }])
+
+        # Hold an uncommitted write on the writer connection
+        db.conn.execute("UPDATE jobs SET title = 'Pending'")
+
+        stats = db.get_stats()
+        jobs = db.get_active_jobs()
+
+        db.conn.rollback()
+        db.close()
+
+        self.assertEqual(stats['total_jobs'], 1)
+        self.assertEqual(jobs[0]['title'], 'Job 1')
+
+    def test_reader_connections_are_read_only(self):
+        """Test that pooled reader connections reject writes"""
+        db = JobDatabase(self.db_path)
+
+        with db._reader() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM jobs")
+
+        db.close()
+
+
 class TestJobUpsert(unittest.TestCase):
     """Test job insertion and update logic"""
 
@@ -175,6 +248,317 @@ class TestJobUpsert(unittest.TestCase):
         self.assertEqual(scrape_count, 3)
 
 
+class TestBulkUpsert(unittest.TestCase):
+    """Test batched upsert_jobs logic"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db = JobDatabase(self.db_path)
+        self.jobs = [
+            {
+                'url': f'https://bloomberg.avature.net/careers/JobDetail/Job{i}/{i}',
+                'job_id': str(i),
+                'title': f'Job {i}',
+                'location': 'NY',
+                'company': 'bloomberg'
+            }
+            for i in range(1, 6)
+        ]
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def test_bulk_insert_counts(self):
+        """Test that a fresh batch is counted as all new"""
+        counts = self.db.upsert_jobs(self.jobs)
+
+        self.assertEqual(counts, {'new': 5, 'updated': 0, 'unchanged': 0})
+        self.assertEqual(self.db.get_stats()['total_jobs'], 5)
+
+    def test_bulk_mixed_counts(self):
+        """Test new/updated/unchanged classification within one batch"""
+        self.db.upsert_jobs(self.jobs[:3])
+
+        batch = [dict(job) for job in self.jobs]
+        batch[0]['title'] = 'Senior Job 1'
+
+        counts = self.db.upsert_jobs(batch)
+
+        self.assertEqual(counts, {'new': 2, 'updated': 1, 'unchanged': 2})
+
+    def test_bulk_matches_single_upsert(self):
+        """Test that repeated URLs in a batch behave like sequential upserts"""
+        batch = [self.jobs[0], self.jobs[0], dict(self.jobs[0], title='Renamed')]
+
+        counts = self.db.upsert_jobs(batch)
+
+        self.assertEqual(counts, {'new': 1, 'updated': 1, 'unchanged': 1})
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT title, scrape_count FROM jobs WHERE url = ?",
+                       (self.jobs[0]['url'],))
+        title, scrape_count = cursor.fetchone()
+        conn.close()
+
+        self.assertEqual(title, 'Renamed')
+        self.assertEqual(scrape_count, 3)
+
+    def test_bulk_reactivates_jobs(self):
+        """Test that inactive jobs are reactivated and counted as updated"""
+        self.db.upsert_jobs(self.jobs)
+        self.db.mark_inactive_jobs([], 'bloomberg')
+
+        counts = self.db.upsert_jobs(self.jobs[:2])
+
+        self.assertEqual(counts['updated'], 2)
+        self.assertEqual(self.db.get_stats()['active_jobs'], 2)
+
+    def test_bulk_empty_batch(self):
+        """Test that an empty batch is a no-op"""
+        counts = self.db.upsert_jobs([])
+
+        self.assertEqual(counts, {'new': 0, 'updated': 0, 'unchanged': 0})
+
+
+class TestTouchJobs(unittest.TestCase):
+    """Test bulk last_seen refresh for unchanged listing pages"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db = JobDatabase(self.db_path)
+        self.jobs = [
+            {
+                'url': f'https://bloomberg.avature.net/careers/JobDetail/Job{i}/{i}',
+                'job_id': str(i),
+                'title': f'Job {i}',
+                'location': 'NY',
+                'company': 'bloomberg'
+            }
+            for i in range(1, 4)
+        ]
+        self.db.upsert_jobs(self.jobs)
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def get_row(self, url):
+        """Fetch last_seen and scrape_count for a job"""
+        cursor = self.db.conn.cursor()
+        cursor.execute("SELECT last_seen, scrape_count FROM jobs WHERE url = ?", (url,))
+        return cursor.fetchone()
+
+    def test_touch_refreshes_last_seen(self):
+        """Test that touched jobs get a new last_seen and scrape count"""
+        url = self.jobs[0]['url']
+        before = self.get_row(url)
+
+        touched = self.db.touch_jobs([url, url])
+
+        after = self.get_row(url)
+        self.assertEqual(touched, {url})
+        self.assertGreater(after['last_seen'], before['last_seen'])
+        self.assertEqual(after['scrape_count'], 2)
+
+    def test_touch_skips_unknown_and_inactive(self):
+        """Test that missing or inactive jobs are not counted as touched"""
+        self.db.mark_inactive_jobs([self.jobs[0]['url'], self.jobs[1]['url']], 'bloomberg')
+
+        touched = self.db.touch_jobs([
+            self.jobs[0]['url'],
+            self.jobs[2]['url'],
+            'https://bloomberg.avature.net/careers/JobDetail/Missing/99'
+        ])
+
+        self.assertEqual(touched, {self.jobs[0]['url']})
+        self.assertEqual(self.get_row(self.jobs[2]['url'])['scrape_count'], 1)
+
+    def test_touch_empty(self):
+        """Test that an empty page touches nothing"""
+        self.assertEqual(self.db.touch_jobs([]), set())
+
+
+class TestValidatorCache(unittest.TestCase):
+    """Test the per-URL response validator store"""
+
+    def setUp(self):
+        """Create temporary validator store"""
+        from src.validator_cache import ValidatorCache
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'validators.db')
+        self.cache = ValidatorCache(self.path)
+        self.url = 'https://acme.avature.net/careers/SearchJobs'
+        self.rows = [('Engineer', 'https://acme.avature.net/careers/JobDetail/E/1',
+                      '1', 'NY', None)]
+
+    def tearDown(self):
+        """Clean up validator store"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_store_and_get(self):
+        """Test that validators and rows round-trip"""
+        body_hash = self.cache.content_hash(b'<html></html>')
+        self.cache.store(self.url, {'ETag': '"v1"', 'Last-Modified': 'Mon, 05 Jan 2026 10:00:00 GMT'},
+                         body_hash, self.rows, True)
+
+        entry = self.cache.get(self.url)
+
+        self.assertEqual(entry['etag'], '"v1"')
+        self.assertEqual(entry['content_hash'], body_hash)
+        self.assertEqual(entry['rows'], self.rows)
+        self.assertTrue(entry['has_next'])
+        self.assertEqual(self.cache.request_headers(entry), {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 05 Jan 2026 10:00:00 GMT',
+        })
+
+    def test_persists_across_instances(self):
+        """Test that the store survives reopening"""
+        from src.validator_cache import ValidatorCache
+        self.cache.store(self.url, {}, 'abc', self.rows)
+        self.cache.close()
+
+        self.cache = ValidatorCache(self.path)
+
+        self.assertEqual(self.cache.get(self.url)['rows'], self.rows)
+
+    def test_entries_scoped_by_site(self):
+        """Test that the same URL is fingerprinted separately per site"""
+        site = 'https://acme.avature.net/careers'
+        self.cache.store(self.url, {}, 'abc', self.rows, site=site)
+        self.cache.store(self.url, {}, 'def')
+
+        self.assertEqual(self.cache.get(self.url, site=site)['content_hash'], 'abc')
+        self.assertEqual(self.cache.get(self.url, site=site)['rows'], self.rows)
+        self.assertEqual(self.cache.get(self.url)['content_hash'], 'def')
+
+    def test_validators_only_entry(self):
+        """Test that an entry stored without rows has no replayable rows"""
+        self.cache.store(self.url, {}, 'abc', self.rows)
+        self.cache.store(self.url, {}, 'def')
+
+        entry = self.cache.get(self.url)
+
+        self.assertIsNone(entry['rows'])
+        self.assertEqual(self.cache.request_headers(entry), {})
+        self.assertIsNone(self.cache.get('https://other.avature.net/careers'))
+
+
+class TestJobFeatureCache(unittest.TestCase):
+    """Test the per-job dedup feature table"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db = JobDatabase(self.db_path)
+        self.url = 'https://bloomberg.avature.net/careers/JobDetail/Job1/1'
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        os.unlink(self.db_path)
+
+    def test_save_and_get(self):
+        """Test that feature rows round-trip and unknown URLs are left out"""
+        saved = self.db.save_job_features([
+            (self.url, 'h1', 'bloomberg', 'Senior Engineer', 'New York', 'engineer senior', 3)
+        ])
+
+        features = self.db.get_job_features([self.url, 'https://other.avature.net/1'])
+
+        self.assertEqual(saved, 1)
+        self.assertEqual(list(features), [self.url])
+        self.assertEqual(features[self.url]['key_terms'], 'engineer senior')
+        self.assertEqual(features[self.url]['seniority'], 3)
+
+    def test_save_replaces_row(self):
+        """Test that a newer content hash replaces the old row"""
+        self.db.save_job_features([(self.url, 'h1', 'bloomberg', 'Engineer', 'NY', 'engineer', None)])
+        self.db.save_job_features([(self.url, 'h2', 'bloomberg', 'Analyst', 'NY', 'analyst', None)])
+
+        row = self.db.get_job_features([self.url])[self.url]
+
+        self.assertEqual(row['content_hash'], 'h2')
+        self.assertEqual(row['title'], 'Analyst')
+        self.assertIsNone(row['seniority'])
+
+
+class TestDuplicateMarking(unittest.TestCase):
+    """Test the duplicate_of column and its bulk update"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db = JobDatabase(self.db_path)
+        self.urls = [f'https://bloomberg.avature.net/careers/JobDetail/Job{i}/{i}'
+                     for i in range(4)]
+        self.db.upsert_jobs([{'url': url, 'title': 'Engineer', 'location': 'NY',
+                              'company': 'bloomberg'} for url in self.urls])
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        os.unlink(self.db_path)
+
+    def test_mark_and_filter(self):
+        """Test marked duplicates are hidden from canonical-only reads"""
+        changed = self.db.mark_duplicates({self.urls[1]: self.urls[0],
+                                           self.urls[2]: self.urls[0]})
+
+        canonical = self.db.get_active_jobs(include_duplicates=False)
+        marks = {job['url']: job['duplicate_of'] for job in self.db.get_active_jobs()}
+
+        self.assertEqual(changed, 2)
+        self.assertEqual(sorted(job['url'] for job in canonical), [self.urls[0], self.urls[3]])
+        self.assertEqual(marks[self.urls[1]], self.urls[0])
+        self.assertIsNone(marks[self.urls[0]])
+
+    def test_remark_replaces_previous(self):
+        """Test a new marking clears stale rows and skips unchanged ones"""
+        self.db.mark_duplicates({self.urls[1]: self.urls[0], self.urls[2]: self.urls[0]})
+
+        changed = self.db.mark_duplicates({self.urls[1]: self.urls[0],
+                                           self.urls[3]: self.urls[0]})
+
+        marks = {job['url']: job['duplicate_of'] for job in self.db.get_active_jobs()}
+        self.assertEqual(changed, 2)
+        self.assertIsNone(marks[self.urls[2]])
+        self.assertEqual(marks[self.urls[3]], self.urls[0])
+
+    def test_adds_column_to_old_database(self):
+        """Test a database created before duplicate marking is migrated"""
+        import sqlite3
+        self.db.close()
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            DROP INDEX idx_jobs_active_duplicate;
+            ALTER TABLE jobs DROP COLUMN duplicate_of;
+        """)
+        conn.close()
+
+        self.db = JobDatabase(self.db_path)
+
+        self.assertEqual(self.db.mark_duplicates({self.urls[1]: self.urls[0]}), 1)
+        self.assertEqual(len(self.db.get_active_jobs(include_duplicates=False)), 3)
+
+
 class TestJobLifecycle(unittest.TestCase):
     """Test job lifecycle tracking"""
 
@@ -348,6 +732,76 @@ class TestJobDeactivation(unittest.TestCase):
 
         self.assertEqual(is_active, 1)
 
+    def test_mark_inactive_large_tenant(self):
+        """Test deactivation beyond SQLite's host-parameter limit"""
+        jobs = [
+            {
+                'url': f'https://bloomberg.avature.net/careers/JobDetail/Job{i}/{i}',
+                'job_id': str(i),
+                'title': f'Job {i}',
+                'location': 'NY',
+                'company': 'bloomberg'
+            }
+            for i in range(40000)
+        ]
+        self.db.upsert_jobs(jobs)
+
+        # Everything but the last 10 jobs is still listed
+        active_urls = [job['url'] for job in jobs[:-10]]
+        deactivated = self.db.mark_inactive_jobs(active_urls, 'bloomberg')
+
+        self.assertEqual(deactivated, 10)
+        self.assertEqual(self.db.get_stats()['active_jobs'], 39990)
+
+    def test_mark_inactive_scoped_to_company(self):
+        """Test that other companies' jobs are left untouched"""
+        jobs = [
+            {
+                'url': 'https://bloomberg.avature.net/careers/JobDetail/Job1/1',
+                'job_id': '1',
+                'title': 'Job 1',
+                'location': 'NY',
+                'company': 'bloomberg'
+            },
+            {
+                'url': 'https://fb.avature.net/careers/JobDetail/Job2/2',
+                'job_id': '2',
+                'title': 'Job 2',
+                'location': 'CA',
+                'company': 'fb'
+            }
+        ]
+        self.db.upsert_jobs(jobs)
+
+        deactivated = self.db.mark_inactive_jobs([jobs[1]['url']], 'bloomberg')
+
+        self.assertEqual(deactivated, 1)
+        self.assertEqual(len(self.db.get_active_jobs(company='fb')), 1)
+
+    def test_mark_inactive_failure_rolls_back(self):
+        """Test a failed deactivation leaves no open transaction or seen URLs"""
+        jobs = [
+            {
+                'url': f'https://bloomberg.avature.net/careers/JobDetail/Job{i}/{i}',
+                'job_id': str(i),
+                'title': f'Job {i}',
+                'location': 'NY',
+                'company': 'bloomberg'
+            }
+            for i in range(3)
+        ]
+        self.db.upsert_jobs(jobs)
+
+        # The third URL cannot be bound, after two were inserted
+        with self.assertRaises(sqlite3.Error):
+            self.db.mark_inactive_jobs([jobs[0]['url'], jobs[1]['url'], object()],
+                                       'bloomberg')
+
+        self.assertFalse(self.db.conn.in_transaction)
+        count = self.db.conn.execute("SELECT COUNT(*) FROM temp.seen_urls").fetchone()[0]
+        self.assertEqual(count, 0)
+        self.assertEqual(len(self.db.get_active_jobs(company='bloomberg')), 3)
+
 
 class TestStatistics(unittest.TestCase):
     """Test statistics and reporting"""
@@ -565,7 +1019,13 @@ def run_phase2_tests():
 
     # Add all test classes
     suite.addTests(loader.loadTestsFromTestCase(TestDatabaseInitialization))
+    suite.addTests(loader.loadTestsFromTestCase(TestStorageProfile))
     suite.addTests(loader.loadTestsFromTestCase(TestJobUpsert))
+    suite.addTests(loader.loadTestsFromTestCase(TestBulkUpsert))
+    suite.addTests(loader.loadTestsFromTestCase(TestTouchJobs))
+    suite.addTests(loader.loadTestsFromTestCase(TestValidatorCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestJobFeatureCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestDuplicateMarking))
     suite.addTests(loader.loadTestsFromTestCase(TestJobLifecycle))
     suite.addTests(loader.loadTestsFromTestCase(TestJobDeactivation))
     suite.addTests(loader.loadTestsFromTestCase(TestStatistics))
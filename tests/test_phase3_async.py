@@ -474,6 +474,1436 @@ class TestAsyncIntegrationWithDatabase(unittest.TestCase):
         asyncio.run(test_integration())
 
 
+class TestAsyncJobWriter(unittest.TestCase):
+    """Test the queued database writer used by the async scrapers"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        from src.database import JobDatabase
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = JobDatabase(os.path.join(self.temp_dir.name, 'jobs.db'))
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def make_jobs(self, company, start, count):
+        """Build job dictionaries for a company"""
+        return [
+            {
+                'url': f'https://{company}.avature.net/careers/JobDetail/Job{i}/{i}',
+                'job_id': str(i),
+                'title': f'Job {i}',
+                'location': 'NY',
+                'company': company
+            }
+            for i in range(start, start + count)
+        ]
+
+    def test_site_stats_after_commit(self):
+        """Test that finish_site reports counts once pages are committed"""
+        from src.async_db_writer import AsyncJobWriter
+
+        async def run():
+            writer = AsyncJobWriter(self.db)
+            await writer.start()
+
+            page1 = self.make_jobs('bloomberg', 0, 3)
+            page2 = self.make_jobs('bloomberg', 3, 2)
+            other = self.make_jobs('fb', 0, 4)
+
+            await writer.put_jobs('bloomberg', page1)
+            await writer.put_jobs('fb', other)
+            await writer.put_jobs('bloomberg', page2)
+
+            urls = [job['url'] for job in page1 + page2]
+            stats = await writer.finish_site('bloomberg', 'bloomberg', urls)
+            await writer.close()
+            return stats
+
+        stats = asyncio.run(run())
+
+        self.assertEqual(stats, {'new': 5, 'updated': 0, 'unchanged': 0,
+                                 'deactivated': 0})
+        # The other site's page was flushed on close
+        self.assertEqual(self.db.get_stats()['total_jobs'], 9)
+
+    def test_finish_site_deactivates_unseen(self):
+        """Test that finish_site deactivates jobs missing from the run"""
+        from src.async_db_writer import AsyncJobWriter
+
+        self.db.upsert_jobs(self.make_jobs('bloomberg', 0, 3))
+
+        async def run():
+            writer = AsyncJobWriter(self.db)
+            await writer.start()
+            jobs = self.make_jobs('bloomberg', 0, 2)
+            await writer.put_jobs('bloomberg', jobs)
+            stats = await writer.finish_site(
+                'bloomberg', 'bloomberg', [job['url'] for job in jobs]
+            )
+            await writer.close()
+            return stats
+
+        stats = asyncio.run(run())
+
+        self.assertEqual(stats['unchanged'], 2)
+        self.assertEqual(stats['deactivated'], 1)
+
+    def test_backpressure_when_queue_full(self):
+        """Test that producers wait while the writer is behind"""
+        from src.async_db_writer import AsyncJobWriter
+
+        original_upsert = self.db.upsert_jobs
+
+        def slow_upsert(jobs):
+            time.sleep(0.05)
+            return original_upsert(jobs)
+
+        self.db.upsert_jobs = slow_upsert
+
+        async def run():
+            writer = AsyncJobWriter(self.db, max_queue_size=1, max_batch_items=1)
+            await writer.start()
+
+            start = time.perf_counter()
+            for i in range(4):
+                await writer.put_jobs('bloomberg', self.make_jobs('bloomberg', i, 1))
+            elapsed = time.perf_counter() - start
+
+            await writer.close()
+            return elapsed
+
+        elapsed = asyncio.run(run())
+
+        # Four puts through a one-slot queue must wait on at least two writes
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_event_loop_not_blocked_by_writes(self):
+        """Test that other coroutines keep running during a slow write"""
+        from src.async_db_writer import AsyncJobWriter
+
+        def slow_upsert(jobs):
+            time.sleep(0.2)
+            return {'new': len(jobs), 'updated': 0, 'unchanged': 0}
+
+        self.db.upsert_jobs = slow_upsert
+
+        async def run():
+            writer = AsyncJobWriter(self.db)
+            await writer.start()
+            await writer.put_jobs('bloomberg', self.make_jobs('bloomberg', 0, 1))
+
+            ticks = 0
+            finish = asyncio.create_task(writer.finish_site('bloomberg'))
+            while not finish.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+            await writer.close()
+            return ticks
+
+        ticks = asyncio.run(run())
+
+        self.assertGreater(ticks, 5)
+
+    def test_touch_unchanged_page(self):
+        """Test that touched pages count as unchanged, unknown jobs are upserted"""
+        from src.async_db_writer import AsyncJobWriter
+
+        known = self.make_jobs('bloomberg', 0, 3)
+        self.db.upsert_jobs(known)
+
+        async def run():
+            writer = AsyncJobWriter(self.db)
+            await writer.start()
+            await writer.touch_jobs('bloomberg', known)
+            first = await writer.finish_site('bloomberg')
+
+            # Cached page whose jobs the database no longer has
+            await writer.touch_jobs('fb', self.make_jobs('fb', 0, 2))
+            second = await writer.finish_site('fb')
+            await writer.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        self.assertEqual(first['unchanged'], 3)
+        self.assertEqual(first['new'], 0)
+        self.assertEqual(second['new'], 2)
+
+    def test_partial_touch_counts_each_job_once(self):
+        """Test a touched page with a new job bumps scrape_count once per job"""
+        from src.async_db_writer import AsyncJobWriter
+
+        known = self.make_jobs('bloomberg', 0, 2)
+        self.db.upsert_jobs(known)
+        page = known + self.make_jobs('bloomberg', 2, 1)
+
+        async def run():
+            writer = AsyncJobWriter(self.db)
+            await writer.start()
+            await writer.touch_jobs('bloomberg', page)
+            counts = await writer.finish_site('bloomberg')
+            await writer.close()
+            return counts
+
+        counts = asyncio.run(run())
+
+        cursor = self.db.conn.cursor()
+        cursor.execute("SELECT url, scrape_count FROM jobs")
+        scrape_counts = {url: count for url, count in cursor.fetchall()}
+        self.assertEqual(scrape_counts, {known[0]['url']: 2, known[1]['url']: 2,
+                                         page[2]['url']: 1})
+        self.assertEqual(counts['unchanged'], 2)
+        self.assertEqual(counts['new'], 1)
+
+
+class TestParseExecutor(unittest.TestCase):
+    """Test listing-page parsing off the event loop"""
+
+    SAMPLE_PAGE = b"""
+    <html><body>
+      <article>
+        <a href="/careers/JobDetail/Software-Engineer/123">Software Engineer</a>
+        <span class="job-location">New York, NY</span>
+        <time datetime="2026-01-15">Jan 15</time>
+      </article>
+      <article>
+        <a href="https://acme.avature.net/careers/JobDetail/Data-Scientist/456">Data Scientist</a>
+      </article>
+      <article><p>Promoted content without a job link</p></article>
+    </body></html>
+    """
+
+    BASE_URL = 'https://acme.avature.net/careers'
+
+    def test_parse_listing_page(self):
+        """Test that articles become compact job rows"""
+        from src.listing_parser import parse_listing_page
+
+        rows = parse_listing_page(self.SAMPLE_PAGE, self.BASE_URL)
+
+        self.assertEqual(rows, [
+            ('Software Engineer',
+             'https://acme.avature.net/careers/JobDetail/Software-Engineer/123',
+             '123', 'New York, NY', '2026-01-15'),
+            ('Data Scientist',
+             'https://acme.avature.net/careers/JobDetail/Data-Scientist/456',
+             '456', None, None),
+        ])
+
+    def test_modes_return_identical_rows(self):
+        """Test that inline, thread and process modes agree"""
+        from src.parse_executor import ParseExecutor
+
+        async def parse(mode):
+            executor = ParseExecutor(mode=mode, max_workers=2)
+            try:
+                return await executor.parse(self.SAMPLE_PAGE, self.BASE_URL)
+            finally:
+                executor.close()
+
+        inline = asyncio.run(parse('inline'))
+
+        self.assertEqual(len(inline), 2)
+        self.assertEqual(asyncio.run(parse('thread')), inline)
+        self.assertEqual(asyncio.run(parse('process')), inline)
+
+    def test_job_from_row(self):
+        """Test that rows expand into the scraper's job dictionary"""
+        from src.listing_parser import job_from_row
+
+        job = job_from_row(
+            ('Software Engineer', 'https://acme.avature.net/careers/JobDetail/x/1',
+             '1', 'NY', '2026-01-15'),
+            self.BASE_URL
+        )
+
+        self.assertEqual(job['company'], 'acme')
+        self.assertEqual(job['company_url'], self.BASE_URL)
+        self.assertEqual(job['metadata'], {'date_posted': '2026-01-15'})
+        self.assertIn('scraped_at', job)
+
+    def test_invalid_mode(self):
+        """Test that an unknown mode is rejected"""
+        from src.parse_executor import ParseExecutor
+
+        with self.assertRaises(ValueError):
+            ParseExecutor(mode='gpu')
+
+
+class ListingServer:
+    """Local aiohttp server serving Avature-like search pages"""
+
+    def __init__(self, pages, etag=True, delays=None, failures=None):
+        """
+        Args:
+            pages: Dict of page number -> HTML body
+            etag: Send ETag validators and honour If-None-Match
+            delays: Dict of page number -> seconds to wait before answering
+            failures: Dict of page number -> number of 502 answers before
+                the page is served
+        """
+        self.pages = pages
+        self.etag = etag
+        self.delays = delays or {}
+        self.failures = dict(failures or {})
+        self.requests = []
+        self.completed = []
+        self.not_modified = 0
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request):
+        """Serve /careers/SearchJobs?page=N"""
+        from aiohttp import web
+
+        page = int(request.query.get('page', 1))
+        self.requests.append(page)
+        if page in self.delays:
+            await asyncio.sleep(self.delays[page])
+        self.completed.append(page)
+        if self.failures.get(page):
+            self.failures[page] -= 1
+            return web.Response(status=502)
+        body = self.pages.get(page, '<html><body></body></html>')
+        tag = f'"{hash(body) & 0xffffffff:x}"'
+
+        if self.etag and request.headers.get('If-None-Match') == tag:
+            self.not_modified += 1
+            return web.Response(status=304)
+
+        headers = {'ETag': tag} if self.etag else {}
+        return web.Response(text=body, content_type='text/html', headers=headers)
+
+    async def start(self):
+        """Start listening on a free local port"""
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get('/careers/SearchJobs', self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f'http://127.0.0.1:{port}/careers'
+
+    async def stop(self):
+        """Shut the server down"""
+        await self.runner.cleanup()
+
+
+def listing_html(count, start=0, total=None):
+    """Build a search page with `count` job articles (and a results legend
+    like "1-20 of 145 results" if `total` is given)"""
+    articles = ''.join(
+        f'<article><a href="/careers/JobDetail/Job-{i}/{i}">Job {i}</a>'
+        f'<span class="location">City {i}</span></article>'
+        for i in range(start, start + count)
+    )
+    legend = ''
+    if total is not None:
+        legend = (f'<div class="list-controls__text__legend">'
+                  f'{start + 1}-{start + count} of {total} results</div>')
+    return f'<html><body>{legend}{articles}</body></html>'
+
+
+class TestConditionalFetch(unittest.TestCase):
+    """Test validator-cache conditional fetching in the async scraper"""
+
+    def setUp(self):
+        """Create a throwaway validator cache"""
+        from src.validator_cache import ValidatorCache
+        self.cache = ValidatorCache(':memory:')
+
+    def tearDown(self):
+        """Close the validator cache"""
+        self.cache.close()
+
+    def fetch_twice(self, server, mutate=None):
+        """Fetch page 1 twice, counting parser calls on the second fetch"""
+        from src.async_scraper import AsyncAvatureScraper
+
+        async def run():
+            await server.start()
+            try:
+                async with AsyncAvatureScraper(use_url_detector=False,
+                                               validator_cache=self.cache) as scraper:
+                    search_url = f'{server.base_url}/SearchJobs'
+                    first = await scraper.fetch_listing_page(search_url, server.base_url, 1)
+
+                    if mutate:
+                        mutate()
+
+                    calls = []
+                    parse = scraper.parser.parse
+
+                    async def counting_parse(*args):
+                        calls.append(args)
+                        return await parse(*args)
+
+                    scraper.parser.parse = counting_parse
+                    second = await scraper.fetch_listing_page(search_url, server.base_url, 1)
+                    return first, second, len(calls)
+            finally:
+                await server.stop()
+
+        return asyncio.run(run())
+
+    def test_not_modified_replays_rows(self):
+        """Test that a 304 returns the cached jobs without parsing"""
+        server = ListingServer({1: listing_html(3)})
+
+        from src.async_scraper import PAGE_PARSED, PAGE_NOT_MODIFIED
+
+        (jobs1, source1), (jobs2, source2), parses = self.fetch_twice(server)
+
+        self.assertEqual(source1, PAGE_PARSED)
+        self.assertEqual(source2, PAGE_NOT_MODIFIED)
+        self.assertEqual(server.not_modified, 1)
+        self.assertEqual(parses, 0)
+        self.assertEqual([job['url'] for job in jobs2], [job['url'] for job in jobs1])
+        self.assertEqual(len(jobs2), 3)
+
+    def test_identical_body_hash(self):
+        """Test that an identical body is not re-parsed without ETag support"""
+        server = ListingServer({1: listing_html(3)}, etag=False)
+
+        from src.async_scraper import PAGE_FINGERPRINT
+
+        _, (jobs2, source2), parses = self.fetch_twice(server)
+
+        self.assertEqual(source2, PAGE_FINGERPRINT)
+        self.assertEqual(parses, 0)
+        self.assertEqual(len(jobs2), 3)
+
+    def test_changed_page_is_parsed(self):
+        """Test that a changed page is downloaded and parsed again"""
+        server = ListingServer({1: listing_html(3)})
+
+        def add_job():
+            server.pages[1] = listing_html(4)
+
+        from src.async_scraper import PAGE_PARSED
+
+        _, (jobs2, source2), parses = self.fetch_twice(server, add_job)
+
+        self.assertEqual(source2, PAGE_PARSED)
+        self.assertEqual(parses, 1)
+        self.assertEqual(len(jobs2), 4)
+        entry = self.cache.get(f'{server.base_url}/SearchJobs', site=server.base_url)
+        self.assertEqual(len(entry['rows']), 4)
+
+    def test_cache_io_off_event_loop(self):
+        """Test validator lookups and writes run on a worker thread"""
+        import threading
+        server = ListingServer({1: listing_html(3)})
+        threads = []
+
+        for name in ('get', 'store'):
+            method = getattr(self.cache, name)
+
+            def recording(*args, _method=method, **kwargs):
+                threads.append(threading.get_ident())
+                return _method(*args, **kwargs)
+
+            setattr(self.cache, name, recording)
+
+        self.fetch_twice(server)
+
+        self.assertGreaterEqual(len(threads), 3)
+        self.assertNotIn(threading.main_thread().ident, threads)
+
+
+class TestPageFingerprints(unittest.TestCase):
+    """Test replay of unchanged pages through the incremental pipeline"""
+
+    def setUp(self):
+        """Create temporary database and validator store"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'jobs.db')
+        self.cache_path = os.path.join(self.temp_dir.name, 'validators.db')
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.temp_dir.cleanup()
+
+    def run_twice(self, server):
+        """Scrape the server's site in two separate runs"""
+        # The incremental scraper imports its siblings as top-level modules
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+        from async_incremental_scraper import AsyncIncrementalScraper
+
+        async def run():
+            await server.start()
+            try:
+                results = []
+                for _ in range(2):
+                    async with AsyncIncrementalScraper(
+                        db_path=self.db_path,
+                        use_url_detector=False,
+                        rate_limit_delay=0,
+                        validator_cache_path=self.cache_path
+                    ) as scraper:
+                        stats = await scraper.scrape_all_sites_incremental([server.base_url])
+                        results.append((stats, scraper.generate_report(stats)))
+                return results
+            finally:
+                await server.stop()
+
+        return asyncio.run(run())
+
+    def test_second_run_replays_pages(self):
+        """Test that an unchanged site is replayed, touched and reported as hits"""
+        from src.async_scraper import PAGE_PARSED, PAGE_FINGERPRINT
+
+        server = ListingServer({1: listing_html(3)}, etag=False)
+
+        (first, _), (second, report) = self.run_twice(server)
+
+        self.assertEqual(first['jobs_new'], 3)
+        self.assertEqual(first['pages'][PAGE_PARSED], 2)
+        self.assertEqual(second['jobs_found'], 3)
+        self.assertEqual(second['jobs_unchanged'], 3)
+        self.assertEqual(second['jobs_deactivated'], 0)
+        self.assertEqual(second['pages'][PAGE_PARSED], 0)
+        self.assertEqual(second['pages'][PAGE_FINGERPRINT], 2)
+        self.assertIn("Hit ratio: 100.0% (2 hits / 0 misses)", report)
+
+    def test_changed_page_is_a_miss(self):
+        """Test that a changed page counts as a miss and is upserted"""
+        from src.async_scraper import PAGE_PARSED, PAGE_NOT_MODIFIED
+
+        server = ListingServer({1: listing_html(3)})
+        original = server.handle
+
+        async def handle_and_change(request):
+            response = await original(request)
+            if len(server.requests) == 2:
+                server.pages[1] = listing_html(4)  # New job after the first run
+            return response
+
+        server.handle = handle_and_change
+
+        (_, _), (second, report) = self.run_twice(server)
+
+        self.assertEqual(second['jobs_new'], 1)
+        self.assertEqual(second['pages'][PAGE_PARSED], 1)
+        self.assertEqual(second['pages'][PAGE_NOT_MODIFIED], 1)
+        self.assertIn("Hit ratio: 50.0% (1 hits / 1 misses)", report)
+
+
+class TestHostLimiter(unittest.TestCase):
+    """Test the adaptive (AIMD) per-host concurrency window"""
+
+    def test_grows_while_healthy(self):
+        """Test additive increase on fast successful responses"""
+        from src.host_limiter import HostLimiter
+
+        limiter = HostLimiter(initial_limit=2, max_limit=4)
+        for _ in range(20):
+            limiter.on_success(0.05)
+
+        self.assertGreater(limiter.limit, 3)
+        self.assertLessEqual(limiter.limit, 4)
+
+    def test_slow_responses_stop_growth(self):
+        """Test that responses over the latency target do not grow the window"""
+        from src.host_limiter import HostLimiter
+
+        limiter = HostLimiter(initial_limit=2, latency_target=1.0)
+        for _ in range(10):
+            limiter.on_success(3.0)
+
+        self.assertEqual(limiter.limit, 2)
+
+    def test_throttle_decreases_once_per_window(self):
+        """Test multiplicative decrease, bounded below, once per round trip"""
+        from src.host_limiter import HostLimiter
+
+        limiter = HostLimiter(initial_limit=8, min_limit=1)
+        limiter.on_success(10.0)  # Long round trip
+
+        limiter.on_throttle()
+        limiter.on_throttle()  # Same burst of in-flight requests
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.stats['throttled'], 2)
+
+        limiter._last_decrease = 0.0
+        limiter.on_throttle(timeout=True)
+        limiter._last_decrease = 0.0
+        limiter.on_throttle()
+        limiter._last_decrease = 0.0
+        limiter.on_throttle()
+
+        self.assertEqual(limiter.limit, 1)
+        self.assertEqual(limiter.stats['timeouts'], 1)
+
+    def test_in_flight_never_exceeds_window(self):
+        """Test that concurrent requests are held to the window"""
+        from src.host_limiter import HostLimiter
+
+        limiter = HostLimiter(initial_limit=3)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            await asyncio.gather(*[request() for _ in range(20)])
+
+        asyncio.run(run())
+
+        self.assertEqual(peak, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_retry_after_pauses_host(self):
+        """Test that Retry-After holds back new requests"""
+        from src.host_limiter import HostLimiter
+
+        limiter = HostLimiter(initial_limit=2)
+        limiter.on_throttle(retry_after=0.2)
+
+        async def run():
+            start = time.monotonic()
+            async with limiter.slot():
+                return time.monotonic() - start
+
+        waited = asyncio.run(run())
+
+        self.assertGreaterEqual(waited, 0.15)
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds and HTTP-date Retry-After values"""
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+        from src.host_limiter import parse_retry_after, MAX_RETRY_AFTER
+
+        future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30),
+                                 usegmt=True)
+
+        self.assertEqual(parse_retry_after('5'), 5.0)
+        self.assertAlmostEqual(parse_retry_after(future), 30, delta=2)
+        self.assertEqual(parse_retry_after('86400'), MAX_RETRY_AFTER)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_scraper_retries_throttled_page(self):
+        """Test that a 429 with Retry-After is waited out and retried"""
+        from aiohttp import web
+        from src.async_scraper import AsyncAvatureScraper
+
+        server = ListingServer({1: listing_html(3)})
+        original = server.handle
+
+        async def throttle_first(request):
+            if not server.requests:
+                server.requests.append('throttled')
+                return web.Response(status=429, headers={'Retry-After': '0.2'})
+            return await original(request)
+
+        server.handle = throttle_first
+
+        async def run():
+            await server.start()
+            try:
+                async with AsyncAvatureScraper(use_url_detector=False) as scraper:
+                    start = time.monotonic()
+                    jobs = await scraper.scrape_single_page(
+                        f'{server.base_url}/SearchJobs', server.base_url, 1
+                    )
+                    elapsed = time.monotonic() - start
+                    return jobs, elapsed, scraper.limiters.get_stats()
+            finally:
+                await server.stop()
+
+        jobs, elapsed, stats = asyncio.run(run())
+
+        self.assertEqual(len(jobs), 3)
+        self.assertGreaterEqual(elapsed, 0.15)
+        host_stats = next(iter(stats.values()))
+        self.assertEqual(host_stats['throttled'], 1)
+        self.assertLess(host_stats['limit'], 3)
+
+
+class TestSlidingWindowPagination(unittest.TestCase):
+    """Test the sliding-window page fetcher in the async scraper"""
+
+    def crawl(self, server, window=3, max_pages=20, probe=None):
+        """Run scrape_search_pages_concurrent against a ListingServer"""
+        from src.async_scraper import AsyncAvatureScraper
+
+        async def run():
+            await server.start()
+            try:
+                async with AsyncAvatureScraper(
+                    use_url_detector=False, max_concurrent_pages=window,
+                    max_host_concurrency=window
+                ) as scraper:
+                    start = time.monotonic()
+                    jobs = await scraper.scrape_search_pages_concurrent(
+                        f'{server.base_url}/SearchJobs', server.base_url, max_pages,
+                        probe=probe(server) if probe else None
+                    )
+                    self.failed_pages = scraper.failed_pages
+                    return jobs, time.monotonic() - start
+            finally:
+                await server.stop()
+
+        return asyncio.run(run())
+
+    def test_slow_page_does_not_block_window(self):
+        """Test later pages keep starting while one page is slow"""
+        pages = {n: listing_html(2, start=n * 10) for n in range(1, 11)}
+        server = ListingServer(pages, delays={2: 0.5})
+
+        jobs, _ = self.crawl(server)
+
+        self.assertEqual(len(jobs), 20)
+        # Lock-step batches would not start page 5 until page 2 finished
+        self.assertEqual(server.completed[-1], 2)
+
+    def test_results_in_page_order(self):
+        """Test jobs come back in page order despite out-of-order completion"""
+        pages = {n: listing_html(2, start=n * 10) for n in range(1, 7)}
+        server = ListingServer(pages, delays={2: 0.3, 3: 0.2, 4: 0.1})
+
+        jobs, _ = self.crawl(server)
+
+        ids = [int(job['job_id']) for job in jobs]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(ids), 12)
+
+    def test_speculative_pages_cancelled(self):
+        """Test requests past the detected last page are cancelled"""
+        pages = {n: listing_html(2, start=n * 10) for n in range(1, 4)}
+        slow_tail = {n: 5.0 for n in range(5, 21)}
+        server = ListingServer(pages, delays=slow_tail)
+
+        jobs, elapsed = self.crawl(server)
+
+        # The 5s tail pages were abandoned rather than awaited
+        self.assertEqual(len(jobs), 6)
+        self.assertLess(elapsed, 2.0)
+        self.assertLess(len(server.requests), 20)
+
+    def test_transient_error_is_not_the_end(self):
+        """Test a failed page is retried and later pages are still fetched"""
+        pages = {n: listing_html(2, start=n * 10) for n in range(1, 7)}
+        # Page 2 fails before any later page has answered
+        server = ListingServer(pages, delays={n: 0.2 for n in range(3, 7)}, failures={2: 1})
+
+        jobs, _ = self.crawl(server)
+
+        self.assertEqual(len(jobs), 12)
+        self.assertEqual(server.requests.count(2), 2)
+        self.assertEqual(self.failed_pages, {})
+
+    def test_failing_page_skipped(self):
+        """Test a page that fails twice is recorded, not taken as the end"""
+        pages = {n: listing_html(2, start=n * 10) for n in range(1, 7)}
+        server = ListingServer(pages, delays={n: 0.3 for n in range(4, 7)}, failures={3: 2})
+
+        jobs, _ = self.crawl(server)
+
+        self.assertEqual(len(jobs), 10)
+        self.assertEqual(list(self.failed_pages.values()), [[3]])
+        self.assertIn(6, server.requests)
+
+    def test_result_count_fans_out_exact_pages(self):
+        """Test page 1's result count drives an exact page list"""
+        # 7 pages of 3 (20 results); the server would keep serving past that
+        pages = {n: listing_html(3, start=(n - 1) * 3, total=20) for n in range(1, 12)}
+        server = ListingServer(pages, delays={2: 0.3})
+
+        jobs, _ = self.crawl(server, window=8)
+
+        self.assertEqual(sorted(server.requests), list(range(1, 8)))
+        self.assertEqual(len(jobs), 21)
+        # All remaining pages were in flight together, not probed in order
+        self.assertEqual(server.completed[-1], 2)
+
+    def test_result_count_survives_failed_middle_page(self):
+        """Test a failing middle page does not cancel the counted later pages"""
+        # 10 pages of 3 (30 results); page 3 fails twice while 4-10 are in flight
+        pages = {n: listing_html(3, start=(n - 1) * 3, total=30) for n in range(1, 11)}
+        server = ListingServer(pages, delays={n: 0.2 for n in range(4, 11)},
+                               failures={3: 2})
+
+        jobs, _ = self.crawl(server, window=10)
+
+        self.assertEqual(len(jobs), 27)
+        self.assertEqual(sorted(set(server.completed)), list(range(1, 11)))
+        self.assertEqual(list(self.failed_pages.values()), [[3]])
+
+    def test_result_count_ignores_empty_middle_page(self):
+        """Test an empty page inside the counted range does not end the listing"""
+        pages = {n: listing_html(3, start=(n - 1) * 3, total=30) for n in range(1, 11)}
+        pages[3] = listing_html(0, total=30)
+        server = ListingServer(pages, delays={n: 0.2 for n in range(4, 11)})
+
+        jobs, _ = self.crawl(server, window=10)
+
+        self.assertEqual(len(jobs), 27)
+        self.assertEqual(sorted(server.completed), list(range(1, 11)))
+
+    def test_detector_probe_used_as_page_one(self):
+        """Test page 1 comes from the detector's probe, not a new request"""
+        from src.url_detector import ProbeResponse
+        from src.listing_parser import parse_document
+
+        pages = {n: listing_html(3, start=(n - 1) * 3, total=9) for n in range(1, 4)}
+        server = ListingServer(pages)
+
+        def probe(server):
+            body = pages[1].encode('utf-8')
+            return ProbeResponse(f'{server.base_url}/SearchJobs', body, None, {},
+                                 parse_document(body))
+
+        jobs, _ = self.crawl(server, probe=probe)
+
+        self.assertEqual(sorted(server.requests), [2, 3])
+        self.assertEqual(len(jobs), 9)
+
+    def test_incremental_scraper_stops_at_counted_last_page(self):
+        """Test the smart-stop scraper needs no empty probe page"""
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+        from async_incremental_scraper import AsyncIncrementalScraper
+
+        pages = {n: listing_html(3, start=(n - 1) * 3, total=9) for n in range(1, 6)}
+        server = ListingServer(pages)
+
+        async def run():
+            await server.start()
+            try:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    async with AsyncIncrementalScraper(
+                        db_path=os.path.join(temp_dir, 'jobs.db'),
+                        use_url_detector=False, validator_cache_path=None
+                    ) as scraper:
+                        return await scraper.scrape_with_smart_stop(
+                            f'{server.base_url}/SearchJobs', server.base_url
+                        )
+            finally:
+                await server.stop()
+
+        jobs, stopped_early = asyncio.run(run())
+
+        self.assertEqual(server.requests, [1, 2, 3])
+        self.assertEqual(len(jobs), 9)
+        self.assertFalse(stopped_early)
+
+    def incremental_runs(self, pages, failures):
+        """Scrape a site twice with the incremental scraper, the second
+        time with failing pages; return both runs' site stats and the
+        active jobs afterwards"""
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+        from async_incremental_scraper import AsyncIncrementalScraper
+
+        server = ListingServer(pages)
+
+        async def run():
+            await server.start()
+            try:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    async with AsyncIncrementalScraper(
+                        db_path=os.path.join(temp_dir, 'jobs.db'),
+                        use_url_detector=False, validator_cache_path=None
+                    ) as scraper:
+                        first = await scraper.scrape_site_incremental(server.base_url)
+                        server.failures = dict(failures)
+                        second = await scraper.scrape_site_incremental(server.base_url)
+                        return (first, second), scraper.db.get_active_jobs()
+            finally:
+                await server.stop()
+
+        return asyncio.run(run())
+
+    def test_incremental_scraper_retries_failed_page(self):
+        """Test a transient error is retried instead of ending the listing"""
+        pages = {n: listing_html(3, start=(n - 1) * 3) for n in range(1, 4)}
+
+        (_, second), active = self.incremental_runs(pages, failures={2: 1})
+
+        self.assertEqual(second['jobs_found'], 9)
+        self.assertEqual(second['failed_pages'], [])
+        self.assertEqual(len(active), 9)
+
+    def test_incremental_scraper_failed_page_deactivates_nothing(self):
+        """Test jobs behind a page that keeps failing are not deactivated"""
+        pages = {n: listing_html(3, start=(n - 1) * 3) for n in range(1, 4)}
+
+        (first, second), active = self.incremental_runs(pages, failures={2: 2})
+
+        self.assertEqual(first['jobs_found'], 9)
+        self.assertEqual(second['jobs_found'], 3)
+        self.assertEqual(second['failed_pages'], [2])
+        self.assertEqual(second['jobs_deactivated'], 0)
+        self.assertEqual(len(active), 9)
+
+
+class TestAsyncURLDetector(unittest.TestCase):
+    """Test concurrent pattern detection on the shared session"""
+
+    def setUp(self):
+        """Create a throwaway pattern cache file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, 'pattern_cache.json')
+
+    def tearDown(self):
+        """Remove the pattern cache"""
+        self.temp_dir.cleanup()
+
+    def detect(self, routes, runs=1, ttl=3600):
+        """Serve {path: (status, body, delay)} under /careers and detect
+
+        Returns:
+            (results of each run, elapsed seconds of the first run,
+             paths requested by each run)
+        """
+        from aiohttp import web
+        from src.async_scraper import AsyncAvatureScraper
+        from src.async_url_detector import AsyncAvatureURLDetector
+        from src.pattern_cache import PatternCache
+
+        requested = []
+
+        async def handle(request):
+            requested[-1].append(request.path)
+            status, body, delay = routes.get(request.path, (404, '', 0))
+            await asyncio.sleep(delay)
+            return web.Response(status=status, text=body, content_type='text/html')
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/{tail:.*}', handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, '127.0.0.1', 0).start()
+            base_url = f'http://127.0.0.1:{runner.addresses[0][1]}/careers'
+            try:
+                async with AsyncAvatureScraper(use_url_detector=False) as scraper:
+                    results, elapsed = [], None
+                    for _ in range(runs):
+                        requested.append([])
+                        detector = AsyncAvatureURLDetector(
+                            scraper.fetch, pattern_cache=PatternCache(self.cache_file, ttl=ttl)
+                        )
+                        start = time.monotonic()
+                        results.append(await detector.detect_pattern_with_response(base_url))
+                        if elapsed is None:
+                            elapsed = time.monotonic() - start
+                    return results, elapsed
+            finally:
+                await runner.cleanup()
+
+        results, elapsed = asyncio.run(run())
+        return results, elapsed, requested
+
+    def test_candidates_probed_concurrently(self):
+        """Test detection costs one round trip, not one per pattern"""
+        slow_404 = (404, '', 0.3)
+        routes = {
+            '/careers/SearchJobs': slow_404,
+            '/careers/JobSearch': slow_404,
+            '/careers/FolderDetail': slow_404,
+            '/careers/JobList': (200, listing_html(2), 0.3),
+        }
+
+        [(pattern, probe)], elapsed, _ = self.detect(routes)
+
+        self.assertEqual(pattern, '/JobList')
+        self.assertEqual(probe.body, listing_html(2).encode('utf-8'))
+        # Trying the four patterns one after another would take 1.2s
+        self.assertLess(elapsed, 0.9)
+
+    def test_priority_order_wins(self):
+        """Test a fast fallback page does not beat an earlier pattern"""
+        routes = {
+            '/careers/Opportunities': (200, listing_html(2), 0.2),
+            '/careers': (200, listing_html(2), 0.0),
+        }
+
+        [(pattern, _)], _, _ = self.detect(routes)
+
+        self.assertEqual(pattern, '/Opportunities')
+
+    def test_weak_evidence_fallback(self):
+        """Test a page with only search widgets is used when nothing is better"""
+        routes = {'/careers/JobSearch': (200, '<form class="search"></form>', 0.0)}
+
+        [(pattern, _)], _, _ = self.detect(routes)
+
+        self.assertEqual(pattern, '/JobSearch')
+
+    def test_fresh_entry_skips_verification(self):
+        """Test a fresh cache entry is used without any request"""
+        routes = {'/careers/SearchJobs': (200, listing_html(2), 0.0)}
+
+        results, _, requested = self.detect(routes, runs=2)
+
+        self.assertEqual(results[1], ('/SearchJobs', None))
+        self.assertEqual(requested[1], [])
+
+    def test_stale_entry_verified_once(self):
+        """Test an expired entry is re-verified with a single request"""
+        routes = {'/careers/SearchJobs': (200, listing_html(2), 0.0)}
+
+        results, _, requested = self.detect(routes, runs=2, ttl=0)
+
+        self.assertEqual(results[1][0], '/SearchJobs')
+        self.assertIsNotNone(results[1][1])
+        self.assertEqual(requested[1], ['/careers/SearchJobs'])
+
+
+class StubResolver:
+    """Resolver that maps a fixed set of host names to loopback"""
+
+    def __init__(self, live_hosts):
+        self.live_hosts = set(live_hosts)
+        self.lookups = []
+
+    async def resolve(self, host, port=0, family=0):
+        import socket
+        self.lookups.append(host)
+        if host not in self.live_hosts:
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        return [{'hostname': host, 'host': '127.0.0.1', 'port': port,
+                 'family': socket.AF_INET, 'proto': 0, 'flags': 0}]
+
+    async def close(self):
+        pass
+
+
+class TestAsyncDiscovery(unittest.TestCase):
+    """Test bulk subdomain verification against a stub resolver"""
+
+    def discover(self, names, live, statuses=None, delay=0.0, **engine_kwargs):
+        """Serve live names from a local server and verify the candidates
+
+        Args:
+            names: Candidate subdomains (list or async iterable)
+            live: Subdomains that resolve (all to 127.0.0.1)
+            statuses: {name: [status, ...]} answered in turn (default 200)
+            delay: Seconds each response takes
+
+        Returns:
+            (results, engine, server log) where the log has per-host request
+            counts and the peak number of requests in flight
+        """
+        from aiohttp import web
+        from src.async_discovery import AsyncDiscoveryEngine
+
+        statuses = {name: list(codes) for name, codes in (statuses or {}).items()}
+        log = {'requests': {}, 'in_flight': 0, 'peak': 0}
+
+        async def handle(request):
+            name = request.host.split('.')[0]
+            log['requests'][name] = log['requests'].get(name, 0) + 1
+            log['in_flight'] += 1
+            log['peak'] = max(log['peak'], log['in_flight'])
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                log['in_flight'] -= 1
+            codes = statuses.get(name)
+            status = codes.pop(0) if codes else 200
+            headers = {'Retry-After': '0'} if status == 429 else {}
+            return web.Response(status=status, headers=headers)
+
+        async def run():
+            app = web.Application()
+            app.router.add_route('*', '/{tail:.*}', handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, '127.0.0.1', 0).start()
+            port = runner.addresses[0][1]
+            try:
+                resolver = StubResolver(f'{name}.avature.test' for name in live)
+                engine = AsyncDiscoveryEngine(
+                    url_template=f'http://{{name}}.avature.test:{port}/careers',
+                    resolver=resolver, **engine_kwargs
+                )
+                results = [result async for result in engine.results(names)]
+                return results, engine, resolver
+            finally:
+                await runner.cleanup()
+
+        results, engine, resolver = asyncio.run(run())
+        log['lookups'] = resolver.lookups
+        return results, engine, log
+
+    def test_nxdomain_dropped_before_http(self):
+        """Test names that do not resolve never reach the HTTP stage"""
+        names = [f'site{i}' for i in range(20)]
+        live = names[:5]
+
+        results, engine, log = self.discover(names, live, statuses={'site4': [404]})
+
+        self.assertEqual(len(results), 20)
+        found = sorted(result.name for result in results if result.found)
+        self.assertEqual(found, ['site0', 'site1', 'site2', 'site3'])
+        self.assertEqual(set(log['requests']), set(live))
+        self.assertEqual(engine.stats['nxdomain'], 15)
+        self.assertEqual(engine.stats['probed'], 5)
+        nxdomain = [result for result in results if result.error == 'NXDOMAIN']
+        self.assertTrue(all(result.address is None for result in nxdomain))
+
+    def test_resolved_once_per_host(self):
+        """Test the connector reuses the pre-resolved answer"""
+        names = [f'site{i}' for i in range(10)]
+        results, engine, log = self.discover(names, names)
+
+        self.assertEqual(sum(result.found for result in results), 10)
+        self.assertEqual(sorted(log['lookups']), sorted(f'{n}.avature.test' for n in names))
+
+    def test_probes_run_concurrently(self):
+        """Test many candidates are verified in parallel, not one by one"""
+        names = [f'site{i}' for i in range(100)]
+
+        start = time.monotonic()
+        results, engine, log = self.discover(names, names, delay=0.1,
+                                             concurrency=50, per_host_limit=50)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(sum(result.found for result in results), 100)
+        # Sequential probing would take 10s
+        self.assertLess(elapsed, 3.0)
+        self.assertGreater(log['peak'], 10)
+
+    def test_per_host_budget(self):
+        """Test names sharing a server address share one politeness budget"""
+        names = [f'site{i}' for i in range(30)]
+        results, engine, log = self.discover(names, names, delay=0.05,
+                                             concurrency=20, per_host_limit=3)
+
+        self.assertEqual(sum(result.found for result in results), 30)
+        self.assertLessEqual(log['peak'], 3)
+        self.assertEqual(list(engine.limiters.limiters), ['127.0.0.1'])
+
+    def test_throttled_probe_retried(self):
+        """Test a 429 backs off the server and the candidate is retried"""
+        results, engine, log = self.discover(['busy', 'idle'], ['busy', 'idle'],
+                                             statuses={'busy': [429]})
+
+        self.assertTrue(all(result.found for result in results))
+        self.assertEqual(log['requests']['busy'], 2)
+        self.assertEqual(engine.stats['throttled'], 1)
+
+    def test_async_input_deduplicated(self):
+        """Test async iterables are consumed lazily and duplicates skipped"""
+        async def names():
+            for name in ['Acme', 'acme', 'beta.', 'acme', 'gamma']:
+                yield name
+
+        results, engine, log = self.discover(names(), ['acme', 'beta'])
+
+        self.assertEqual(sorted(result.name for result in results), ['acme', 'beta', 'gamma'])
+        self.assertEqual(log['requests'], {'acme': 1, 'beta': 1})
+        self.assertEqual(engine.stats['candidates'], 3)
+
+
+class TestDiscoveryStore(unittest.TestCase):
+    """Test persistent discovery state and the negative cache"""
+
+    def setUp(self):
+        """Create a throwaway store directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'discovery.db')
+
+    def tearDown(self):
+        """Remove the store"""
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def result(name, status=None, error=None):
+        from src.async_discovery import ProbeResult
+        address = None if error == 'NXDOMAIN' else '127.0.0.1'
+        return ProbeResult(name, f'https://{name}.avature.net/careers', address, status, error)
+
+    def test_bloom_filter(self):
+        """Test the filter never misses a member and rarely mistakes others"""
+        from src.discovery_store import BloomFilter
+
+        bloom = BloomFilter(5000)
+        for i in range(5000):
+            bloom.add(f'dead{i}')
+
+        self.assertTrue(all(f'dead{i}' in bloom for i in range(5000)))
+        false_positives = sum(f'new{i}' in bloom for i in range(5000))
+        self.assertLess(false_positives, 150)
+
+    def test_dead_names_skipped_until_recheck(self):
+        """Test negative entries expire after the re-check interval"""
+        from datetime import datetime, timedelta
+        from src.discovery_store import DiscoveryStore
+
+        store = DiscoveryStore(self.db_path, recheck_dead=30 * 86400, recheck_live=7 * 86400)
+        now = datetime(2026, 1, 1)
+        store.record(self.result('gone', error='NXDOMAIN'), now=now)
+        store.record(self.result('notfound', status=404), now=now)
+        store.record(self.result('acme', status=200), now=now)
+        store.flush()
+
+        later = now + timedelta(days=10)
+        self.assertEqual(list(store.due(['gone', 'notfound', 'acme', 'fresh'], now=later)),
+                         ['acme', 'fresh'])
+        self.assertFalse(store.is_due('GONE', now=now + timedelta(days=29)))
+        self.assertTrue(store.is_due('gone', now=now + timedelta(days=30)))
+        store.close()
+
+    def test_state_survives_reopen(self):
+        """Test live sites and the dead filter are rebuilt from disk"""
+        from src.discovery_store import DiscoveryStore
+
+        store = DiscoveryStore(self.db_path)
+        store.record(self.result('acme', status=200))
+        store.record(self.result('gone', error='NXDOMAIN'))
+        store.close()
+
+        store = DiscoveryStore(self.db_path)
+        self.assertEqual(store.live_urls(), ['https://acme.avature.net/careers'])
+        self.assertIn('gone', store.dead_filter)
+        self.assertFalse(store.is_due('gone'))
+        self.assertEqual(store.get('gone')['state'], 'dead')
+        self.assertEqual(store.get_stats(), {'live': 1, 'dead': 1, 'error': 0, 'total': 2})
+        store.close()
+
+    def test_transient_errors_not_cached(self):
+        """Test timeouts and throttling are retried and keep live sites live"""
+        from src.discovery_store import DiscoveryStore
+
+        store = DiscoveryStore(self.db_path, recheck_live=0)
+        store.record(self.result('slow', error='timeout'))
+        store.record(self.result('busy', status=503, error='HTTP 503'))
+        store.record(self.result('acme', status=200))
+        store.record(self.result('acme', error='timeout'))
+
+        self.assertTrue(store.is_due('slow'))
+        self.assertTrue(store.is_due('busy'))
+        self.assertEqual(store.live_urls(), ['https://acme.avature.net/careers'])
+        self.assertEqual(store.get('acme')['state'], 'live')
+        store.close()
+
+    def test_discovery_only_probes_new_names(self):
+        """Test a second run verifies only new names and keeps old sites"""
+        from src.discovery_store import DiscoveryStore
+        from src.enhanced_discovery import EnhancedDiscovery
+
+        class FakeEngine:
+            def __init__(self, live):
+                self.live = live
+                self.probed = []
+                self.stats = {'nxdomain': 0, 'probed': 0, 'throttled': 0}
+
+            async def results(self, names):
+                async for name in names:
+                    self.probed.append(name)
+                    live = name in self.live
+                    yield TestDiscoveryStore.result(
+                        name, status=200 if live else None,
+                        error=None if live else 'NXDOMAIN'
+                    )
+
+        output = os.path.join(self.temp_dir.name, 'sites.txt')
+        live = {'acme', 'beta'}
+
+        with patch('sys.stdout'):
+            first = EnhancedDiscovery(engine=FakeEngine(live), store=DiscoveryStore(self.db_path))
+            first.verify_candidates(['acme', 'gone1', 'gone2'])
+            first.store.close()
+
+            engine = FakeEngine(live)
+            second = EnhancedDiscovery(engine=engine, store=DiscoveryStore(self.db_path))
+            second.verify_candidates(['acme', 'gone1', 'gone2', 'beta', 'gone3'])
+            second.save_results(output)
+            second.store.close()
+
+        self.assertEqual(engine.probed, ['beta', 'gone3'])
+        with open(output) as f:
+            self.assertEqual(f.read().split(), ['https://acme.avature.net/careers',
+                                                'https://beta.avature.net/careers'])
+
+
+class TestCTIngest(unittest.TestCase):
+    """Test streaming Certificate Transparency ingestion"""
+
+    def setUp(self):
+        """Create a directory for CT dumps"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the dumps"""
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def entry(i, name):
+        return {'issuer_ca_id': i, 'common_name': name,
+                'name_value': f'{name}\n*.{name}', 'id': 1000 + i,
+                'entry_timestamp': '2026-01-01T00:00:00.000'}
+
+    def write_dump(self, entries, name='ct.json'):
+        import json
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w') as f:
+            json.dump(entries, f)
+        return path
+
+    def test_parser_any_chunking(self):
+        """Test items split at every byte boundary parse like json.loads"""
+        import json
+        from src.ct_ingest import JSONArrayParser
+
+        data = json.dumps([
+            {'name_value': 'a],{"b"\n\\x', 'id': 1},
+            {'name_value': 'caf\u00e9 ümlaut', 'n': [1, 2.5, None, True]},
+            123,
+            'plain',
+        ], ensure_ascii=False).encode('utf-8')
+
+        for size in (1, 2, 7, len(data)):
+            parser = JSONArrayParser()
+            items = []
+            for i in range(0, len(data), size):
+                items.extend(parser.feed(data[i:i + size]))
+            parser.close()
+            self.assertEqual(items, json.loads(data), f'chunk size {size}')
+
+    def test_malformed_input_rejected(self):
+        """Test non-arrays and truncated dumps raise ValueError"""
+        from src.ct_ingest import JSONArrayParser
+
+        with self.assertRaises(ValueError):
+            JSONArrayParser().feed(b'{"name_value": "x"}')
+
+        parser = JSONArrayParser()
+        parser.feed(b'[{"name_value": "acme.avature.net"}, {"name_')
+        with self.assertRaises(ValueError):
+            parser.close()
+
+        with self.assertRaises(ValueError):
+            JSONArrayParser(max_item_size=100).feed(b'[{"x": "' + b'y' * 200)
+
+    def test_extract_subdomains(self):
+        """Test wildcard, multi-name and foreign entries"""
+        from src.ct_ingest import extract_subdomains
+
+        entry = {'common_name': 'Acme.Avature.net',
+                 'name_value': '*.acme.avature.net\nbeta.avature.net\n'
+                               'avature.net\n*.avature.net\nevil.com\nx.notavature.net'}
+        self.assertEqual(sorted(set(extract_subdomains(entry))), ['acme', 'beta'])
+
+    def test_file_dump_deduplicated(self):
+        """Test names are yielded once each, from plain and gzip dumps"""
+        import gzip
+        import json
+        from src.ct_ingest import CTIngestor
+
+        entries = [self.entry(i, f'site{i % 5}.avature.net') for i in range(100)]
+        path = self.write_dump(entries)
+        gz_path = path + '.gz'
+        with gzip.open(gz_path, 'wt') as f:
+            json.dump(entries, f)
+
+        for dump in (path, gz_path):
+            ingestor = CTIngestor(chunk_size=97)
+            names = list(ingestor.from_file(dump))
+            self.assertEqual(names, [f'site{i}' for i in range(5)])
+            self.assertEqual(ingestor.stats['entries'], 100)
+
+    def test_memory_bounded(self):
+        """Test peak memory does not grow with the dump size"""
+        import tracemalloc
+        from src.ct_ingest import CTIngestor
+
+        entries = [self.entry(i, f'site{i % 200}.avature.net') for i in range(40000)]
+        path = self.write_dump(entries)
+        size = os.path.getsize(path)
+        del entries
+
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in CTIngestor().from_file(path))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(count, 200)
+        self.assertGreater(size, 5_000_000)
+        self.assertLess(peak, size / 10)
+
+    def test_http_names_stream_before_download_ends(self):
+        """Test names reach the consumer while the response is still open"""
+        import json
+        from aiohttp import web
+        from src.ct_ingest import CTIngestor
+
+        first = json.dumps([self.entry(i, f'early{i}.avature.net') for i in range(3)])
+        rest = json.dumps([self.entry(i, f'late{i}.avature.net') for i in range(3)])
+        first_part = first[:-1] + ','
+        rest_part = rest[1:]
+
+        async def run():
+            name_seen = asyncio.Event()
+
+            async def handle(request):
+                response = web.StreamResponse()
+                await response.prepare(request)
+                await response.write(first_part.encode())
+                # Only finish once the client has used part of the data
+                await asyncio.wait_for(name_seen.wait(), timeout=5)
+                await response.write(rest_part.encode())
+                await response.write_eof()
+                return response
+
+            app = web.Application()
+            app.router.add_get('/', handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, '127.0.0.1', 0).start()
+            url = f'http://127.0.0.1:{runner.addresses[0][1]}/'
+            try:
+                names = []
+                async for name in CTIngestor().from_url(url):
+                    names.append(name)
+                    name_seen.set()
+                return names
+            finally:
+                await runner.cleanup()
+
+        names = asyncio.run(run())
+        self.assertEqual(names, ['early0', 'early1', 'early2', 'late0', 'late1', 'late2'])
+
+    def test_discovery_reads_dump(self):
+        """Test strategy B verifies the names of a saved CT dump"""
+        from src.discovery_store import DiscoveryStore
+        from src.enhanced_discovery import EnhancedDiscovery
+
+        class FakeEngine:
+            stats = {'nxdomain': 0, 'probed': 0, 'throttled': 0}
+
+            async def results(self, names):
+                async for name in names:
+                    yield TestDiscoveryStore.result(name, status=200)
+
+        path = self.write_dump([self.entry(i, f'site{i % 3}.avature.net') for i in range(10)])
+        store = DiscoveryStore(os.path.join(self.temp_dir.name, 'discovery.db'))
+        with patch('sys.stdout'):
+            discovery = EnhancedDiscovery(engine=FakeEngine(), store=store)
+            discovery.strategy_b_reverse_dns_sweep(ct_dump=path)
+        store.close()
+
+        self.assertEqual(sorted(discovery.discovered_sites),
+                         [f'https://site{i}.avature.net/careers' for i in range(3)])
+
+
 def run_phase3_tests():
     """Run all Phase 3 tests"""
     # Create test suite
@@ -491,6 +1921,16 @@ def run_phase3_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestAsyncPatterns))
     suite.addTests(loader.loadTestsFromTestCase(TestConcurrencyLimits))
     suite.addTests(loader.loadTestsFromTestCase(TestAsyncIntegrationWithDatabase))
+    suite.addTests(loader.loadTestsFromTestCase(TestAsyncJobWriter))
+    suite.addTests(loader.loadTestsFromTestCase(TestParseExecutor))
+    suite.addTests(loader.loadTestsFromTestCase(TestConditionalFetch))
+    suite.addTests(loader.loadTestsFromTestCase(TestPageFingerprints))
+    suite.addTests(loader.loadTestsFromTestCase(TestHostLimiter))
+    suite.addTests(loader.loadTestsFromTestCase(TestSlidingWindowPagination))
+    suite.addTests(loader.loadTestsFromTestCase(TestAsyncURLDetector))
+    suite.addTests(loader.loadTestsFromTestCase(TestAsyncDiscovery))
+    suite.addTests(loader.loadTestsFromTestCase(TestDiscoveryStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestCTIngest))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
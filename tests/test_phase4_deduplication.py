@@ -94,6 +94,110 @@ class TestTextNormalization(unittest.TestCase):
             # Check that abbreviation is handled
             self.assertIsNotNone(normalized)
 
+    def test_single_pass_matches_sequential_titles(self):
+        """Test one-scan abbreviation expansion keeps one-at-a-time results"""
+        cases = {
+            'Sr. SWE (ML/AI)': 'Senior Software Engineer (Machine Learning / Artificial Intelligence)',
+            'QA Eng. / Dev Ops': 'Quality Assurance Engineer / Developer Operations',
+            # An expanded 'Sr.' hides the next word from later entries only
+            'Sr.Eng': 'SeniorEng',
+            'Sr.Eng.Dev': 'SeniorEngDeveloper',
+            'Eng.Sr': 'EngineerSenior',
+        }
+        for title, expected in cases.items():
+            self.assertEqual(self.normalizer.normalize_title(title), expected)
+
+    def test_single_pass_matches_sequential_terms(self):
+        """Test combined seniority and location tables keep table order"""
+        # 'vice president' is removed before 'executive vice president' can match
+        self.assertEqual(self.normalizer.extract_key_terms('Executive Vice President'),
+                         {'executive'})
+        self.assertEqual(self.normalizer.extract_key_terms('Senior Manager, Entry Level'),
+                         {'level'})
+        self.assertEqual(self.normalizer.normalize_location('chi-town, IL'),
+                         'Chicago-town, Illinois')
+        self.assertEqual(self.normalizer.normalize_location('NYC,  NY'), 'New York, New York')
+
+
+class TestNormalizerCache(unittest.TestCase):
+    """Test the normalizer's LRU result caches and persistent store"""
+
+    def test_repeats_are_cache_hits(self):
+        """Test repeated inputs are served from the cache with equal results"""
+        normalizer = TextNormalizer()
+        uncached = TextNormalizer(cache_size=0)
+
+        for _ in range(3):
+            self.assertEqual(normalizer.normalize_title('Sr. SWE'),
+                             uncached.normalize_title('Sr. SWE'))
+        terms = normalizer.extract_key_terms('Sr. Data Engineer')
+        terms.add('mutated')
+
+        info = normalizer.cache_info()
+        self.assertEqual((info['title']['hits'], info['title']['misses']), (2, 2))
+        self.assertEqual(normalizer.extract_key_terms('Sr. Data Engineer'), {'data', 'engineer'})
+        self.assertEqual(uncached.cache_info(), {})
+
+    def test_cache_is_bounded(self):
+        """Test the least recently used entry is evicted when full"""
+        normalizer = TextNormalizer(cache_size=2)
+        normalizer.normalize_location('NYC')
+        normalizer.normalize_location('SF')
+        normalizer.normalize_location('NYC')
+        normalizer.normalize_location('LA')
+
+        self.assertEqual(normalizer.cache_info()['location']['size'], 2)
+        self.assertEqual(list(normalizer._caches['location'].data), ['NYC', 'LA'])
+
+    def test_store_shared_across_runs(self):
+        """Test flushed results seed the caches of a later normalizer"""
+        import tempfile
+        from src.normalization_store import NormalizationStore
+        from src import normalizer as normalizer_module
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = NormalizationStore(os.path.join(tmpdir, 'normalizations.db'))
+            first = TextNormalizer(store=store)
+            first.extract_key_terms('Senior Data Engineer')
+            first.extract_seniority_level('Senior Data Engineer')
+            self.assertEqual(first.flush(), 3)
+
+            second = TextNormalizer(store=store)
+            self.assertEqual(second.extract_key_terms('Senior Data Engineer'), {'data', 'engineer'})
+            self.assertEqual(second.extract_seniority_level('Senior Data Engineer'), 5)
+            info = second.cache_info()
+            self.assertEqual((info['key_terms']['misses'], info['seniority']['misses']), (0, 0))
+
+            # Results stored by other normalization rules are not used
+            version = normalizer_module.NORMALIZER_VERSION
+            normalizer_module.NORMALIZER_VERSION = version + 1
+            try:
+                third = TextNormalizer(store=store)
+            finally:
+                normalizer_module.NORMALIZER_VERSION = version
+            self.assertEqual(third.cache_info()['key_terms']['size'], 0)
+            store.close()
+
+    def test_store_keeps_recency_order(self):
+        """Test the LRU order survives a flush and reload, and trims by it"""
+        import tempfile
+        from src.normalization_store import NormalizationStore
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = NormalizationStore(os.path.join(tmpdir, 'normalizations.db'))
+            first = TextNormalizer(store=store)
+            for location in ('NYC', 'SF', 'LA', 'NYC'):
+                first.normalize_location(location)
+            first.flush()
+
+            second = TextNormalizer(store=store)
+            self.assertEqual(list(second._caches['location'].data), ['SF', 'LA', 'NYC'])
+
+            # A smaller normalizer keeps the most recently used entries
+            second.normalize_location('SF')
+            second.flush()
+            third = TextNormalizer(cache_size=2, store=store)
+            self.assertEqual(list(third._caches['location'].data), ['NYC', 'SF'])
+            store.close()
+
 
 class TestLocationNormalization(unittest.TestCase):
     """Test location normalization"""
@@ -624,6 +728,452 @@ class TestPerformance(unittest.TestCase):
         self.assertLess(comparisons_with_scoping, comparisons_without_scoping)
 
 
+class TestCandidateBlocking(unittest.TestCase):
+    """Test that blocking scores fewer pairs without losing duplicates"""
+
+    @staticmethod
+    def corpus(count=240, seed=7):
+        """Jobs with re-posted variants (abbreviations, typos, suffixes)"""
+        import random
+        rng = random.Random(seed)
+        roles = ['Software Engineer', 'Data Scientist', 'Registered Nurse',
+                 'Product Manager', 'QA Analyst', 'Store Manager', 'Dispatcher',
+                 'Machine Learning Engineer', 'Financial Analyst', 'Recruiter']
+        teams = ['Payments', 'Search', 'Oncology', 'Fresh Food', 'Risk', 'Mobile']
+        cities = [['New York, NY', 'NYC', 'New York'], ['Seattle, WA', 'Seattle, Washington'],
+                  ['Remote', 'Work from Home'], ['London', 'London, UK']]
+
+        jobs, originals = [], []
+        for n in range(count):
+            if originals and rng.random() < 0.35:
+                title, city = rng.choice(originals)
+                variant = rng.randrange(4)
+                if variant == 0:
+                    title = title.replace('Senior ', 'Sr. ')
+                elif variant == 1:
+                    title = title.replace(' - ', ', ')
+                elif variant == 2:
+                    i = rng.randrange(1, len(title) - 1)
+                    title = title[:i] + title[i + 1:]
+                else:
+                    title += ' II'
+                location = rng.choice(cities[city])
+            else:
+                title = f"{rng.choice(['', 'Senior '])}{rng.choice(roles)} - {rng.choice(teams)}"
+                city = rng.randrange(len(cities))
+                location = cities[city][0]
+                originals.append((title, city))
+            jobs.append({'url': f'https://acme.avature.net/careers/JobDetail/{n}',
+                         'title': title, 'location': location,
+                         'company': rng.choice(['acme', 'Acme Inc.'])})
+        return jobs
+
+    def test_blocked_matches_exhaustive(self):
+        """Test blocking finds exactly the exhaustive duplicate groups"""
+        jobs = self.corpus()
+
+        exhaustive = JobDeduplicator(blocking=False)
+        blocked = JobDeduplicator()
+        expected = exhaustive.find_duplicates(jobs)
+        result = blocked.find_duplicates(jobs)
+
+        self.assertGreater(len(expected), 10)
+        self.assertEqual(result, expected)
+        self.assertLess(blocked.stats['pairs_scored'],
+                        exhaustive.stats['pairs_scored'] / 10)
+
+    def test_reordered_key_terms_are_candidates(self):
+        """Test the key-term prefix keeps the Jaccard branch lossless"""
+        jobs = [
+            {'url': '1', 'title': 'Cloud Platform Data Analyst', 'location': 'Austin', 'company': 'acme'},
+            {'url': '2', 'title': 'Analyst Data Platform Cloud', 'location': 'Austin', 'company': 'acme'},
+            {'url': '3', 'title': 'Store Manager', 'location': 'Austin', 'company': 'acme'},
+        ]
+        dedup = JobDeduplicator()
+
+        duplicates = dedup.find_duplicates(jobs)
+
+        self.assertEqual([job['url'] for job in duplicates['1']], ['1', '2'])
+        self.assertEqual(dedup.stats['pairs_scored'], 1)
+
+    def test_incompatible_locations_not_scored(self):
+        """Test pairs whose locations can never match are pruned"""
+        from src.dedup_blocking import CandidateIndex
+
+        dedup = JobDeduplicator()
+        jobs = [{'title': 'Software Engineer', 'location': location, 'company': 'acme'}
+                for location in ('NYC', 'New York', 'London', 'Remote', 'WFH', '')]
+        features = [dedup.extract_features(job) for job in jobs]
+        index = dedup._candidate_index(features)
+
+        self.assertEqual(index.candidates(0), [1])
+        self.assertEqual(index.candidates(2), [])
+        self.assertEqual(index.candidates(3), [4])
+        self.assertEqual(index.candidates(5), [])
+
+
+class TestFeatureCache(unittest.TestCase):
+    """Test job features are computed once and reused across runs"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        import tempfile
+        from src.database import JobDatabase
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db = JobDatabase(self.temp_db.name)
+        self.jobs = TestCandidateBlocking.corpus(count=60)
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        os.unlink(self.temp_db.name)
+
+    def test_features_reused_across_instances(self):
+        """Test a second run reads every job's features from the database"""
+        first = JobDeduplicator(db=self.db)
+        expected = first.find_duplicates(self.jobs)
+
+        second = JobDeduplicator(db=self.db)
+        result = second.find_duplicates(self.jobs)
+
+        # Identical postings share one computation
+        unique = len({JobDeduplicator.content_hash(job) for job in self.jobs})
+        self.assertEqual(first.stats['features_computed'], unique)
+        self.assertEqual(second.stats['features_cached'], unique)
+        self.assertEqual(second.stats['features_computed'], 0)
+        self.assertEqual(result, expected)
+        self.assertEqual(result, JobDeduplicator().find_duplicates(self.jobs))
+
+    def test_cached_features_match_extracted(self):
+        """Test features loaded from the database equal freshly extracted ones"""
+        JobDeduplicator(db=self.db).features_for(self.jobs)
+        dedup = JobDeduplicator(db=self.db)
+
+        cached = dedup.features_for(self.jobs)
+
+        self.assertEqual(cached, [dedup.extract_features(job) for job in self.jobs])
+
+    def test_changed_job_recomputed(self):
+        """Test a new title invalidates the stored features for that URL"""
+        JobDeduplicator(db=self.db).features_for(self.jobs)
+        changed = dict(self.jobs[0], title='Senior Pharmacist')
+        dedup = JobDeduplicator(db=self.db)
+
+        features = dedup.features_for([changed] + self.jobs[1:])
+
+        self.assertEqual(dedup.stats['features_computed'], 1)
+        self.assertEqual(features[0].title, 'Senior Pharmacist')
+        self.assertEqual(features[0].seniority, 5)
+
+    def test_jobs_without_url_not_stored(self):
+        """Test jobs without a URL are normalized but not cached"""
+        dedup = JobDeduplicator(db=self.db)
+
+        dedup.features_for([{'title': 'Engineer', 'location': 'NY', 'company': 'acme'}])
+
+        self.assertEqual(dedup.stats['features_computed'], 1)
+        self.assertEqual(self.db.get_job_features(['']), {})
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test the batched scorer gives the same scores as score_features"""
+
+    def setUp(self):
+        """Jobs from two companies, with empty fields and remote locations"""
+        self.dedup = JobDeduplicator()
+        jobs = TestCandidateBlocking.corpus(count=100, seed=3)
+        jobs += [
+            {'url': 'x1', 'title': '', 'location': 'Remote', 'company': 'acme'},
+            {'url': 'x2', 'title': 'Software Engineer', 'location': '', 'company': 'acme'},
+            {'url': 'x3', 'title': 'Software Engineer', 'location': 'WFH', 'company': 'acme'},
+            {'url': 'x4', 'title': 'Software Engineer', 'location': 'Remote', 'company': 'globex'},
+        ]
+        self.features = self.dedup.features_for(jobs)
+        self.pairs = [(i, j) for i in range(len(jobs)) for j in range(len(jobs)) if i != j]
+
+    def test_scores_match_score_features(self):
+        """Test every score field and decision equals the pairwise kernel"""
+        from src.dedup_scoring import BatchScorer, SCORE_FIELDS
+        scorer = BatchScorer(self.dedup, self.features)
+
+        scores = scorer.score([i for i, _ in self.pairs], [j for _, j in self.pairs])
+
+        for k, (i, j) in enumerate(self.pairs):
+            is_dup, _, details = self.dedup.score_features(self.features[i], self.features[j])
+            self.assertEqual(bool(scores['is_duplicate'][k]), is_dup)
+            for field in SCORE_FIELDS:
+                self.assertEqual(scores[field][k], details.get(field, 0.0), (i, j, field))
+
+    def test_pruning_keeps_decisions(self):
+        """Test pruned scoring finds the same duplicates and skips most titles"""
+        import math
+        from src.dedup_scoring import BatchScorer
+        scorer = BatchScorer(self.dedup, self.features)
+        left, right = [i for i, _ in self.pairs], [j for _, j in self.pairs]
+
+        full = scorer.score(left, right)
+        pruned = scorer.score(left, right, prune=True)
+
+        self.assertEqual(pruned['is_duplicate'].tolist(), full['is_duplicate'].tolist())
+        kept = [k for k, value in enumerate(pruned['title_similarity']) if not math.isnan(value)]
+        self.assertLess(len(kept), len(self.pairs) / 2)
+        for k in kept:
+            self.assertEqual(pruned['combined_score'][k], full['combined_score'][k])
+
+    def test_vectorized_matches_scalar(self):
+        """Test find_duplicates gives identical groups and scores either way"""
+        jobs = TestCandidateBlocking.corpus()
+        for blocking in (True, False):
+            with self.subTest(blocking=blocking):
+                scalar = JobDeduplicator(blocking=blocking, vectorized=False)
+                batched = JobDeduplicator(blocking=blocking, batch_size=500)
+
+                self.assertEqual(batched.find_duplicates(jobs), scalar.find_duplicates(jobs))
+
+
+class TestDuplicateClustering(unittest.TestCase):
+    """Test union-find clustering and deterministic canonicals"""
+
+    def setUp(self):
+        """A chain: A~B and B~C, but A and C are too different"""
+        self.deduplicator = JobDeduplicator()
+        self.chain = [
+            {'url': 'a', 'title': 'Senior Data Analyst', 'location': 'NYC',
+             'company': 'acme', 'first_seen': '2026-01-03T00:00:00'},
+            {'url': 'c', 'title': 'Senior Data Analyst Risk Team', 'location': 'NYC',
+             'company': 'acme', 'first_seen': '2026-01-01T00:00:00'},
+            {'url': 'b', 'title': 'Senior Data Analyst Risk', 'location': 'NYC',
+             'company': 'acme', 'first_seen': '2026-01-02T00:00:00'},
+        ]
+
+    def test_union_find(self):
+        """Test sets merge transitively and report only real groups"""
+        from src.dedup_clustering import UnionFind
+        sets = UnionFind(5)
+
+        self.assertTrue(sets.union(0, 3))
+        self.assertTrue(sets.union(3, 4))
+        self.assertFalse(sets.union(0, 4))
+
+        self.assertEqual(sets.groups(), [[0, 3, 4]])
+
+    def test_chain_forms_one_cluster(self):
+        """Test a chain of near matches is one cluster in any input order"""
+        import itertools
+        self.assertFalse(self.deduplicator.are_jobs_similar(self.chain[0], self.chain[1])[0])
+
+        for order in itertools.permutations(self.chain):
+            with self.subTest(order=[job['url'] for job in order]):
+                clusters = self.deduplicator.cluster_duplicates(list(order))
+                self.assertEqual(list(clusters), ['c'])
+                self.assertEqual([job['url'] for job in clusters['c']], ['c', 'b', 'a'])
+
+    def test_find_and_deduplicate_agree_with_clusters(self):
+        """Test find_duplicates and deduplicate_jobs use the same clusters"""
+        import itertools
+        for order in itertools.permutations(self.chain):
+            with self.subTest(order=[job['url'] for job in order]):
+                jobs = list(order)
+                found = self.deduplicator.find_duplicates(jobs)
+                clusters = self.deduplicator.cluster_duplicates(jobs)
+
+                # Same groups and scores, plus the details of each best pair
+                details = [job.pop('_similarity_details')
+                           for group in found.values() for job in group[1:]]
+                self.assertEqual(found, clusters)
+                scores = [job['_similarity_score'] for job in clusters['c'][1:]]
+                self.assertEqual([d['combined_score'] for d in details], scores)
+                self.assertTrue(all('title1' in d and 'location_score' in d for d in details))
+
+                unique, removed = self.deduplicator.deduplicate_jobs(jobs)
+                self.assertEqual([job['url'] for job in unique], ['c'])
+                self.assertEqual(sorted(job['url'] for job in removed), ['a', 'b'])
+
+    def test_canonical_without_first_seen(self):
+        """Test undated jobs lose to dated ones and ties go to the URL"""
+        from src.dedup_clustering import canonical_order
+        jobs = [{'url': 'z', 'first_seen': '2026-02-01'}, {'url': 'y'}, {'url': 'x'},
+                {'url': 'w', 'first_seen': '2026-02-01'}]
+
+        self.assertEqual([job['url'] for job in sorted(jobs, key=canonical_order)],
+                         ['w', 'z', 'x', 'y'])
+
+    def test_vectorized_matches_scalar(self):
+        """Test both scoring paths give identical clusters and scores"""
+        jobs = TestCandidateBlocking.corpus()
+        scalar = JobDeduplicator(vectorized=False).cluster_duplicates(jobs)
+        batched = JobDeduplicator(batch_size=300).cluster_duplicates(jobs)
+
+        self.assertEqual(batched, scalar)
+        self.assertGreater(len(scalar), 10)
+
+
+class TestClusterIndex(unittest.TestCase):
+    """Test incremental deduplication against the persisted cluster index"""
+
+    def setUp(self):
+        """Create temporary database for testing"""
+        import tempfile
+        from src.database import JobDatabase
+        from src.dedup_index import ClusterIndex
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db = JobDatabase(self.temp_db.name)
+        self.index = ClusterIndex(self.db, JobDeduplicator(db=self.db))
+        self.jobs = TestCandidateBlocking.corpus()
+
+    def tearDown(self):
+        """Clean up temporary database"""
+        self.db.close()
+        os.unlink(self.temp_db.name)
+
+    def test_incremental_matches_full_run(self):
+        """Test adding jobs in two runs gives the groups of one full run"""
+        full = JobDeduplicator()
+        expected = full.cluster_duplicates(self.jobs)
+
+        self.index.update(self.jobs[:200])
+        stats = self.index.update(self.jobs)
+
+        self.assertEqual(stats['new'], 40)
+        self.assertLess(stats['pairs_scored'], full.stats['pairs_scored'] / 2)
+        self.assertEqual(self.index.duplicates(self.jobs), expected)
+
+    def test_unchanged_run_scores_nothing(self):
+        """Test a run without new or changed jobs does no scoring"""
+        from src.dedup_index import ClusterIndex
+        self.index.update(self.jobs)
+
+        index = ClusterIndex(self.db, JobDeduplicator(db=self.db))
+        stats = index.update(self.jobs)
+
+        self.assertEqual((stats['new'], stats['changed'], stats['pairs_scored']), (0, 0, 0))
+        self.assertEqual(index.duplicates(self.jobs), self.index.duplicates(self.jobs))
+
+    def test_changed_job_moves_cluster(self):
+        """Test an edited duplicate leaves its cluster"""
+        self.index.update(self.jobs)
+        canonical, group = next(iter(self.index.duplicates(self.jobs).items()))
+        url = group[1]['url']
+        jobs = [dict(job, title='Chief Pharmacist') if job['url'] == url else job
+                for job in self.jobs]
+
+        stats = self.index.update(jobs)
+
+        self.assertEqual(stats['changed'], 1)
+        self.assertNotEqual(self.index.cluster_of(url)['canonical_url'], canonical)
+
+    def test_removed_canonical_regroups(self):
+        """Test the rest of a cluster is placed again when its canonical goes"""
+        jobs = [
+            {'url': 'a', 'title': 'Senior Software Engineer', 'location': 'NYC', 'company': 'acme'},
+            {'url': 'b', 'title': 'Sr. Software Engineer', 'location': 'New York', 'company': 'acme'},
+            {'url': 'c', 'title': 'Senior Software Engineer', 'location': 'New York', 'company': 'acme'},
+        ]
+        self.index.update(jobs)
+        self.assertEqual(self.index.cluster_of('c')['canonical_url'], 'a')
+
+        stats = self.index.update(jobs[1:])
+
+        self.assertEqual((stats['removed'], stats['replaced']), (1, 2))
+        self.assertIsNone(self.index.cluster_of('a'))
+        self.assertEqual(self.index.cluster_of('c')['canonical_url'], 'b')
+
+    def test_earlier_job_becomes_canonical(self):
+        """Test a new job seen earlier than a cluster's canonical takes over"""
+        jobs = [{'url': url, 'title': title, 'location': 'NYC', 'company': 'acme',
+                 'first_seen': f'2026-01-0{n}'}
+                for n, (url, title) in enumerate([('a', 'Senior Data Analyst'),
+                                                  ('b', 'Senior Data Analyst Risk'),
+                                                  ('c', 'Senior Data Analyst Risk Team')], 1)]
+        self.index.update(jobs[:2])
+        self.assertEqual(self.index.duplicate_map(), {'b': 'a'})
+
+        self.index.update(jobs + [{'url': 'd', 'title': 'Senior Data Analyst Risk',
+                                   'location': 'NYC', 'company': 'acme',
+                                   'first_seen': '2025-12-31'}])
+
+        self.assertEqual(self.index.duplicate_map(), {'a': 'd', 'b': 'd', 'c': 'd'})
+
+
+class TestParallelDeduplication(unittest.TestCase):
+    """Test process-pool clustering across companies"""
+
+    def setUp(self):
+        """Corpus spread unevenly over three companies"""
+        self.jobs = [dict(job, company=f'acme{min(n % 6, 2)}')
+                     for n, job in enumerate(TestCandidateBlocking.corpus())]
+
+    def test_process_pool_matches_serial(self):
+        """Test the pool gives the serial clusters, with companies split into blocks"""
+        from src.parallel_dedup import ParallelDeduplicator
+        serial = JobDeduplicator()
+        expected = serial.cluster_duplicates(self.jobs)
+
+        runner = ParallelDeduplicator(max_workers=2, block_size=30)
+        try:
+            clusters = runner.cluster_duplicates(self.jobs)
+        finally:
+            runner.close()
+
+        self.assertEqual(clusters, expected)
+        self.assertGreater(runner.stats['tasks'], 3)
+        self.assertEqual(runner.stats['largest_task'], 30)
+        self.assertEqual(runner.stats['pairs_total'], serial.stats['pairs_total'])
+        self.assertEqual(runner.stats['pairs_scored'], serial.stats['pairs_scored'])
+
+    def test_tasks_carry_block_and_partners(self):
+        """Test a task ships its block and the jobs sharing a key, not the company"""
+        from collections import Counter
+        from unittest import mock
+        from src import parallel_dedup
+        shipped = []
+
+        def record(settings, features, keys, rows):
+            shipped.append((features, keys, rows))
+            return score_block(settings, features, keys, rows)
+
+        score_block = parallel_dedup.score_block
+        runner = parallel_dedup.ParallelDeduplicator(max_workers=1, block_size=10)
+        with mock.patch.object(parallel_dedup, 'score_block', record):
+            clusters = runner.cluster_duplicates(self.jobs)
+
+        self.assertEqual(clusters, JobDeduplicator().cluster_duplicates(self.jobs))
+        largest = max(Counter(job['company'] for job in self.jobs).values())
+        self.assertLess(max(len(features) for features, _, _ in shipped), largest)
+
+    def test_exhaustive_blocks_match_serial(self):
+        """Test row blocks cover every pair when blocking is off"""
+        from src.parallel_dedup import ParallelDeduplicator
+        serial = JobDeduplicator(blocking=False)
+        expected = serial.cluster_duplicates(self.jobs)
+
+        runner = ParallelDeduplicator(JobDeduplicator(blocking=False), max_workers=1,
+                                      block_size=25)
+        self.assertEqual(runner.cluster_duplicates(self.jobs), expected)
+        self.assertEqual(runner.stats['pairs_scored'], serial.stats['pairs_scored'])
+
+    def test_largest_tasks_first(self):
+        """Test tasks are scheduled by decreasing size"""
+        from unittest import mock
+        from src import parallel_dedup
+        sizes = []
+
+        def record(settings, features, keys, rows):
+            # Without blocking a task holds its block and every later job
+            sizes.append(runner._cost(len(features), 0, rows))
+            return [], {'pairs_scored': 0}
+
+        runner = parallel_dedup.ParallelDeduplicator(JobDeduplicator(blocking=False),
+                                                     max_workers=1, block_size=40)
+        with mock.patch.object(parallel_dedup, 'score_block', record):
+            runner.cluster_duplicates(self.jobs)
+
+        self.assertGreater(len(sizes), 3)
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+
+
 def run_phase4_tests():
     """Run all Phase 4 tests"""
     # Create test suite
@@ -632,6 +1182,7 @@ def run_phase4_tests():
 
     # Add all test classes
     suite.addTests(loader.loadTestsFromTestCase(TestTextNormalization))
+    suite.addTests(loader.loadTestsFromTestCase(TestNormalizerCache))
     suite.addTests(loader.loadTestsFromTestCase(TestLocationNormalization))
     suite.addTests(loader.loadTestsFromTestCase(TestSimilarityAlgorithms))
     suite.addTests(loader.loadTestsFromTestCase(TestDuplicateDetection))
@@ -641,6 +1192,12 @@ def run_phase4_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestDeduplicationReport))
     suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
     suite.addTests(loader.loadTestsFromTestCase(TestPerformance))
+    suite.addTests(loader.loadTestsFromTestCase(TestCandidateBlocking))
+    suite.addTests(loader.loadTestsFromTestCase(TestFeatureCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchScoring))
+    suite.addTests(loader.loadTestsFromTestCase(TestDuplicateClustering))
+    suite.addTests(loader.loadTestsFromTestCase(TestClusterIndex))
+    suite.addTests(loader.loadTestsFromTestCase(TestParallelDeduplication))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)